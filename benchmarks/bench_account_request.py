@@ -0,0 +1,121 @@
+"""Micro-benchmark of the per-request CPU cost in Account.request.
+
+Compares the previous request-building code (headers rebuilt per call,
+list-sorted signing, stdlib JSON, DER key parsed per login) against the
+current Account implementation.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_account_request
+"""
+
+import base64
+import hashlib
+import json
+import time
+import timeit
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import padding
+
+from homeassistant.util.json import json_loads
+
+from custom_components.catlink.const import RSA_PUBLIC_KEY, SIGN_KEY
+from custom_components.catlink.modules.account import APP_HEADERS, Account
+
+LANGUAGE = "en_US"
+TOKEN = "0123456789abcdef0123456789abcdef"
+PARAMS = {"deviceId": "123456", "type": "NONE", "date": "2026-01-01"}
+PAYLOAD = json.dumps(
+    {
+        "returnCode": 0,
+        "data": {
+            "devices": [
+                {
+                    "id": f"{i}",
+                    "mac": f"AA:BB:CC:DD:EE:{i:02X}",
+                    "deviceName": f"Litter Box {i}",
+                    "deviceType": "SCOOPER",
+                    "model": "T-02",
+                    "online": True,
+                }
+                for i in range(20)
+            ]
+        },
+    }
+)
+
+
+def legacy_params_sign(pms: dict) -> str:
+    """Sign the params the way Account did before."""
+    lst = list(pms.items())
+    lst.sort()
+    pms = [f"{k}={v}" for k, v in lst]
+    pms.append(f"key={SIGN_KEY}")
+    pms = "&".join(pms)
+    return hashlib.md5(pms.encode()).hexdigest().upper()
+
+
+def legacy_build(config: dict, hass_data: dict) -> dict:
+    """Build request kwargs the way Account did before."""
+    language = config.get("language")
+    if language is None:
+        language = (hass_data.get("config") or {}).get("language", LANGUAGE)
+    kws = {
+        "timeout": 60,
+        "headers": {
+            "language": language,
+            "User-Agent": "CATLINK/4.1.5 (iPhone; iOS 26.2.1; Scale/3.00)",
+            "app_version": "4.1.5",
+            "system_version": "26.2.1",
+            "token": TOKEN,
+        },
+    }
+    pms = dict(PARAMS)
+    pms["noncestr"] = int(time.time() * 1000)
+    pms["token"] = TOKEN
+    pms["sign"] = legacy_params_sign(pms)
+    kws["params"] = pms
+    return kws
+
+
+def legacy_encrypt_password(pwd: str) -> str:
+    """Encrypt the password the way Account did before."""
+    md5 = hashlib.md5(pwd.encode()).hexdigest().lower()
+    sha = hashlib.sha1(md5.encode()).hexdigest().upper()
+    pub = serialization.load_der_public_key(
+        base64.b64decode(RSA_PUBLIC_KEY), default_backend()
+    )
+    return base64.b64encode(pub.encrypt(sha.encode(), padding.PKCS1v15())).decode()
+
+
+def bench(label: str, legacy, current, number: int) -> None:
+    """Time both variants and print per-call cost."""
+    old = min(timeit.repeat(legacy, number=number, repeat=5)) / number * 1e6
+    new = min(timeit.repeat(current, number=number, repeat=5)) / number * 1e6
+    print(f"{label:<18} legacy {old:8.2f} us   current {new:8.2f} us   x{old / new:.2f}")
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    account = object.__new__(Account)
+    account._headers = {"language": LANGUAGE, **APP_HEADERS}
+
+    bench(
+        "build + sign",
+        lambda: legacy_build({}, {"config": {}}),
+        lambda: account._build_request("GET", PARAMS, TOKEN),
+        20000,
+    )
+    bench("json decode", lambda: json.loads(PAYLOAD), lambda: json_loads(PAYLOAD), 20000)
+    bench(
+        "encrypt password",
+        lambda: legacy_encrypt_password("secret"),
+        lambda: Account.encrypt_password("secret"),
+        500,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Micro-benchmark of API payload parsing.
+
+Compares the previous parsing (pydantic validation into a model, then
+model_dump back into a dict) with parse_payload on real-shape payloads:
+a C08 detail carrying many undeclared fields, a feeder detail and a page
+of timeline logs. Both variants decode the JSON first, as parse_payload
+completes the decoded payload in place.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parse_payload
+"""
+
+import json
+import timeit
+
+from homeassistant.util.json import json_loads
+
+from custom_components.catlink.models.api.device import (
+    C08DeviceInfo,
+    FeederDeviceInfo,
+)
+from custom_components.catlink.models.api.logs import LogEntry
+from custom_components.catlink.models.api.parse import parse_payload, parse_response
+
+C08_DETAIL = {
+    "workStatus": "00",
+    "alarmStatus": "00",
+    "workModel": "00",
+    "temperature": "24.5",
+    "humidity": "40",
+    "weight": 4.61,
+    "keyLock": "00",
+    "safeTime": "3",
+    "catLitterPaveSecond": "30",
+    "catLitterWeight": 3,
+    "inductionTimes": 12,
+    "manualTimes": 3,
+    "deodorantCountdown": 20,
+    "litterCountdown": 14,
+    "online": True,
+    "firmwareVersion": "2.1.7",
+    "lastHeartBeatTimestamp": 1767225600000,
+    "deviceErrorList": [
+        {"errkey": f"E{i:02d}", "reId": i, "time": "08:00"} for i in range(4)
+    ],
+    "boxFullSensitivity": 2,
+    "quietTimes": "22:00-07:00",
+    "garbageStatus": "00",
+    "currentError": "",
+    "currentMessage": "",
+    "autoUpdatePetWeight": True,
+    "indicatorLight": "01",
+    "paneltone": "01",
+    "autoBurial": False,
+    "continuousCleaning": True,
+    "litterType": 2,
+    "kittenModel": False,
+    # Undeclared fields the cloud sends along
+    **{f"extraField{i}": f"value-{i}" for i in range(60)},
+    "atmosphereModel": {"enable": True, "color": [255, 128, 0]},
+}
+FEEDER_DETAIL = {
+    "workStatus": "00",
+    "foodOutStatus": "00",
+    "autoFillStatus": "01",
+    "indicatorLightStatus": "01",
+    "breathLightStatus": "00",
+    "powerSupplyStatus": "01",
+    "keyLockStatus": "00",
+    "weight": 120,
+    "online": True,
+    "firmwareVersion": "1.4.2",
+    **{f"extraField{i}": i for i in range(30)},
+}
+LOGS = [
+    {
+        "time": f"{h:02d}:{m:02d}",
+        "event": "Auto clean",
+        "firstSection": "Cat used",
+        "secondSection": "4.6 kg",
+        "errkey": "",
+        "type": 1,
+        "petId": "123",
+        "weight": 4.6,
+    }
+    for h in range(10)
+    for m in (0, 30)
+]
+PAYLOADS = {
+    "c08 detail": (json.dumps({"deviceInfo": C08_DETAIL}), "deviceInfo", C08DeviceInfo),
+    "feeder detail": (
+        json.dumps({"deviceInfo": FEEDER_DETAIL}),
+        "deviceInfo",
+        FeederDeviceInfo,
+    ),
+    "20 log records": (json.dumps({"records": LOGS}), "records", LogEntry),
+}
+
+
+def legacy_parse(payload: str, key: str, model) -> dict | list:
+    """Parse the way the devices did before."""
+    parsed = parse_response(json_loads(payload), key, model)
+    if isinstance(parsed, list):
+        return [p.model_dump(by_alias=True) for p in parsed]
+    return parsed.model_dump(by_alias=True)
+
+
+def current_parse(payload: str, key: str, model) -> dict | list:
+    """Parse with parse_payload."""
+    return parse_payload(json_loads(payload), key, model)
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    for label, (payload, key, model) in PAYLOADS.items():
+        assert legacy_parse(payload, key, model) == current_parse(payload, key, model)
+        number = 5000
+        old = min(
+            timeit.repeat(
+                lambda: legacy_parse(payload, key, model), number=number, repeat=5
+            )
+        )
+        new = min(
+            timeit.repeat(
+                lambda: current_parse(payload, key, model), number=number, repeat=5
+            )
+        )
+        old, new = old / number * 1e6, new / number * 1e6
+        print(
+            f"{label:<15} legacy {old:8.2f} us   current {new:8.2f} us   x{old / new:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
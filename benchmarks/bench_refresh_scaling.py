@@ -0,0 +1,184 @@
+"""End-to-end benchmark of a coordinator refresh against the fake CatLink API.
+
+Drives the real Account and DevicesCoordinator against benchmarks.fake_api,
+served from a separate process so that its work does not skew the numbers.
+For each fleet size it reports, for the first (cold: login, device creation,
+log registration) and a later full refresh (every device due):
+
+- wall time of the cycle
+- API requests sent during the cycle
+- CPU time spent in the integration's process
+- peak memory allocated during the cycle (tracemalloc)
+
+Run from the repository root:
+
+    python -m benchmarks.bench_refresh_scaling
+    python -m benchmarks.bench_refresh_scaling --sizes 10 100 --accounts 2 --latency 0.05
+"""
+
+import argparse
+import asyncio
+from contextlib import suppress
+import logging
+import multiprocessing
+import tempfile
+import time
+import tracemalloc
+
+from homeassistant.const import CONF_DEVICES, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import frame
+
+from benchmarks.fake_api import FakeCatlinkApi, account_phone
+from custom_components.catlink import async_setup
+from custom_components.catlink.const import (
+    CONF_API_BASE,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_PHONE,
+    CONF_PHONE_IAC,
+    CONF_REQUESTS_PER_SECOND,
+    DOMAIN,
+)
+from custom_components.catlink.modules.account import Account
+from custom_components.catlink.modules.devices_coordinator import DevicesCoordinator
+
+SIZES = (1, 10, 100, 1000)
+
+
+def _run_server(conn, accounts: int, devices: int, latency: float) -> None:
+    """Serve the fake API in a child process, sending its url back."""
+
+    async def _serve() -> None:
+        api = FakeCatlinkApi(accounts, devices, latency=latency)
+        conn.send(await api.start())
+        await asyncio.get_running_loop().run_in_executor(None, conn.recv)
+        await api.stop()
+
+    asyncio.run(_serve())
+
+
+class FakeApiProcess:
+    """Fake API server running in a child process."""
+
+    def __init__(self, accounts: int, devices: int, latency: float) -> None:
+        """Initialize the process."""
+        self._conn, child = multiprocessing.Pipe()
+        self._process = multiprocessing.get_context("spawn").Process(
+            target=_run_server,
+            args=(child, accounts, devices, latency),
+            daemon=True,
+        )
+
+    def __enter__(self) -> str:
+        """Start the server and return its url."""
+        self._process.start()
+        return self._conn.recv()
+
+    def __exit__(self, *exc) -> None:
+        """Stop the server."""
+        with suppress(OSError):
+            self._conn.send(None)
+        self._process.join(5)
+
+
+async def _cycle(coordinators: list[DevicesCoordinator]) -> dict:
+    """Refresh every coordinator once and measure it."""
+    accounts = [c.account for c in coordinators]
+    requests = sum(a.metrics.totals()["requests"] for a in accounts)
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    await asyncio.gather(*(c.async_refresh() for c in coordinators))
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    failed = [c.name for c in coordinators if not c.last_update_success]
+    if failed:
+        raise RuntimeError(f"Refresh failed for {failed}")
+    return {
+        "wall": wall,
+        "requests": sum(a.metrics.totals()["requests"] for a in accounts) - requests,
+        "cpu": cpu,
+        "peak": peak,
+    }
+
+
+async def run_case(url: str, accounts: int, rps: float, concurrency: int) -> list:
+    """Return the cold and warm cycle measurements for one fleet."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        frame.async_setup(hass)
+        await async_setup(hass, {})
+        hass.data[DOMAIN]["config"].update(
+            {
+                CONF_API_BASE: url,
+                CONF_REQUESTS_PER_SECOND: rps,
+                CONF_MAX_CONCURRENT_REQUESTS: concurrency,
+                CONF_DEVICES: [],
+            }
+        )
+        coordinators = []
+        for idx in range(accounts):
+            account = Account(
+                hass,
+                {
+                    CONF_PHONE_IAC: "86",
+                    CONF_PHONE: account_phone(idx),
+                    CONF_PASSWORD: "password",
+                },
+            )
+            coordinators.append(DevicesCoordinator(account, f"bench-{idx}"))
+        try:
+            cold = await _cycle(coordinators)
+            for coordinator in coordinators:
+                # Make every device due, as after a full poll interval
+                for key in list(coordinator.scheduler._next_due):
+                    coordinator.scheduler.forget(key)
+            warm = await _cycle(coordinators)
+        finally:
+            for coordinator in coordinators:
+                coordinator.logs_scheduler.async_stop()
+                coordinator.account.async_release()
+            await hass.async_stop(force=True)
+    return [cold, warm]
+
+
+def main() -> None:
+    """Run the benchmark for each fleet size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--accounts", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds")
+    parser.add_argument("--rps", type=float, default=1000.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.CRITICAL)
+
+    print(
+        f"{args.accounts} account(s), {args.latency * 1000:.0f} ms latency, "
+        f"{args.concurrency} concurrent / {args.rps:.0f} rps per account"
+    )
+    print(
+        f"{'devices':>8} {'cycle':>6} {'wall s':>8} {'requests':>9} "
+        f"{'cpu s':>7} {'cpu ms/dev':>10} {'peak MiB':>9}"
+    )
+    tracemalloc.start()
+    for size in args.sizes:
+        per_account = max(size // args.accounts, 1)
+        with FakeApiProcess(args.accounts, per_account, args.latency) as url:
+            results = asyncio.run(
+                run_case(url, args.accounts, args.rps, args.concurrency)
+            )
+        devices = per_account * args.accounts
+        for label, res in zip(("cold", "warm"), results, strict=True):
+            print(
+                f"{devices:>8} {label:>6} {res['wall']:>8.2f} {res['requests']:>9} "
+                f"{res['cpu']:>7.2f} {res['cpu'] / devices * 1000:>10.2f} "
+                f"{res['peak'] / 2**20:>9.1f}"
+            )
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
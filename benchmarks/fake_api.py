@@ -0,0 +1,259 @@
+"""Local stand-in for the CatLink cloud API.
+
+Serves the endpoints the integration polls (login, device list, per-type
+detail and logs, C08 extras, cat health) for a configurable number of
+accounts and devices, with injectable latency. Used by the end-to-end
+benchmarks; it is not shipped with the integration.
+
+Run a standalone server from the repository root:
+
+    python -m benchmarks.fake_api --accounts 2 --devices 50 --latency 0.05
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+import random
+
+from aiohttp import web
+
+ROUTE_PREFIX = "/api/"
+PHONE_PREFIX = "100000"
+DEVICE_TYPES = (
+    "SCOOPER",
+    "LITTER_BOX_599",
+    "C08",
+    "VISUAL_PRO_ULTRA",
+    "FEEDER",
+    "PUREPRO",
+)
+
+# Detail endpoint per device type, the other types answer token/device/info
+DETAIL_APIS = {
+    "LITTER_BOX_599": "token/litterbox/info",
+    "C08": "token/litterbox/info/c08",
+    "VISUAL_PRO_ULTRA": "token/visualScooper/briefInfo",
+    "FEEDER": "token/device/feeder/detail",
+    "PUREPRO": "token/device/purepro/detail",
+}
+LOG_APIS = {
+    "token/litterbox/stats/log/top5": "scooperLogTop5",
+    "token/device/scooper/stats/log/top5": "scooperLogTop5",
+    "token/device/feeder/stats/log/top5": "feederLogTop5",
+    "token/device/purepro/stats/log/top5": "pureLogTop5",
+    "token/litterbox/stats/log/timeline/v2": "records",
+}
+
+
+def account_phone(index: int) -> str:
+    """Return the phone number of the fake account at index."""
+    return f"{PHONE_PREFIX}{index:05d}"
+
+
+def _ok(data) -> web.Response:
+    """Return a successful API response."""
+    return web.json_response({"returnCode": 0, "data": data})
+
+
+class FakeCatlinkApi:
+    """aiohttp application mimicking the CatLink API for N accounts × M devices."""
+
+    def __init__(
+        self,
+        accounts: int = 1,
+        devices: int = 1,
+        cats: int = 1,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        types: tuple[str, ...] = DEVICE_TYPES,
+    ) -> None:
+        """Initialize the fake API and its device population."""
+        self.latency = latency
+        self.jitter = jitter
+        self.requests: Counter[str] = Counter()
+        self._tokens: dict[str, str] = {}
+        self._devices: dict[str, list[dict]] = {}
+        self._device_types: dict[str, str] = {}
+        self._cats: dict[str, list[dict]] = {}
+        for acc in range(accounts):
+            phone = account_phone(acc)
+            self._devices[phone] = []
+            for idx in range(devices):
+                did = f"{acc + 1}{idx:06d}"
+                typ = types[idx % len(types)]
+                self._device_types[did] = typ
+                self._devices[phone].append(
+                    {
+                        "id": did,
+                        "mac": f"AA:BB:{acc:02X}:{idx >> 16 & 255:02X}:"
+                        f"{idx >> 8 & 255:02X}:{idx & 255:02X}",
+                        "deviceName": f"{typ.title()} {acc}-{idx}",
+                        "deviceType": typ,
+                        "model": typ,
+                    }
+                )
+            self._cats[phone] = [
+                {"id": f"{acc + 1}{idx:04d}", "petName": f"Cat {acc}-{idx}"}
+                for idx in range(cats)
+            ]
+        self.app = web.Application()
+        self.app.router.add_route("*", "/api/{api:.*}", self._handle)
+        self.app.router.add_get("/_stats", self._handle_stats)
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the API base url."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}{ROUTE_PREFIX}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def reset(self) -> None:
+        """Forget the request counts."""
+        self.requests.clear()
+
+    async def _handle_stats(self, request: web.Request) -> web.Response:
+        """Return the request counts per endpoint."""
+        return web.json_response(dict(self.requests))
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """Dispatch an API call after the injected latency."""
+        api = request.match_info["api"]
+        self.requests[api] += 1
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + random.uniform(0, self.jitter))
+        pms = dict(request.query)
+        if request.method == "POST" and request.can_read_body:
+            pms.update(await request.post())
+        if api == "login/password":
+            return self._login(pms)
+        phone = self._tokens.get(pms.get("token") or request.headers.get("token"))
+        if phone is None:
+            return web.json_response({"returnCode": 1002, "msg": "Illegal token"})
+        return self._dispatch(api, phone, pms)
+
+    def _login(self, pms: dict) -> web.Response:
+        """Issue a token for a known account."""
+        phone = pms.get("mobile")
+        if phone not in self._devices:
+            return web.json_response({"returnCode": 1, "msg": "Unknown account"})
+        token = f"token-{phone}"
+        self._tokens[token] = phone
+        return _ok({"token": token})
+
+    def _dispatch(self, api: str, phone: str, pms: dict) -> web.Response:
+        """Answer an authenticated call."""
+        did = pms.get("deviceId", "")
+        if api == "token/device/union/list/sorted":
+            return _ok({"devices": self._devices[phone]})
+        if api == "token/pet/health/v3/cats":
+            return _ok({"cats": self._cats[phone]})
+        if api == "token/pet/health/v3/summarySimple":
+            return _ok({"petId": pms.get("petId"), "weight": 4.2, "toiletTimes": 3})
+        if api in LOG_APIS:
+            return _ok({LOG_APIS[api]: self._logs(did)})
+        if api == "token/device/info" or api in DETAIL_APIS.values():
+            return _ok({"deviceInfo": self._detail(did)})
+        if api.startswith("token/litterbox/"):
+            return _ok(self._c08_extra(api))
+        return _ok({})
+
+    def _detail(self, did: str) -> dict:
+        """Return the detail of a device."""
+        typ = self._device_types.get(did, "SCOOPER")
+        detail = {
+            "workStatus": "00",
+            "alarmStatus": "00",
+            "workModel": "00",
+            "weight": 4.6,
+            "catLitterWeight": round(3.0 + random.random(), 2),
+            "inductionTimes": 12,
+            "manualTimes": 3,
+            "deodorantCountdown": 20,
+            "litterCountdown": 14,
+            "online": True,
+            "firmwareVersion": "1.0.0",
+            "keyLock": "00",
+            "safeTime": "3",
+        }
+        if typ == "FEEDER":
+            detail.update({"foodOutStatus": "00", "autoFillStatus": "00"})
+        elif typ == "PUREPRO":
+            detail.update({"runMode": "CONTINUOUS_SPRING", "pureStatus": "00"})
+        elif typ in ("C08", "LITTER_BOX_599"):
+            detail.update({"currentError": "", "boxFullSensitivity": 2})
+        return detail
+
+    @staticmethod
+    def _logs(did: str) -> list[dict]:
+        """Return the latest logs of a device."""
+        return [
+            {
+                "time": f"0{idx}:00",
+                "event": "Auto clean",
+                "firstSection": did,
+                "secondSection": "",
+            }
+            for idx in range(5)
+        ]
+
+    @staticmethod
+    def _c08_extra(api: str):
+        """Return the payload of a C08 supplemental endpoint."""
+        if api.endswith("stats/data/compare/v2"):
+            return {"compareData": {"times": 4, "weightAvg": 4.5, "durationAvg": 60}}
+        if api.endswith(("stats/cats", "cat/listSelectable")):
+            return {"cats": [{"petId": "1", "petName": "Cat"}]}
+        if api.endswith("linkedPets"):
+            return [{"petId": "1", "petName": "Cat"}]
+        if api.endswith("wifi/info"):
+            return {"wifiInfo": {"ssid": "catlink", "rssi": -50}}
+        if api.endswith("noticeConfig/list/c08"):
+            return {"noticeConfigs": [{"noticeItem": "LITTER_FULL", "noticeSwitch": True}]}
+        if api.endswith("aboutDevice"):
+            return {"info": {"firmwareVersion": "1.0.0"}}
+        return {}
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    """Serve until cancelled."""
+    api = FakeCatlinkApi(
+        args.accounts, args.devices, args.cats, args.latency, args.jitter
+    )
+    url = await api.start(args.host, args.port)
+    print(f"Fake CatLink API on {url}")
+    print(f"Accounts: {', '.join(account_phone(i) for i in range(args.accounts))}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await api.stop()
+
+
+def main() -> None:
+    """Run a standalone fake API server."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--accounts", type=int, default=1)
+    parser.add_argument("--devices", type=int, default=10, help="per account")
+    parser.add_argument("--cats", type=int, default=1, help="per account")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
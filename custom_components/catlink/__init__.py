@@ -8,12 +8,16 @@ from homeassistant.helpers import config_validation as cv
 from .const import (
     _LOGGER,
     CONF_ACCOUNTS,
+    CONF_API_BASE,
     CONF_DEVICE_IDS,
+    DEFAULT_API_BASE,
     DOMAIN,
     SUPPORTED_DOMAINS,
 )
 from .modules.account import Account
 from .modules.devices_coordinator import DevicesCoordinator
+from .modules.http_pool import async_get_http_pool
+from .services import async_setup_services
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
@@ -27,6 +31,7 @@ async def async_setup(hass: HomeAssistant, hass_config: dict) -> bool:
     hass.data[DOMAIN].setdefault("add_entities", {})
     hass.data[DOMAIN].setdefault("config", {})
     hass.data[DOMAIN].setdefault("entry_coordinators", {})
+    async_setup_services(hass)
     return True
 
 
@@ -40,18 +45,50 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     device_ids = entry.options.get(CONF_DEVICE_IDS) if entry.options else None
     coordinator = DevicesCoordinator(acc, entry.entry_id, device_ids=device_ids)
 
-    await acc.async_check_auth()
-    await coordinator.async_refresh()
+    entry.async_on_unload(acc.async_release)
+    entry.async_create_background_task(
+        hass,
+        async_get_http_pool(hass).async_warm_up(
+            config.get(CONF_API_BASE) or DEFAULT_API_BASE
+        ),
+        f"{DOMAIN}_warm_up_{entry.entry_id}",
+    )
+    entry.async_on_unload(coordinator.logs_scheduler.async_stop)
+    entry.async_on_unload(coordinator.weight_history.async_save)
+    entry.async_on_unload(coordinator.demand.async_setup())
+    if await coordinator.async_restore_snapshot():
+        # Entities start from the snapshot while the cloud catches up
+        entry.async_create_background_task(
+            hass,
+            _async_first_refresh(acc, coordinator),
+            f"{DOMAIN}_first_refresh_{entry.entry_id}",
+        )
+    else:
+        await _async_first_refresh(acc, coordinator)
 
     hass.data[DOMAIN][CONF_ACCOUNTS][acc.uid] = acc
     hass.data[DOMAIN]["coordinators"][coordinator.name] = coordinator
     hass.data[DOMAIN]["entry_coordinators"][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, SUPPORTED_DOMAINS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running coordinator."""
+    coordinator = hass.data[DOMAIN]["entry_coordinators"].get(entry.entry_id)
+    if coordinator is not None:
+        await coordinator.async_update_options(dict(entry.options))
+
+
+async def _async_first_refresh(acc: Account, coordinator: DevicesCoordinator) -> None:
+    """Authenticate the account and fetch its devices."""
+    await acc.async_check_auth()
+    await coordinator.async_refresh()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     await hass.config_entries.async_unload_platforms(entry, SUPPORTED_DOMAINS)
@@ -62,8 +99,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator_name = f"{DOMAIN}-{uid}-{CONF_DEVICES}"
     if coordinator_name in hass.data[DOMAIN]["coordinators"]:
         del hass.data[DOMAIN]["coordinators"][coordinator_name]
-    if entry.entry_id in hass.data[DOMAIN]["entry_coordinators"]:
-        del hass.data[DOMAIN]["entry_coordinators"][entry.entry_id]
+    coordinator = hass.data[DOMAIN]["entry_coordinators"].pop(entry.entry_id, None)
+    if coordinator is not None:
+        coordinator.async_cancel_stragglers()
+        await coordinator.snapshot.async_save()
+        # Devices hold the coordinator; a reload restores fresh ones
+        for dvc in coordinator.entry_devices():
+            hass.data[DOMAIN][CONF_DEVICES].pop(dvc.id, None)
     if entry.entry_id in hass.data[DOMAIN].get("add_entities", {}):
         del hass.data[DOMAIN]["add_entities"][entry.entry_id]
 
@@ -12,12 +12,13 @@ from homeassistant.config_entries import (
     SOURCE_REAUTH,
     ConfigFlow,
     ConfigFlowResult,
-    OptionsFlowWithReload,
+    OptionsFlow,
 )
 from homeassistant.const import CONF_PASSWORD
 from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.selector import (
+    BooleanSelector,
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
@@ -26,10 +27,19 @@ from homeassistant.helpers.selector import (
 from .const import (
     API_SERVERS,
     CONF_API_BASE,
+    CONF_CHANGE_DETECTION,
     CONF_DEVICE_IDS,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_DETAIL_STALENESS,
     CONF_PHONE,
     CONF_PHONE_IAC,
+    CONF_REFRESH_DEADLINE,
+    CONF_REQUESTS_PER_SECOND,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_DETAIL_STALENESS,
+    DEFAULT_REFRESH_DEADLINE,
+    DEFAULT_REQUESTS_PER_SECOND,
     DOMAIN,
     ERROR_INVALID_AUTH,
     SUPPORTED_DEVICE_TYPES,
@@ -100,17 +110,20 @@ class CatlinkConfigFlow(ConfigFlow, domain=DOMAIN):
                     CONF_PASSWORD: password,
                 }
                 account = Account(self.hass, config)
-                await account.async_check_auth()
+                try:
+                    await account.async_check_auth()
 
-                self._account = account
-                self._config = config
+                    self._account = account
+                    self._config = config
 
-                if self.source == SOURCE_REAUTH:
-                    return self.async_update_reload_and_abort(
-                        self._get_reauth_entry(), data=self._config
-                    )
+                    if self.source == SOURCE_REAUTH:
+                        return self.async_update_reload_and_abort(
+                            self._get_reauth_entry(), data=self._config
+                        )
 
-                devices = await account.get_devices()
+                    devices = await account.get_devices()
+                finally:
+                    account.async_release()
                 if not devices:
                     return self.async_create_entry(
                         title=f"+{phone_iac}{phone_number}",
@@ -206,8 +219,12 @@ class CatlinkConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
 
-class CatlinkOptionsFlowHandler(OptionsFlowWithReload):
-    """Handle CatLink options flow."""
+class CatlinkOptionsFlowHandler(OptionsFlow):
+    """Handle CatLink options flow.
+
+    Changes are applied to the running coordinator by the entry's update
+    listener, without reloading the entry.
+    """
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -216,12 +233,7 @@ class CatlinkOptionsFlowHandler(OptionsFlowWithReload):
         if user_input is not None:
             return self.async_create_entry(data=user_input)
 
-        account = Account(
-            self.hass,
-            {**dict(self.config_entry.data), **dict(self.config_entry.options or {})},
-        )
-        await account.async_check_auth()
-        devices = await account.get_devices() or []
+        devices = await self._async_get_devices()
 
         device_options: dict[str, str] = {}
         supported_ids: list[str] = []
@@ -240,7 +252,8 @@ class CatlinkOptionsFlowHandler(OptionsFlowWithReload):
                 supported_ids if supported_ids else list(device_options.keys())
             )
 
-        current_interval = self.config_entry.options.get(CONF_UPDATE_INTERVAL, 60)
+        options = self.config_entry.options
+        current_interval = options.get(CONF_UPDATE_INTERVAL, 60)
 
         return self.async_show_form(
             step_id="init",
@@ -262,6 +275,82 @@ class CatlinkOptionsFlowHandler(OptionsFlowWithReload):
                             unit_of_measurement="s",
                         )
                     ),
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT_REQUESTS,
+                        default=options.get(
+                            CONF_MAX_CONCURRENT_REQUESTS,
+                            DEFAULT_MAX_CONCURRENT_REQUESTS,
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=1, max=16, step=1, mode=NumberSelectorMode.BOX
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_REQUESTS_PER_SECOND,
+                        default=options.get(
+                            CONF_REQUESTS_PER_SECOND, DEFAULT_REQUESTS_PER_SECOND
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0.5,
+                            max=20,
+                            step=0.5,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="req/s",
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_REFRESH_DEADLINE,
+                        default=options.get(
+                            CONF_REFRESH_DEADLINE, DEFAULT_REFRESH_DEADLINE
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=5,
+                            max=120,
+                            step=5,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="s",
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_CHANGE_DETECTION,
+                        default=options.get(CONF_CHANGE_DETECTION, False),
+                    ): BooleanSelector(),
+                    vol.Optional(
+                        CONF_MAX_DETAIL_STALENESS,
+                        default=options.get(
+                            CONF_MAX_DETAIL_STALENESS, DEFAULT_MAX_DETAIL_STALENESS
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=60,
+                            max=86400,
+                            step=60,
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="s",
+                        )
+                    ),
                 }
             ),
         )
+
+    async def _async_get_devices(self) -> list[dict]:
+        """Return the account's devices, from the running coordinator if possible."""
+        coordinator = (
+            self.hass.data.get(DOMAIN, {})
+            .get("entry_coordinators", {})
+            .get(self.config_entry.entry_id)
+        )
+        if coordinator is not None and coordinator.device_list:
+            return coordinator.device_list
+        account = Account(
+            self.hass,
+            {**dict(self.config_entry.data), **dict(self.config_entry.options or {})},
+        )
+        try:
+            await account.async_check_auth()
+            return await account.get_devices() or []
+        finally:
+            account.async_release()
@@ -11,6 +11,8 @@ DOMAIN = "catlink"
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG = "config"
+# Fired once per new device log entry
+EVENT_LOG = f"{DOMAIN}_log"
 SCAN_INTERVAL = datetime.timedelta(minutes=1)
 
 CONF_ACCOUNTS = "accounts"
@@ -24,9 +26,25 @@ CONF_LANGUAGE = "language"
 CONF_CATS = "cats"
 CONF_DEVICE_IDS = "device_ids"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_REQUESTS_PER_SECOND = "requests_per_second"
+CONF_CHANGE_DETECTION = "change_detection"
+CONF_MAX_DETAIL_STALENESS = "max_detail_staleness"
+CONF_REFRESH_DEADLINE = "refresh_deadline"
 
 DEFAULT_API_BASE = "https://app.catlinks.cn/api/"
 
+# Per-account request limits, applied per API host
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+
+# With change detection on, idle devices whose list entry is unchanged refetch
+# their detail at most this often (seconds)
+DEFAULT_MAX_DETAIL_STALENESS = 600
+# Seconds a refresh waits for device fetches before publishing; slower devices
+# keep serving their last detail while their fetch finishes in the background
+DEFAULT_REFRESH_DEADLINE = 20
+
 # Device types with full support (sensors, switches, selects, etc.)
 SUPPORTED_DEVICE_TYPES = frozenset({"C08", "SCOOPER", "LITTER_BOX_599", "FEEDER", "PUREPRO"})
 
@@ -77,6 +95,19 @@ ACCOUNT_SCHEMA = vol.Schema(
         vol.Optional(CONF_PASSWORD): cv.string,
         vol.Optional(CONF_LANGUAGE, default="zh_CN"): cv.string,
         vol.Optional(CONF_SCAN_INTERVAL, default=SCAN_INTERVAL): cv.time_period,
+        vol.Optional(
+            CONF_MAX_CONCURRENT_REQUESTS, default=DEFAULT_MAX_CONCURRENT_REQUESTS
+        ): cv.positive_int,
+        vol.Optional(
+            CONF_REQUESTS_PER_SECOND, default=DEFAULT_REQUESTS_PER_SECOND
+        ): vol.Coerce(float),
+        vol.Optional(CONF_CHANGE_DETECTION, default=False): cv.boolean,
+        vol.Optional(
+            CONF_MAX_DETAIL_STALENESS, default=DEFAULT_MAX_DETAIL_STALENESS
+        ): cv.positive_int,
+        vol.Optional(
+            CONF_REFRESH_DEADLINE, default=DEFAULT_REFRESH_DEADLINE
+        ): cv.positive_int,
     },
     extra=vol.ALLOW_EXTRA,
 )
@@ -1,21 +1,53 @@
 """Device base class for CatLink integration."""
 
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+import time
+from typing import TYPE_CHECKING, Any
 
 from ..const import _LOGGER
 from ..helpers import format_api_error
 from ..models.additional_cfg import AdditionalDeviceConfig
 from ..models.api.device import DeviceInfoBase
-from ..models.api.parse import parse_response
+from ..models.api.parse import parse_payload
 
 if TYPE_CHECKING:
     from ..modules.devices_coordinator import DevicesCoordinator
 
+# Entity keys per (device class, domain). Descriptor values may hold bound
+# methods, but the keys of a class never depend on device state.
+_ENTITY_KEYS: dict[tuple[type, str], tuple[str, ...]] = {}
+# Label -> API code maps per (device class, options property)
+_OPTION_CODES: dict[tuple[type, str], dict] = {}
+
+
+def memoized(func: Callable[["Device"], Any]) -> Callable[["Device"], Any]:
+    """Compute a derived device value once per data version.
+
+    Every entity of a device reads the same value until data, detail or logs
+    change. Stack under @property for properties.
+    """
+    name = func.__qualname__
+
+    @wraps(func)
+    def wrapper(self: "Device") -> Any:
+        hit = self._memo.get(name)
+        if hit is not None and hit[0] == self._version:
+            return hit[1]
+        value = func(self)
+        self._memo[name] = (self._version, value)
+        return value
+
+    return wrapper
+
 
 class Device:
     """Device class for CatLink integration."""
 
-    data: dict
+    # Endpoints read by each entity key, beyond the device detail; endpoints
+    # whose entities are all disabled are not fetched
+    ENTITY_ENDPOINTS: dict[str, tuple[str, ...]] = {}
 
     def __init__(
         self,
@@ -29,6 +61,14 @@ class Device:
         self.account = coordinator.account
         self.listeners = {}
         self._action_error: str | None = None
+        self._last_action_at: float | None = None
+        self._batch_depth = 0
+        self._listeners_pending = False
+        self._version = 0
+        self._memo: dict[str, tuple[int, Any]] = {}
+        self._logs: list = []
+        self._detail_at: float | None = None
+        self._stale = False
         self.update_data(dat)
         self.detail = {}
 
@@ -36,6 +76,93 @@ class Device:
         """Initialize the device."""
         await self.update_device_detail()
 
+    @property
+    def version(self) -> int:
+        """Return the data version, bumped whenever the device state changes."""
+        return self._version
+
+    def _touch(self) -> None:
+        """Invalidate memoized values."""
+        self._version += 1
+
+    @property
+    def data(self) -> dict:
+        """Return the device list entry."""
+        return self._data
+
+    @data.setter
+    def data(self, value: dict) -> None:
+        self._data = value
+        self._touch()
+
+    @property
+    def detail(self) -> dict:
+        """Return the device detail."""
+        return self._detail
+
+    @detail.setter
+    def detail(self, value: dict) -> None:
+        if not value and self._stale and self._detail:
+            # A late fetch that failed keeps serving the last good detail
+            return
+        self._detail = value
+        self._touch()
+        if value:
+            self._detail_at = time.time()
+            self._ingest_detail(value)
+
+    def _ingest_detail(self, detail: dict) -> None:
+        """Process a freshly received detail payload once."""
+
+    @property
+    def logs(self) -> list:
+        """Return the device logs, newest first."""
+        return self._logs
+
+    @logs.setter
+    def logs(self, value: list) -> None:
+        self._logs = value
+        self._touch()
+
+    def as_snapshot(self) -> dict:
+        """Return the state persisted across restarts."""
+        return {
+            "data": self.data,
+            "detail": self.detail,
+            "logs": self.logs,
+            "detail_at": self._detail_at,
+        }
+
+    def restore(self, snapshot: dict) -> None:
+        """Restore persisted detail and logs without ingesting them as new."""
+        self._detail = snapshot.get("detail") or {}
+        self._logs = snapshot.get("logs") or []
+        self._detail_at = snapshot.get("detail_at")
+        self._touch()
+
+    @property
+    def detail_at(self) -> float | None:
+        """Return when the current detail was received, as a Unix time."""
+        return self._detail_at
+
+    @property
+    def stale(self) -> bool:
+        """Return True while a detail fetch has overrun the refresh deadline."""
+        return self._stale
+
+    def set_stale(self, stale: bool) -> None:
+        """Mark the detail as stale or fresh, notifying entities on change."""
+        if stale != self._stale:
+            self._stale = stale
+            self._handle_listeners()
+
+    @property
+    def staleness(self) -> float | None:
+        """Return the age in seconds of the detail being served while stale."""
+        if not self._stale or self._detail_at is None:
+            return None
+        return time.time() - self._detail_at
+
     def update_data(self, dat: dict) -> None:
         """Update device data."""
         self.data = dat
@@ -44,9 +171,25 @@ class Device:
 
     def _handle_listeners(self) -> None:
         """Notify all registered listeners to refresh their state."""
+        self._touch()
+        if self._batch_depth:
+            self._listeners_pending = True
+            return
         for fun in self.listeners.values():
             fun()
 
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """Defer listener notifications until the outermost batch exits."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._listeners_pending:
+                self._listeners_pending = False
+                self._handle_listeners()
+
     def _set_action_error(self, error_msg: str) -> None:
         """Store API error and refresh entities so the error sensor updates."""
         self._action_error = error_msg
@@ -119,6 +262,40 @@ class Device:
             _LOGGER.error("Get device state failed: %s", exc)
             return "unknown"
 
+    def note_action(self) -> None:
+        """Record that the user just acted on the device and poll it fast."""
+        self._last_action_at = time.monotonic()
+        self.coordinator.async_note_action(self)
+
+    def acted_within(self, seconds: float) -> bool:
+        """Return True if the user acted on the device in the last seconds."""
+        return (
+            self._last_action_at is not None
+            and time.monotonic() - self._last_action_at < seconds
+        )
+
+    @property
+    def running(self) -> bool:
+        """Return True while the device is working."""
+        return self.state == "running"
+
+    @property
+    def offline(self) -> bool:
+        """Return True if the cloud reports the device offline."""
+        return self.detail.get("online", self.data.get("online")) is False
+
+    @property
+    def in_quiet_hours(self) -> bool:
+        """Return True while the device is in its quiet period."""
+        return False
+
+    @property
+    def idle(self) -> bool:
+        """Return True if the device has detail and is not doing anything."""
+        if not self.detail or self._action_error:
+            return False
+        return f"{self.detail.get('workStatus', '')}".strip() in ("", "00")
+
     @property
     def mode(self) -> str:
         """Return the device mode."""
@@ -139,6 +316,26 @@ class Device:
         """Return the device actions."""
         return {}
 
+    def entity_keys(self, domain: str) -> tuple[str, ...]:
+        """Return the entity keys of a domain, computed once per device class."""
+        cache_key = (type(self), domain)
+        keys = _ENTITY_KEYS.get(cache_key)
+        if keys is None:
+            keys = tuple(getattr(self, f"hass_{domain}", None) or ())
+            _ENTITY_KEYS[cache_key] = keys
+        return keys
+
+    def _option_code(self, options: str, label):
+        """Return the API code of an option label, or None if unknown."""
+        cache_key = (type(self), options)
+        codes = _OPTION_CODES.get(cache_key)
+        if codes is None:
+            codes = {}
+            for code, value in getattr(self, options).items():
+                codes.setdefault(value, code)
+            _OPTION_CODES[cache_key] = codes
+        return codes.get(label)
+
     @property
     def hass_sensor(self) -> dict:
         """Return the device sensors."""
@@ -182,6 +379,7 @@ class Device:
             },
         }
 
+    @memoized
     def state_attrs(self) -> dict:
         """Return the device state attributes."""
         return {
@@ -196,6 +394,7 @@ class Device:
             "pave_second": self.detail.get("catLitterPaveSecond"),
         }
 
+    @memoized
     def mode_attrs(self) -> dict:
         """Return the device mode attributes."""
         return {
@@ -205,11 +404,7 @@ class Device:
     async def select_mode(self, mode, **kwargs) -> bool:
         """Select the device mode."""
         api = "token/device/changeMode"
-        mod = None
-        for k, v in self.modes.items():
-            if v == mode:
-                mod = k
-                break
+        mod = self._option_code("modes", mode)
         if mod is None:
             _LOGGER.warning("Select mode failed for %s in %s", mode, self.modes)
             return False
@@ -231,11 +426,7 @@ class Device:
     async def select_action(self, action, **kwargs) -> bool:
         """Select the device action."""
         api = "token/device/actionCmd"
-        val = None
-        for k, v in self.actions.items():
-            if v == action:
-                val = k
-                break
+        val = self._option_code("actions", action)
         if val is None:
             _LOGGER.warning("Select action failed for %s in %s", action, self.actions)
             return False
@@ -265,12 +456,7 @@ class Device:
             rsp = await self.account.request(api, pms)
             data = rsp.get("data", {})
             raw = data.get("deviceInfo")
-            parsed = parse_response(data, "deviceInfo", DeviceInfoBase)
-            rdt = (
-                parsed.model_dump(by_alias=True)
-                if hasattr(parsed, "model_dump")
-                else (parsed or {})
-            )
+            rdt = parse_payload(data, "deviceInfo", DeviceInfoBase) or {}
             if not rdt and raw:
                 rdt = raw
                 _LOGGER.debug(
@@ -7,12 +7,17 @@ from datetime import time
 from functools import partial
 from typing import TYPE_CHECKING
 
+from homeassistant.const import EntityCategory
+from homeassistant.util import dt as dt_util
+
 from custom_components.catlink.const import _LOGGER
+from custom_components.catlink.devices.base import memoized
 from custom_components.catlink.devices.litter_device import LitterDevice
 from custom_components.catlink.helpers import format_api_error
 from custom_components.catlink.models.additional_cfg import AdditionalDeviceConfig
 from custom_components.catlink.models.api.device import C08DeviceInfo
-from custom_components.catlink.models.api.parse import parse_response
+from custom_components.catlink.models.api.parse import parse_payload
+from custom_components.catlink.modules.entity_demand import LOGS
 
 if TYPE_CHECKING:
     from custom_components.catlink.modules.devices_coordinator import DevicesCoordinator
@@ -40,6 +45,19 @@ API_LITTERBOX_CAT_LIST_SELECTABLE = "token/litterbox/cat/listSelectable"
 API_LITTERBOX_C08_WIFI_INFO = "token/litterbox/wifi/info"
 API_LITTERBOX_ABOUT_DEVICE = "token/litterbox/aboutDevice"
 
+# Seconds each supplemental endpoint is cached; these change a few times a day
+# at most, and the matching setters invalidate them.
+C08_EXTRAS_TTL: dict[str, int] = {
+    API_LITTERBOX_STATS_DATA_COMPARE_V2: 300,
+    API_LITTERBOX_STATS_CATS: 300,
+    API_LITTERBOX_LINKED_PETS: 3600,
+    API_LITTERBOX_CAT_LIST_SELECTABLE: 3600,
+    API_LITTERBOX_C08_WIFI_INFO: 600,
+    API_LITTERBOX_NOTICE_CONFIG_LIST_C08: 3600,
+    API_LITTERBOX_ABOUT_DEVICE: 21600,
+}
+C08_STATS_APIS = (API_LITTERBOX_STATS_DATA_COMPARE_V2, API_LITTERBOX_STATS_CATS)
+
 API_LITTERBOX_LOGS = "token/litterbox/stats/log/top5"
 API_LITTERBOX_LOGS_RESPONSE_KEY = "scooperLogTop5"
 
@@ -62,6 +80,28 @@ NOTICE_ITEMS: dict[str, tuple[str, str]] = {
 class C08Device(LitterDevice):
     """C08 litter box device class."""
 
+    # The state sensor claims the endpoints no other entity shows; the wifi,
+    # stats and notice payloads join its attributes while they are in demand
+    ENTITY_ENDPOINTS = {
+        "last_log": (LOGS,),
+        "state": (
+            API_LITTERBOX_LINKED_PETS,
+            API_LITTERBOX_CAT_LIST_SELECTABLE,
+            API_LITTERBOX_ABOUT_DEVICE,
+        ),
+        "wifi_rssi": (API_LITTERBOX_C08_WIFI_INFO,),
+        "wifi_ssid": (API_LITTERBOX_C08_WIFI_INFO,),
+        "stats_times": (API_LITTERBOX_STATS_DATA_COMPARE_V2,),
+        "stats_weight_avg": (API_LITTERBOX_STATS_DATA_COMPARE_V2,),
+        "stats_duration_avg": (API_LITTERBOX_STATS_DATA_COMPARE_V2,),
+        "pet_stats_count": (API_LITTERBOX_STATS_CATS,),
+        "notice_config_count": (API_LITTERBOX_NOTICE_CONFIG_LIST_C08,),
+        **{
+            f"notice_{slug}": (API_LITTERBOX_NOTICE_CONFIG_LIST_C08,)
+            for slug in NOTICE_ITEMS
+        },
+    }
+
     def __init__(
         self,
         dat: dict,
@@ -160,6 +200,17 @@ class C08Device(LitterDevice):
             return self._bool_value(quiet_enable)
         return bool(self.detail.get("quietTimes"))
 
+    @property
+    def in_quiet_hours(self) -> bool:
+        """Return True while quiet mode is on and the quiet period is active."""
+        if not self.quiet_mode:
+            return False
+        start, end = self._quiet_time_range()
+        now = dt_util.now().time()
+        if start <= end:
+            return start <= now < end
+        return now >= start or now < end
+
     @property
     def child_lock(self) -> bool:
         """Return the child lock setting."""
@@ -239,27 +290,39 @@ class C08Device(LitterDevice):
             },
             "online": {
                 "icon": "mdi:wifi",
+                "category": EntityCategory.DIAGNOSTIC,
             },
             "wifi_rssi": {
                 "icon": "mdi:wifi",
+                "category": EntityCategory.DIAGNOSTIC,
+                "enabled_default": False,
             },
             "wifi_ssid": {
                 "icon": "mdi:wifi",
+                "category": EntityCategory.DIAGNOSTIC,
+                "enabled_default": False,
             },
             "stats_times": {
                 "icon": "mdi:counter",
+                "enabled_default": False,
             },
             "stats_weight_avg": {
                 "icon": "mdi:scale",
+                "enabled_default": False,
             },
             "stats_duration_avg": {
                 "icon": "mdi:timer",
+                "enabled_default": False,
             },
             "notice_config_count": {
                 "icon": "mdi:bell",
+                "category": EntityCategory.DIAGNOSTIC,
+                "enabled_default": False,
             },
             "pet_stats_count": {
                 "icon": "mdi:paw",
+                "category": EntityCategory.DIAGNOSTIC,
+                "enabled_default": False,
             },
         }
 
@@ -312,21 +375,25 @@ class C08Device(LitterDevice):
             },
             "child_lock": {
                 "icon": "mdi:lock",
+                "category": EntityCategory.CONFIG,
                 "async_turn_on": partial(self.async_set_child_lock, True),
                 "async_turn_off": partial(self.async_set_child_lock, False),
             },
             "indicator_light": {
                 "icon": "mdi:lightbulb",
+                "category": EntityCategory.CONFIG,
                 "async_turn_on": partial(self.async_set_indicator_light, True),
                 "async_turn_off": partial(self.async_set_indicator_light, False),
             },
             "keypad_tone": {
                 "icon": "mdi:volume-high",
+                "category": EntityCategory.CONFIG,
                 "async_turn_on": partial(self.async_set_keypad_tone, True),
                 "async_turn_off": partial(self.async_set_keypad_tone, False),
             },
             "auto_pet_weight_update": {
                 "icon": "mdi:scale",
+                "category": EntityCategory.CONFIG,
                 "async_turn_on": partial(self.async_set_auto_pet_weight_update, True),
                 "async_turn_off": partial(self.async_set_auto_pet_weight_update, False),
             },
@@ -340,11 +407,14 @@ class C08Device(LitterDevice):
             switches[f"notice_{slug}"] = {
                 "icon": "mdi:bell",
                 "name": f"Notice: {label}",
+                "category": EntityCategory.CONFIG,
+                "enabled_default": False,
                 "async_turn_on": partial(self.async_set_notice, item_code, True),
                 "async_turn_off": partial(self.async_set_notice, item_code, False),
             }
         return switches
 
+    @memoized
     def state_attrs(self) -> dict:
         """Return the state attributes."""
         return {
@@ -359,15 +429,34 @@ class C08Device(LitterDevice):
             "litter_type": self.detail.get("litterType"),
             "box_full_sensitivity": self.detail.get("boxFullSensitivity"),
             "garbage_status": self.detail.get("garbageStatus"),
-            "wifi_info": self._wifi_info or {},
-            "notice_configs": self._notice_configs or [],
-            "device_stats": self._device_stats or {},
-            "pet_stats": self._pet_stats or [],
+            **self._extras_attrs(),
             "about_device": self._about_device or {},
             "linked_pets": self._linked_pets or [],
             "selectable_pets": self._selectable_pets or [],
         }
 
+    def _extras_attrs(self) -> dict:
+        """Return the extras payloads whose endpoints are fetched."""
+        demand = self.coordinator.demand
+        extras = {
+            "wifi_info": (API_LITTERBOX_C08_WIFI_INFO, self._wifi_info or {}),
+            "notice_configs": (
+                API_LITTERBOX_NOTICE_CONFIG_LIST_C08,
+                self._notice_configs or [],
+            ),
+            "device_stats": (
+                API_LITTERBOX_STATS_DATA_COMPARE_V2,
+                self._device_stats or {},
+            ),
+            "pet_stats": (API_LITTERBOX_STATS_CATS, self._pet_stats or []),
+        }
+        return {
+            key: value
+            for key, (api, value) in extras.items()
+            if demand.wants(self, api)
+        }
+
+    @memoized
     def error_attrs(self) -> dict:
         """Return the error attributes."""
         return {
@@ -420,12 +509,7 @@ class C08Device(LitterDevice):
             )
             data = rsp.get("data", {})
             raw = data.get("deviceInfo")
-            parsed = parse_response(data, "deviceInfo", C08DeviceInfo)
-            rdt = (
-                parsed.model_dump(by_alias=True)
-                if hasattr(parsed, "model_dump")
-                else (parsed or {})
-            )
+            rdt = parse_payload(data, "deviceInfo", C08DeviceInfo) or {}
             if not rdt and raw:
                 rdt = raw
                 _LOGGER.debug(
@@ -451,11 +535,7 @@ class C08Device(LitterDevice):
 
     async def select_mode(self, mode, **kwargs) -> bool:
         """Select the device mode."""
-        mod = None
-        for k, v in self.modes.items():
-            if v == mode:
-                mod = k
-                break
+        mod = self._option_code("modes", mode)
         if mod is None:
             _LOGGER.warning("Select mode failed for %s in %s", mode, self.modes)
             return False
@@ -479,18 +559,16 @@ class C08Device(LitterDevice):
             },
             "POST",
         )
-        result = await self._handle_action_result(rdt, "Select action")
+        result = await self._handle_action_result(
+            rdt, "Select action", C08_STATS_APIS
+        )
         if result:
             self._last_action = action
         return result
 
     async def select_litter_type(self, litter_type, **kwargs) -> bool:
         """Select the litter type."""
-        type_code = None
-        for k, v in self.litter_types.items():
-            if v == litter_type:
-                type_code = k
-                break
+        type_code = self._option_code("litter_types", litter_type)
         if type_code is None:
             _LOGGER.warning("Select litter type failed for %s", litter_type)
             return False
@@ -503,11 +581,7 @@ class C08Device(LitterDevice):
 
     async def select_safe_time(self, safe_time, **kwargs) -> bool:
         """Select the safe time option."""
-        safe_value = None
-        for k, v in self.safe_time_options.items():
-            if v == safe_time:
-                safe_value = k
-                break
+        safe_value = self._option_code("safe_time_options", safe_time)
         if safe_value is None:
             _LOGGER.warning("Select safe time failed for %s", safe_time)
             return False
@@ -595,42 +669,42 @@ class C08Device(LitterDevice):
             {"noticeItem": item, "noticeSwitch": enable, "deviceId": self.id},
             "POST",
         )
-        return await self._handle_action_result(rdt, "Notice config")
+        return await self._handle_action_result(
+            rdt, "Notice config", (API_LITTERBOX_NOTICE_CONFIG_LIST_C08,)
+        )
 
     async def async_refresh_c08_extras(self) -> None:
-        """Refresh supplemental C08 data."""
-        requests = [
-            self.account.request(
-                API_LITTERBOX_STATS_DATA_COMPARE_V2, {"deviceId": self.id}
-            ),
-            self.account.request(API_LITTERBOX_STATS_CATS, {"deviceId": self.id}),
-            self.account.request(API_LITTERBOX_LINKED_PETS, {"deviceId": self.id}),
-            self.account.request(
-                API_LITTERBOX_CAT_LIST_SELECTABLE, {"deviceId": self.id}
-            ),
-            self.account.request(API_LITTERBOX_C08_WIFI_INFO, {"deviceId": self.id}),
-            self.account.request(
-                API_LITTERBOX_NOTICE_CONFIG_LIST_C08, {"deviceId": self.id}
-            ),
-            self.account.request(API_LITTERBOX_ABOUT_DEVICE, {"deviceId": self.id}),
-        ]
-        (
-            stats_rsp,
-            pets_rsp,
-            linked_rsp,
-            selectable_rsp,
-            wifi_rsp,
-            notice_rsp,
-            about_rsp,
-        ) = await asyncio.gather(*requests)
-
-        self._device_stats = stats_rsp.get("data", {}).get("compareData", {})
-        self._pet_stats = pets_rsp.get("data", {}).get("cats", [])
-        self._linked_pets = linked_rsp.get("data", [])
-        self._selectable_pets = selectable_rsp.get("data", {}).get("cats", [])
-        self._wifi_info = wifi_rsp.get("data", {}).get("wifiInfo", {})
-        self.set_notice_configs(notice_rsp.get("data", {}).get("noticeConfigs", []))
-        self._about_device = about_rsp.get("data", {}).get("info", {})
+        """Refresh supplemental C08 data, skipping endpoints no enabled entity shows."""
+        pms = {"deviceId": self.id}
+        demand = self.coordinator.demand
+        apis = [api for api in C08_EXTRAS_TTL if demand.wants(self, api)]
+        responses = dict(
+            zip(
+                apis,
+                await asyncio.gather(
+                    *(
+                        self.account.cached_request(api, pms, C08_EXTRAS_TTL[api])
+                        for api in apis
+                    )
+                ),
+                strict=True,
+            )
+        )
+
+        def data(api: str):
+            return responses.get(api, {}).get("data", {})
+
+        self._device_stats = data(API_LITTERBOX_STATS_DATA_COMPARE_V2).get(
+            "compareData", {}
+        )
+        self._pet_stats = data(API_LITTERBOX_STATS_CATS).get("cats", [])
+        self._linked_pets = responses.get(API_LITTERBOX_LINKED_PETS, {}).get("data", [])
+        self._selectable_pets = data(API_LITTERBOX_CAT_LIST_SELECTABLE).get("cats", [])
+        self._wifi_info = data(API_LITTERBOX_C08_WIFI_INFO).get("wifiInfo", {})
+        self.set_notice_configs(
+            data(API_LITTERBOX_NOTICE_CONFIG_LIST_C08).get("noticeConfigs", [])
+        )
+        self._about_device = data(API_LITTERBOX_ABOUT_DEVICE).get("info", {})
 
     def set_notice_configs(self, configs: list | None) -> None:
         """Set notice configs and update the notice map."""
@@ -650,14 +724,18 @@ class C08Device(LitterDevice):
         )
         return await self._handle_action_result(rdt, name)
 
-    async def _handle_action_result(self, rdt: dict, action_name: str) -> bool:
-        """Handle the action response."""
+    async def _handle_action_result(
+        self, rdt: dict, action_name: str, invalidates: tuple[str, ...] = ()
+    ) -> bool:
+        """Handle the action response, dropping cached extras it made stale."""
         eno = rdt.get("returnCode", 0)
         if eno:
             err_msg = format_api_error(rdt)
             _LOGGER.error("%s failed: %s", action_name, err_msg)
             self._set_action_error(err_msg)
             return False
+        for api in invalidates:
+            self.account.invalidate(api, {"deviceId": self.id})
         await self.update_device_detail()
         _LOGGER.info("%s: %s", action_name, rdt)
         return True
@@ -9,8 +9,8 @@ from ..const import _LOGGER
 from ..helpers import format_api_error
 from ..models.additional_cfg import AdditionalDeviceConfig
 from ..models.api.device import FeederDeviceInfo
-from ..models.api.parse import parse_response
-from .base import Device
+from ..models.api.parse import parse_payload
+from .base import Device, memoized
 from .mixins.logs import LogsMixin
 
 if TYPE_CHECKING:
@@ -82,12 +82,7 @@ class FeederDevice(LogsMixin, Device):
             rsp = await self.account.request(api, pms)
             data = rsp.get("data", {})
             raw = data.get("deviceInfo")
-            parsed = parse_response(data, "deviceInfo", FeederDeviceInfo)
-            rdt = (
-                parsed.model_dump(by_alias=True)
-                if hasattr(parsed, "model_dump")
-                else (parsed or {})
-            )
+            rdt = parse_payload(data, "deviceInfo", FeederDeviceInfo) or {}
             if not rdt and raw:
                 rdt = raw
                 _LOGGER.debug(
@@ -110,6 +105,7 @@ class FeederDevice(LogsMixin, Device):
         """Return the state of the device."""
         return self.detail.get("foodOutStatus")
 
+    @memoized
     def state_attrs(self) -> dict:
         """Return the state attributes of the device."""
         return {
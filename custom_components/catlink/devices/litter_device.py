@@ -1,11 +1,11 @@
 """Litter device base class for LitterBox and ScooperDevice."""
 
-from collections import deque
 from typing import TYPE_CHECKING
 
 from ..const import _LOGGER
 from ..models.additional_cfg import AdditionalDeviceConfig
-from .base import Device
+from ..modules.weight_history import WeightSeries
+from .base import Device, memoized
 from .mixins.logs import LogsMixin
 
 if TYPE_CHECKING:
@@ -23,10 +23,11 @@ class LitterDevice(LogsMixin, Device):
     ) -> None:
         """Initialize the litter device."""
         super().__init__(dat, coordinator, additional_config)
-        self._litter_weight_during_day = deque(
-            maxlen=self.additional_config.max_samples_litter or 24
+        self._litter_weight_during_day = WeightSeries(
+            self.additional_config.max_samples_litter or 24
         )
         self.empty_litter_box_weight = self.additional_config.empty_weight or 0.0
+        coordinator.weight_history.attach(self.id, self._litter_weight_during_day)
 
     @property
     def state(self) -> str:
@@ -43,20 +44,34 @@ class LitterDevice(LogsMixin, Device):
             _LOGGER.error("Get device state failed: %s", exc)
             return "unknown"
 
+    def _ingest_detail(self, detail: dict) -> None:
+        """Record one litter weight sample per detail payload."""
+        super()._ingest_detail(detail)
+        try:
+            weight = self._litter_weight_of(detail)
+        except Exception as exc:
+            _LOGGER.debug("Litter weight sample skipped: %s", exc)
+            return
+        self._litter_weight_during_day.append(weight)
+        self.coordinator.weight_history.async_schedule_save()
+
+    def _litter_weight_of(self, detail: dict) -> float:
+        """Return the litter weight of a detail payload."""
+        return (
+            detail.get("catLitterWeight", self.empty_litter_box_weight)
+            - self.empty_litter_box_weight
+        )
+
     @property
     def litter_weight(self) -> float:
         """Return the litter weight."""
         litter_weight = 0.0
         try:
-            cat_litter_weight = self.detail.get(
-                "catLitterWeight", self.empty_litter_box_weight
-            )
-            litter_weight = cat_litter_weight - self.empty_litter_box_weight
-            self._litter_weight_during_day.append(litter_weight)
+            litter_weight = self._litter_weight_of(self.detail)
             if litter_weight == 0.0:
                 _LOGGER.debug(
                     "litter_weight is 0: catLitterWeight=%r, empty_litter_box_weight=%r (detail keys: %s)",
-                    cat_litter_weight,
+                    self.detail.get("catLitterWeight"),
                     self.empty_litter_box_weight,
                     list(self.detail.keys()) if self.detail else "none",
                 )
@@ -74,6 +89,7 @@ class LitterDevice(LogsMixin, Device):
             return "unknown"
 
     @property
+    @memoized
     def total_clean_time(self) -> int:
         """Return the total clean time."""
         try:
@@ -113,14 +129,7 @@ class LitterDevice(LogsMixin, Device):
     @property
     def occupied(self) -> bool:
         """Return the occupied status based on litter weight changes during the day."""
-        try:
-            return any(
-                self._litter_weight_during_day[i]
-                < self._litter_weight_during_day[i + 1]
-                for i in range(len(self._litter_weight_during_day) - 1)
-            )
-        except IndexError:
-            return False
+        return self._litter_weight_during_day.occupied
 
     @property
     def online(self) -> bool:
@@ -136,6 +145,7 @@ class LitterDevice(LogsMixin, Device):
         await super().async_init()
         await self._async_init_logs()
 
+    @memoized
     def _base_state_attrs(self) -> dict:
         """Return base state attributes shared by LitterBox and ScooperDevice."""
         return {
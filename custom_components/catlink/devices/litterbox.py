@@ -7,7 +7,8 @@ from ..const import _LOGGER
 from ..helpers import format_api_error
 from ..models.additional_cfg import AdditionalDeviceConfig
 from ..models.api.device import LitterDeviceInfo
-from ..models.api.parse import parse_response
+from ..models.api.parse import parse_payload
+from .base import memoized
 from .litter_device import LitterDevice
 
 if TYPE_CHECKING:
@@ -90,6 +91,7 @@ class LitterBox(LitterDevice):
             return 0
 
     @property
+    @memoized
     def knob_status(self) -> str:
         """Return the knob status."""
         try:
@@ -107,6 +109,7 @@ class LitterBox(LitterDevice):
             return "Unknown"
 
     @property
+    @memoized
     def last_sync(self) -> str | None:
         """Return the last sync time."""
         return (
@@ -118,6 +121,7 @@ class LitterBox(LitterDevice):
         )
 
     @property
+    @memoized
     def garbage_tobe_status(self) -> str:
         """Return the garbage to be status."""
         try:
@@ -221,6 +225,7 @@ class LitterBox(LitterDevice):
             },
         }
 
+    @memoized
     def state_attrs(self) -> dict:
         """Return the state attributes."""
         return {
@@ -251,6 +256,7 @@ class LitterBox(LitterDevice):
             "status": status,
         }
 
+    @memoized
     def error_attrs(self) -> dict:
         """Return the error attributes."""
         try:
@@ -314,11 +320,7 @@ class LitterBox(LitterDevice):
     async def select_mode(self, mode, **kwargs) -> bool:
         """Select the device mode."""
         api = "token/litterbox/changeMode"
-        mod = None
-        for k, v in self.modes.items():
-            if v == mode:
-                mod = k
-                break
+        mod = self._option_code("modes", mode)
         if mod is None:
             _LOGGER.warning("Select mode failed for %s in %s", mode, self.modes)
             return False
@@ -340,11 +342,7 @@ class LitterBox(LitterDevice):
     async def select_box_full_sensitivity(self, level, **kwargs) -> bool:
         """Select the box full sensitivity level."""
         api = "token/litterbox/boxFullSetting"
-        lvl = None
-        for k, v in self.box_full_levels.items():
-            if v == level:
-                lvl = k
-                break
+        lvl = self._option_code("box_full_levels", level)
         if lvl is None:
             _LOGGER.warning(
                 "Select box full sensitivity failed for %s in %s",
@@ -378,12 +376,7 @@ class LitterBox(LitterDevice):
             rsp = await self.account.request(api, pms)
             data = rsp.get("data", {})
             raw = data.get("deviceInfo")
-            parsed = parse_response(data, "deviceInfo", LitterDeviceInfo)
-            rdt = (
-                parsed.model_dump(by_alias=True)
-                if hasattr(parsed, "model_dump")
-                else (parsed or {})
-            )
+            rdt = parse_payload(data, "deviceInfo", LitterDeviceInfo) or {}
             if not rdt and raw:
                 rdt = raw
                 _LOGGER.debug(
@@ -405,11 +398,7 @@ class LitterBox(LitterDevice):
         if "Garbage Bag" in action:
             return await self.changeBag()
         api = "token/litterbox/actionCmd"
-        val = None
-        for k, v in self.actions.items():
-            if v == action:
-                val = k
-                break
+        val = self._option_code("actions", action)
         if val is None:
             _LOGGER.warning("Select action failed for %s in %s", action, self.actions)
             return False
@@ -1,32 +1,104 @@
 """Logs mixin for devices with log support."""
 
-import datetime
+from itertools import chain
 from typing import Any
 
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-
-from ...const import _LOGGER, DOMAIN
+from ...const import _LOGGER, EVENT_LOG
 from ...models.api.logs import LogEntry
-from ...models.api.parse import parse_response
+from ...models.api.parse import parse_payload
+from ...modules.entity_demand import LOGS
+from ..base import memoized
+
+MAX_LOG_ENTRIES = 50
+# (time, event) keys remembered per device to announce each entry once
+LOG_INDEX_SIZE = 200
+
+
+def log_key(entry: dict) -> tuple:
+    """Return the key identifying a log entry."""
+    return (entry.get("time"), entry.get("event"))
+
+
+def merge_logs(current: list, fetched: list, limit: int = MAX_LOG_ENTRIES) -> list:
+    """Merge fetched log entries ahead of known ones, dropping (time, event) repeats."""
+    seen: set[tuple] = set()
+    merged: list = []
+    for entry in chain(fetched, current):
+        if not isinstance(entry, dict):
+            continue
+        key = log_key(entry)
+        if key in seen:
+            continue
+        seen.add(key)
+        merged.append(entry)
+        if len(merged) >= limit:
+            break
+    return merged
 
 
 class LogsMixin:
-    """Mixin providing logs, coordinator_logs, _last_log, last_log_attrs and log coordinator setup."""
+    """Mixin providing logs, _last_log, last_log_attrs and shared log polling."""
+
+    ENTITY_ENDPOINTS = {"last_log": (LOGS,)}
 
     logs: list
-    coordinator_logs: DataUpdateCoordinator | None
+    # Whether the log index holds entries, so new ones are announced
+    _logs_seeded = False
 
     async def _async_init_logs(self) -> None:
-        """Initialize the logs coordinator. Call from async_init after super().async_init()."""
-        self.logs = []
-        self.coordinator_logs = DataUpdateCoordinator(
-            self.account.hass,
-            _LOGGER,
-            name=f"{DOMAIN}-{self.id}-logs",
-            update_method=self.update_logs,
-            update_interval=datetime.timedelta(minutes=1),
-        )
-        await self.coordinator_logs.async_refresh()
+        """Register with the account's log scheduler. Call from async_init after super().async_init()."""
+        if self.coordinator.logs_scheduler.async_register(self) and self.logs_wanted:
+            await self.update_logs()
+
+    @property
+    def logs_wanted(self) -> bool:
+        """Return whether an enabled entity or a log event listener uses the logs."""
+        if self.coordinator.demand.wants(self, LOGS):
+            return True
+        return bool(self.coordinator.hass.bus.async_listeners().get(EVENT_LOG))
+
+    def _merge_logs(self, fetched: list) -> list:
+        """Merge freshly fetched entries into the logs and notify listeners."""
+        current = getattr(self, "logs", None) or []
+        self._announce_logs(current, fetched)
+        self.logs = merge_logs(current, fetched)
+        self._handle_listeners()
+        return self.logs
+
+    def _announce_logs(self, current: list, fetched: list) -> None:
+        """Fire a log event for each entry not seen before, oldest first.
+
+        Until a fetch returns entries the index is only seeded, so the
+        history returned on setup, or after failed first fetches, is not
+        replayed as events.
+        """
+        index: dict[tuple, None] | None = getattr(self, "_log_index", None)
+        if index is None:
+            index = self._log_index = dict.fromkeys(
+                log_key(e) for e in reversed(current) if isinstance(e, dict)
+            )
+            self._logs_seeded = bool(index)
+        announce = self._logs_seeded
+        for entry in reversed(fetched):
+            if not isinstance(entry, dict):
+                continue
+            key = log_key(entry)
+            if key in index:
+                continue
+            index[key] = None
+            if len(index) > LOG_INDEX_SIZE:
+                del index[next(iter(index))]
+            if announce:
+                self.coordinator.hass.bus.async_fire(
+                    EVENT_LOG,
+                    {
+                        **entry,
+                        "device_id": self.id,
+                        "device_name": self.name,
+                        "device_type": self.type,
+                    },
+                )
+        self._logs_seeded = bool(index)
 
     @property
     def _last_log(self) -> dict[str, Any]:
@@ -44,13 +116,14 @@ class LogsMixin:
             return None
         return f"{log.get('time')} {log.get('event')}"
 
+    @memoized
     def last_log_attrs(self) -> dict[str, Any]:
-        """Return the last log attributes for entity extra state."""
-        log = self._last_log
-        return {
-            **log,
-            "logs": self.logs,
-        }
+        """Return the last log attributes for entity extra state.
+
+        The full history is served by the get_logs service rather than kept
+        in the state, which the recorder would write on every change.
+        """
+        return {**self._last_log}
 
     async def _fetch_logs(self, api: str, response_key: str) -> list:
         """Fetch logs from API. Subclasses call this from update_logs with their api path and response key."""
@@ -59,18 +132,12 @@ class LogsMixin:
         try:
             rsp = await self.account.request(api, pms)
             data = rsp.get("data", {})
-            parsed = parse_response(data, response_key, LogEntry, [])
-            if isinstance(parsed, list) and parsed and hasattr(parsed[0], "model_dump"):
-                rdt = [p.model_dump() for p in parsed]
-            elif isinstance(parsed, list):
-                rdt = parsed
-            else:
+            rdt = parse_payload(data, response_key, LogEntry, [])
+            if not isinstance(rdt, list):
                 rdt = data.get(response_key) or []
         except (TypeError, ValueError) as exc:
             rdt = []
             _LOGGER.error("Got device logs for %s failed: %s", self.name, exc)
         if not rdt:
             _LOGGER.warning("Got device logs for %s failed: %s", self.name, rsp)
-        self.logs = rdt
-        self._handle_listeners()
-        return rdt
+        return self._merge_logs(rdt)
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 from ..const import _LOGGER
 from ..helpers import format_api_error
 from ..models.additional_cfg import AdditionalDeviceConfig
-from .base import Device
+from .base import Device, memoized
 from .mixins.logs import LogsMixin
 
 if TYPE_CHECKING:
@@ -78,6 +78,7 @@ class PureProDevice(LogsMixin, Device):
             return self.modes[mode]
         return self.detail.get("workStatus", "unknown")
 
+    @memoized
     def state_attrs(self) -> dict:
         """Return the state attributes of the device."""
         return {
@@ -197,11 +198,7 @@ class PureProDevice(LogsMixin, Device):
 
     async def select_mode(self, mode, **kwargs) -> bool:
         """Select the device mode."""
-        mod = None
-        for k, v in self.modes.items():
-            if v == mode:
-                mod = k
-                break
+        mod = self._option_code("modes", mode)
         if mod is None:
             _LOGGER.warning("Select mode failed for %s in %s", mode, self.modes)
             return False
@@ -10,7 +10,8 @@ from homeassistant.const import PERCENTAGE, UnitOfTemperature
 from ..const import _LOGGER
 from ..models.additional_cfg import AdditionalDeviceConfig
 from ..models.api.device import LitterDeviceInfo
-from ..models.api.parse import parse_response
+from ..models.api.parse import parse_payload
+from .base import memoized
 from .litter_device import LitterDevice
 
 if TYPE_CHECKING:
@@ -132,6 +133,7 @@ class ScooperDevice(LitterDevice):
             },
         }
 
+    @memoized
     def state_attrs(self) -> dict:
         """Return the state attributes."""
         return self._base_state_attrs()
@@ -151,12 +153,7 @@ class ScooperDevice(LitterDevice):
             rsp = await self.account.request(api, pms)
             data = rsp.get("data", {})
             raw = data.get("deviceInfo")
-            parsed = parse_response(data, "deviceInfo", LitterDeviceInfo)
-            rdt = (
-                parsed.model_dump(by_alias=True)
-                if hasattr(parsed, "model_dump")
-                else (parsed or {})
-            )
+            rdt = parse_payload(data, "deviceInfo", LitterDeviceInfo) or {}
             if not rdt and raw:
                 rdt = raw
                 _LOGGER.debug(
@@ -9,7 +9,7 @@ from ..const import _LOGGER
 from ..models.additional_cfg import AdditionalDeviceConfig
 from ..models.api.device import LitterDeviceInfo
 from ..models.api.logs import LogEntry
-from ..models.api.parse import parse_response
+from ..models.api.parse import parse_payload
 from .litter_device import LitterDevice
 
 if TYPE_CHECKING:
@@ -85,12 +85,7 @@ class ScooperProUltraDevice(LitterDevice):
         try:
             rsp = await self.account.request(api, pms)
             data = rsp.get("data", {})
-            parsed = parse_response(data, "deviceInfo", LitterDeviceInfo, {})
-            rdt = (
-                parsed.model_dump(by_alias=True)
-                if hasattr(parsed, "model_dump")
-                else (parsed or {})
-            )
+            rdt = parse_payload(data, "deviceInfo", LitterDeviceInfo, {}) or {}
         except (TypeError, ValueError) as exc:
             rdt = {}
             _LOGGER.error("Got device detail for %s failed: %s", self.name, exc)
@@ -117,18 +112,12 @@ class ScooperProUltraDevice(LitterDevice):
         try:
             rsp = await self.account.request(api, pms)
             data = rsp.get("data", {})
-            parsed = parse_response(data, "records", LogEntry, [])
-            if isinstance(parsed, list) and parsed and hasattr(parsed[0], "model_dump"):
-                rdt = [p.model_dump() for p in parsed]
-            elif isinstance(parsed, list):
-                rdt = parsed
-            else:
+            rdt = parse_payload(data, "records", LogEntry, [])
+            if not isinstance(rdt, list):
                 rdt = data.get("records") or []
         except (TypeError, ValueError) as exc:
             rdt = []
             _LOGGER.error("Got device logs for %s failed: %s", self.name, exc)
         if not rdt:
             _LOGGER.warning("Got device logs for %s failed: %s", self.name, rsp)
-        self.logs = rdt
-        self._handle_listeners()
-        return rdt
+        return self._merge_logs(rdt)
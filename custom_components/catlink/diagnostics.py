@@ -0,0 +1,49 @@
+"""Diagnostics support for CatLink."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_TOKEN
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PHONE, CONF_USER_ID, DOMAIN
+
+TO_REDACT = {CONF_PASSWORD, CONF_TOKEN, CONF_PHONE, CONF_USER_ID, "title", "mac"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics of a config entry, with its API metrics."""
+    data: dict[str, Any] = {"entry": async_redact_data(entry.as_dict(), TO_REDACT)}
+    coordinator = hass.data[DOMAIN]["entry_coordinators"].get(entry.entry_id)
+    if coordinator is None:
+        return data
+    account = coordinator.account
+    data.update(
+        {
+            "metrics": account.metrics.as_dict(),
+            "coalesce": dict(account.coalesce_stats),
+            "limiter": dict(account.limiter.stats),
+            "response_cache": dict(account.response_cache.stats),
+            "circuits": account.circuit_states,
+            "stage_timings": dict(coordinator.stage_timings),
+            "poll_tiers": dict(coordinator.scheduler.tiers),
+            "devices": [
+                async_redact_data(
+                    {
+                        "id": dvc.id,
+                        "type": dvc.type,
+                        "model": dvc.model,
+                        "mac": dvc.mac,
+                        "state": dvc.state,
+                        "staleness": dvc.staleness,
+                    },
+                    TO_REDACT,
+                )
+                for dvc in coordinator.entry_devices()
+            ],
+        }
+    )
+    return data
@@ -29,10 +29,15 @@ class CatlinkEntity(CoordinatorEntity):
         mac = device.mac[-4:] if device.mac else device.id
         object_id = f"{device.type}_{mac}_{name}"
         self.entity_id = f"{DOMAIN}.{slugify(object_id)}"
+        self._written: tuple | None = None
         self._attr_icon = self._option.get("icon")
         self._attr_device_class = self._option.get("class")
         self._attr_native_unit_of_measurement = self._option.get("unit")
         self._attr_state_class = self._option.get("state_class")
+        self._attr_entity_category = self._option.get("category")
+        self._attr_entity_registry_enabled_default = self._option.get(
+            "enabled_default", True
+        )
         entity_picture = self._option.get("entity_picture")
         if callable(entity_picture):
             self._attr_entity_picture = entity_picture()
@@ -52,13 +57,29 @@ class CatlinkEntity(CoordinatorEntity):
         self._device.listeners[self.entity_id] = self._handle_coordinator_update
         self._handle_coordinator_update()
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop following the device, e.g. once the entity is disabled."""
+        self._device.listeners.pop(self.entity_id, None)
+        await super().async_will_remove_from_hass()
+
     def _handle_coordinator_update(self):
         self.update()
+        written = (
+            self.state,
+            self.extra_state_attributes,
+            self.entity_picture,
+            self.available,
+        )
+        if written == self._written:
+            return
+        self._written = written
         self.async_write_ha_state()
 
     async def _async_after_action(self, success: bool, delay: float | None = None) -> None:
         """Run after an action: write state, optional delay, then coordinator refresh."""
         if success:
+            self._device.note_action()
+            self._written = None
             self.async_write_ha_state()
             if delay is not None:
                 await asyncio.sleep(delay)
@@ -76,8 +97,11 @@ class CatlinkEntity(CoordinatorEntity):
             self._attr_entity_picture = entity_picture()
 
         fun = self._option.get("state_attrs")
-        if callable(fun):
-            self._attr_extra_state_attributes = fun()
+        attrs = fun() if callable(fun) else None
+        staleness = self._device.staleness
+        if staleness is not None:
+            attrs = {**(attrs or {}), "staleness": round(staleness)}
+        self._attr_extra_state_attributes = attrs
 
     @property
     def state(self) -> str:
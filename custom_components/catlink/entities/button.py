@@ -14,4 +14,6 @@ class CatlinkButtonEntity(CatlinkEntity, ButtonEntity):
         fun = self._option.get("async_press")
         if callable(fun):
             ret = await fun()
+        if ret:
+            self._device.note_action()
         return ret
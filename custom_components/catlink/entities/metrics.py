@@ -0,0 +1,113 @@
+"""API metrics sensors for CatLink integration."""
+
+import re
+from typing import TYPE_CHECKING
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from ..const import DOMAIN
+
+if TYPE_CHECKING:
+    from ..modules.devices_coordinator import DevicesCoordinator
+
+METRICS_SENSORS: dict[str, dict] = {
+    "api_requests": {
+        "name": "API requests",
+        "icon": "mdi:api",
+        "state_class": SensorStateClass.TOTAL_INCREASING,
+        "value": lambda totals: totals["requests"],
+    },
+    "api_errors": {
+        "name": "API errors",
+        "icon": "mdi:api-off",
+        "state_class": SensorStateClass.TOTAL_INCREASING,
+        "value": lambda totals: totals["errors"],
+        "state_attrs": lambda totals: {
+            "timeouts": totals["timeouts"],
+            "token_expired": totals["token_expired"],
+        },
+    },
+    "api_retries": {
+        "name": "API retries",
+        "icon": "mdi:refresh",
+        "state_class": SensorStateClass.TOTAL_INCREASING,
+        "value": lambda totals: totals["retries"],
+    },
+    "api_latency": {
+        "name": "API latency p95",
+        "icon": "mdi:timer-outline",
+        "class": SensorDeviceClass.DURATION,
+        "unit": UnitOfTime.MILLISECONDS,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "value": lambda totals: totals["latency"]["p95_ms"],
+        "state_attrs": lambda totals: {
+            k: v for k, v in totals["latency"].items() if k != "p95_ms"
+        },
+    },
+    "api_response_bytes": {
+        "name": "API response bytes",
+        "icon": "mdi:download-network",
+        "class": SensorDeviceClass.DATA_SIZE,
+        "unit": UnitOfInformation.BYTES,
+        "state_class": SensorStateClass.TOTAL_INCREASING,
+        "value": lambda totals: totals["bytes"],
+    },
+}
+
+
+def account_label(entry: ConfigEntry) -> str:
+    """Return a name telling the account apart without its phone number.
+
+    Entry titles are the account's phone number; only its last four digits
+    are kept.
+    """
+    title = re.sub(r"\d+(\d{4})", r"…\1", entry.title or "").strip()
+    return title or entry.entry_id[:8]
+
+
+class CatlinkMetricsSensorEntity(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor reporting the API metrics of an account."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self, name: str, coordinator: "DevicesCoordinator", option: dict, label: str
+    ) -> None:
+        """Initialize the entity, named after the account label."""
+        super().__init__(coordinator)
+        self.account = coordinator.account
+        self._name = name
+        self._option = option
+        self._attr_name = f"CatLink {label} {option['name']}"
+        self._attr_unique_id = f"{DOMAIN}-{coordinator.config_entry_id}-{name}"
+        self._attr_icon = option.get("icon")
+        self._attr_device_class = option.get("class")
+        self._attr_native_unit_of_measurement = option.get("unit")
+        self._attr_state_class = option.get("state_class")
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"account_{coordinator.config_entry_id}")},
+            name=f"CatLink {label}",
+            manufacturer="CatLink",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+        self.update()
+
+    def _handle_coordinator_update(self) -> None:
+        self.update()
+        self.async_write_ha_state()
+
+    def update(self) -> None:
+        """Update the entity from the account metrics."""
+        totals = self.account.metrics.totals()
+        self._attr_native_value = self._option["value"](totals)
+        fun = self._option.get("state_attrs")
+        if callable(fun):
+            self._attr_extra_state_attributes = fun(totals)
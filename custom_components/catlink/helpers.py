@@ -1,5 +1,7 @@
 """Helper functions for the CatLink integration."""
 
+import asyncio
+from contextlib import suppress
 from datetime import timedelta
 import re
 from typing import TYPE_CHECKING
@@ -9,8 +11,10 @@ from phonenumbers import NumberParseException
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 
 from .const import (
+    _LOGGER,
     API_SERVERS,
     CONF_API_BASE,
     CONF_PASSWORD,
@@ -22,6 +26,12 @@ from .const import (
 if TYPE_CHECKING:
     from .modules.devices_coordinator import DevicesCoordinator
 
+# Regions tried by discover_region, in default preference order
+REGIONS = ("global", "china", "usa", "singapore")
+# Seconds the preferred region races alone before the others join
+REGION_HEAD_START = 2.0
+REGIONS_STORAGE_KEY = f"{DOMAIN}.regions"
+
 
 async def async_setup_domain_platform(
     hass: HomeAssistant,
@@ -70,23 +80,72 @@ def parse_phone_number(phone: str) -> tuple[str, str]:
 async def discover_region(
     hass: HomeAssistant, phone_iac: str, phone_number: str, password: str
 ) -> str | None:
-    """Try each API region until login succeeds. Returns region key or None."""
+    """Race logins against the API regions. Returns the first region that succeeds.
+
+    The region that last worked for the phone prefix gets a head start; the
+    others join once it fails or REGION_HEAD_START elapses. Racing logins
+    share the auth store of the phone, so only the winner's auth is saved.
+    """
     from .modules.account import Account
 
-    for region in ("global", "china", "usa", "singapore"):
-        api_base = API_SERVERS.get(region)
-        if not api_base:
-            continue
-        config = {
-            CONF_API_BASE: api_base,
-            CONF_PHONE: phone_number,
-            CONF_PHONE_IAC: phone_iac,
-            CONF_PASSWORD: password,
-        }
-        account = Account(hass, config)
-        if await account.async_login():
-            return region
-    return None
+    store: Store[dict[str, str]] = Store(hass, 1, REGIONS_STORAGE_KEY)
+    cached = await store.async_load() or {}
+    regions = sorted(
+        (r for r in REGIONS if r in API_SERVERS),
+        key=lambda r: r != cached.get(phone_iac),
+    )
+    if len(password) <= 16:
+        # Encrypt once instead of once per region
+        password = await hass.async_add_executor_job(Account.encrypt_password, password)
+    leader_failed = asyncio.Event()
+    accounts: dict[str, Account] = {}
+
+    async def _login(region: str) -> str | None:
+        if region != regions[0]:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(leader_failed.wait(), REGION_HEAD_START)
+        account = Account(
+            hass,
+            {
+                CONF_API_BASE: API_SERVERS[region],
+                CONF_PHONE: phone_number,
+                CONF_PHONE_IAC: phone_iac,
+                CONF_PASSWORD: password,
+            },
+        )
+        accounts[region] = account
+        success = False
+        try:
+            success = await account.async_login(save_auth=False)
+        finally:
+            # Losing logins are cancelled with the race; stop their request
+            # before the shared session may be closed
+            await account.async_cancel_login()
+            account.async_release()
+            if not success and region == regions[0]:
+                leader_failed.set()
+        return region if success else None
+
+    tasks = [asyncio.ensure_future(_login(region)) for region in regions]
+    found = None
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                found = await next_done
+            except Exception as exc:  # noqa: BLE001
+                _LOGGER.debug("Region login failed: %s", exc)
+                continue
+            if found:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    if found:
+        await accounts[found].async_check_auth(True)
+    if found and cached.get(phone_iac) != found:
+        await store.async_save({**cached, phone_iac: found})
+    return found
 
 
 def format_api_error(rdt: dict) -> str:
@@ -1,11 +1,19 @@
 """Parse helpers for API responses."""
 
-from typing import Any, TypeVar
+from collections.abc import Callable
+from functools import lru_cache
+import types
+from typing import Any, TypeVar, Union, get_args, get_origin
 
 from pydantic import BaseModel, ValidationError
 
 T = TypeVar("T", bound=BaseModel)
 
+# (key, default, type check or None for Any, converter or None) per field
+FieldPlan = tuple[
+    str, Any, Callable[[Any], bool] | None, Callable[[Any], Any] | None
+]
+
 
 def parse_response(
     data: dict,
@@ -23,3 +31,102 @@ def parse_response(
         return model.model_validate(raw)
     except ValidationError:
         return raw if default is None else default
+
+
+def parse_payload(
+    data: dict,
+    key: str,
+    model: type[BaseModel],
+    default: Any = None,
+) -> dict | list | Any:
+    """Parse API response data into plain dicts shaped like model.model_dump().
+
+    Payloads whose declared fields already have the right types are completed
+    with field defaults in place, in one pass and without copying; anything
+    else goes through full pydantic validation. Returns the raw value, or
+    default if given, when validation fails.
+    """
+    raw = data.get(key) if data else None
+    if raw is None:
+        return default
+    try:
+        if isinstance(raw, list):
+            return [_decode(item, model) for item in raw]
+        return _decode(raw, model)
+    except ValidationError:
+        return raw if default is None else default
+
+
+def _decode(raw: Any, model: type[BaseModel]) -> dict:
+    """Return one payload as a dict, validating with pydantic only if needed."""
+    plan = _field_plan(model)
+    if plan is None or not isinstance(raw, dict) or not _matches(raw, plan):
+        return model.model_validate(raw).model_dump(by_alias=True)
+    for name, default, _, convert in plan:
+        if name not in raw:
+            raw[name] = default.copy() if isinstance(default, list | dict) else default
+        elif convert is not None:
+            raw[name] = convert(raw[name])
+    return raw
+
+
+def _matches(raw: dict, plan: tuple[FieldPlan, ...]) -> bool:
+    """Return whether the declared fields present already have pydantic's types."""
+    for name, _, check, _ in plan:
+        if check is not None and name in raw and not check(raw[name]):
+            return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _field_plan(model: type[BaseModel]) -> tuple[FieldPlan, ...] | None:
+    """Return how to check each declared field, or None if only pydantic can."""
+    plan = []
+    for name, field in model.model_fields.items():
+        check = _type_check(field.annotation)
+        if check is False:
+            return None
+        convert = _float if field.annotation is float else None
+        default = field.get_default(call_default_factory=True)
+        plan.append((field.alias or name, default, check, convert))
+    return tuple(plan)
+
+
+def _float(value: Any) -> Any:
+    """Return an int as the float pydantic would produce."""
+    return float(value) if type(value) is int else value
+
+
+def _type_check(annotation: Any) -> Callable[[Any], bool] | None | bool:
+    """Return a check of values pydantic keeps as they are.
+
+    None accepts anything; False means the annotation is not supported.
+    """
+    if annotation is Any:
+        return None
+    if annotation is str:
+        return lambda v: type(v) is str
+    if annotation is int:
+        return lambda v: type(v) is int
+    if annotation is float:
+        return lambda v: type(v) is float or type(v) is int
+    if annotation is bool:
+        return lambda v: type(v) is bool
+    if annotation is type(None):
+        return lambda v: v is None
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is list and args[:1] in ((), (dict[str, Any],), (dict,)):
+        dict_items = bool(args)
+        return lambda v: type(v) is list and (
+            not dict_items or all(type(i) is dict for i in v)
+        )
+    if origin in (Union, types.UnionType):
+        checks = [_type_check(arg) for arg in args]
+        if float in args or any(c is False for c in checks):
+            # pydantic may convert members of the union into one another
+            return False
+        if any(c is None for c in checks):
+            return None
+        return lambda v: any(c(v) for c in checks)
+    return False
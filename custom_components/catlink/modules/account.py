@@ -1,36 +1,71 @@
 """Account module for CatLink."""
 
+import asyncio
 from asyncio import TimeoutError
 import base64
+from collections import OrderedDict
+from contextlib import suppress
 import datetime
+from functools import lru_cache, partial
 import hashlib
 import time
 
-from aiohttp import ClientConnectorError
+from aiohttp import ClientError
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 
 from homeassistant.const import CONF_DEVICES, CONF_PASSWORD, CONF_TOKEN
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import aiohttp_client
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
 
 from ..const import (
     _LOGGER,
     CONF_API_BASE,
     CONF_LANGUAGE,
+    CONF_MAX_CONCURRENT_REQUESTS,
     CONF_PHONE,
     CONF_PHONE_IAC,
+    CONF_REQUESTS_PER_SECOND,
     CONF_SCAN_INTERVAL,
     CONF_UPDATE_INTERVAL,
     DEFAULT_API_BASE,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_REQUESTS_PER_SECOND,
     DOMAIN,
     RSA_PUBLIC_KEY,
     SCAN_INTERVAL,
     SIGN_KEY,
 )
 from ..helpers import Helper
+from .http_pool import async_get_http_pool
+from .metrics import ByteCounter, RequestMetrics
+from .rate_limiter import RequestLimiter
+from .resilience import CircuitBreaker, RetryPolicy
+from .response_cache import ResponseCache
+
+# Params that differ between otherwise identical calls and must not split
+# the in-flight coalescing key.
+VOLATILE_PARAMS = frozenset({"noncestr", "sign", CONF_TOKEN})
+# Last good responses kept to serve while a circuit is open, least recently
+# refreshed first out; date-keyed calls would otherwise grow it every day
+LAST_GOOD_ENTRIES = 256
+
+APP_HEADERS = {
+    "User-Agent": "CATLINK/4.1.5 (iPhone; iOS 26.2.1; Scale/3.00)",
+    "app_version": "4.1.5",
+    "system_version": "26.2.1",
+}
+SIGN_SUFFIX = f"&key={SIGN_KEY}"
+
+
+@lru_cache(maxsize=1)
+def rsa_public_key():
+    """Return the loaded CatLink RSA public key."""
+    return serialization.load_der_public_key(
+        base64.b64decode(RSA_PUBLIC_KEY), default_backend()
+    )
 
 
 class Account:
@@ -40,7 +75,23 @@ class Account:
         """Initialize the account."""
         self._config = config
         self.hass = hass
-        self.http = aiohttp_client.async_create_clientsession(hass, auto_cleanup=False)
+        self._api_base = self.get_config(CONF_API_BASE) or DEFAULT_API_BASE
+        self.http = async_get_http_pool(hass).async_acquire(self._api_base)
+        self._released = False
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self.coalesce_stats: dict[str, int] = {"hits": 0, "misses": 0}
+        self.metrics = RequestMetrics()
+        self._login_task: asyncio.Task | None = None
+        self.retry_policy = RetryPolicy()
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._last_good: OrderedDict[tuple, dict] = OrderedDict()
+        self.response_cache = ResponseCache()
+        self._encrypted_password: tuple[str, str] | None = None
+        self._headers = {
+            "language": self.get_config(CONF_LANGUAGE, "en_US"),
+            **APP_HEADERS,
+        }
+        self.limiter = RequestLimiter(*self._limits())
 
     def get_config(self, key, default=None) -> str:
         """Return the config of the account."""
@@ -51,6 +102,26 @@ class Account:
         global_config = domain_data.get("config") or {}
         return global_config.get(key, default)
 
+    def update_config(self, config: dict) -> None:
+        """Update the config of the account, e.g. with changed options."""
+        self._config.update(config)
+        limits = self._limits()
+        if limits != (self.limiter.max_concurrent, self.limiter.rate):
+            self.limiter.configure(*limits)
+
+    def _limits(self) -> tuple[int, float]:
+        """Return the configured concurrency and rate limits of requests."""
+        return (
+            int(
+                self.get_config(
+                    CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+                )
+            ),
+            float(
+                self.get_config(CONF_REQUESTS_PER_SECOND, DEFAULT_REQUESTS_PER_SECOND)
+            ),
+        )
+
     @property
     def phone(self) -> str:
         """Return the phone of the account."""
@@ -60,9 +131,23 @@ class Account:
     def password(self) -> str:
         """Return the password of the account."""
         pwd = self._config.get(CONF_PASSWORD)
-        if len(pwd) <= 16:
-            pwd = self.encrypt_password(pwd)
-        return pwd
+        if len(pwd) > 16:
+            return pwd
+        cached = self._encrypted_password
+        if cached is None or cached[0] != pwd:
+            cached = self._encrypted_password = (pwd, self.encrypt_password(pwd))
+        return cached[1]
+
+    async def async_get_password(self) -> str:
+        """Return the encrypted password, encrypting it in the executor."""
+        pwd = self._config.get(CONF_PASSWORD)
+        cached = self._encrypted_password
+        if len(pwd) <= 16 and (cached is None or cached[0] != pwd):
+            self._encrypted_password = (
+                pwd,
+                await self.hass.async_add_executor_job(self.encrypt_password, pwd),
+            )
+        return self.password
 
     @property
     def uid(self):
@@ -84,6 +169,19 @@ class Account:
         )
         return Helper.calculate_update_interval(interval)
 
+    @property
+    def circuit_states(self) -> dict[str, str]:
+        """Return the circuit breaker state of every endpoint and device called so far."""
+        return {api: breaker.state for api, breaker in self._breakers.items()}
+
+    @callback
+    def async_release(self) -> None:
+        """Release the shared HTTP session once the account is no longer used."""
+        if self._released:
+            return
+        self._released = True
+        async_get_http_pool(self.hass).async_release(self._api_base)
+
     def api_url(self, api="") -> str:
         """Return the full url of the api."""
         if api[:6] == "https:" or api[:5] == "http:":
@@ -92,74 +190,214 @@ class Account:
         return f"{bas.rstrip('/')}/{api.lstrip('/')}"
 
     async def request(self, api, pms=None, method="GET", **kwargs) -> dict:
-        """Request the api."""
+        """Request the api, sharing one call between identical in-flight GETs."""
+        key = self._inflight_key(api, pms, method, kwargs)
+        if key is None:
+            return await self._request(api, pms, method, **kwargs)
+        task = self._inflight.get(key)
+        if task is None:
+            self.coalesce_stats["misses"] += 1
+            task = asyncio.ensure_future(self._request(api, pms, method, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._inflight_done, key))
+        else:
+            self.coalesce_stats["hits"] += 1
+            _LOGGER.debug("Coalesced in-flight request %s %s", method, api)
+        return await asyncio.shield(task)
+
+    async def cached_request(self, api, pms=None, ttl: float = 300) -> dict:
+        """GET the api, reusing a successful response for up to ttl seconds."""
+        key = self._inflight_key(api, pms, "GET", {})
+        rsp = self.response_cache.get(key)
+        if rsp is not None:
+            return rsp
+        rsp = await self.request(api, pms)
+        if rsp and rsp.get("returnCode", 0) == 0:
+            self.response_cache.set(key, rsp, ttl)
+        return rsp
+
+    @callback
+    def invalidate(self, api, pms=None) -> None:
+        """Forget cached responses of the api, or of the api with these params."""
+        params = None
+        if pms is not None:
+            params = self._inflight_key(api, pms, "GET", {})[1]
+        self.response_cache.invalidate(api, params)
+
+    @staticmethod
+    def _inflight_key(api, pms, method, kwargs) -> tuple | None:
+        """Return the coalescing key of a request, or None if it must not be shared."""
+        if kwargs or method.upper() != "GET":
+            return None
+        params = tuple(
+            sorted(
+                (k, f"{v}") for k, v in (pms or {}).items() if k not in VOLATILE_PARAMS
+            )
+        )
+        return (api, params)
+
+    def _inflight_done(self, key: tuple, task: asyncio.Future) -> None:
+        """Forget a finished in-flight request."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _request(self, api, pms=None, method="GET", **kwargs) -> dict:
+        """Request the api, re-logging in once if the token was rejected."""
+        retried = kwargs.pop("_retried", False)
         method = method.upper()
         url = self.api_url(api)
-        kws = {
-            "timeout": 60,
-            "headers": {
-                "language": self.get_config(CONF_LANGUAGE, "en_US"),
-                "User-Agent": "CATLINK/4.1.5 (iPhone; iOS 26.2.1; Scale/3.00)",
-                "app_version": "4.1.5",
-                "system_version": "26.2.1",
-                "token": self.token,
-            },
-        }
-        kws.update(kwargs)
-        if pms is None:
-            pms = {}
+        last_good_key = self._inflight_key(api, pms, method, kwargs)
+        # Writes bypass the breaker: a short-circuited write would look applied
+        breaker = self._breaker(api, pms) if method == "GET" else None
+        if breaker is not None and not breaker.allow():
+            _LOGGER.debug("Circuit for %s open, skipping %s request", api, method)
+            self.metrics.observe_short_circuit(api)
+            return self._last_good.get(last_good_key) or {}
+        sent_token = self.token
+        # Only idempotent reads are retried; a timed out write may have landed.
+        attempts = self.retry_policy.attempts if method == "GET" else 1
+        try:
+            for attempt in range(attempts):
+                req_method, kws = self._build_request(method, pms, sent_token)
+                kws.update(kwargs)
+                counter = kws["trace_request_ctx"] = ByteCounter()
+                started = time.perf_counter()
+                try:
+                    async with self.limiter.slot(url):
+                        started = time.perf_counter()
+                        req = await self.http.request(req_method, url, **kws)
+                        result = await req.json(loads=json_loads) or {}
+                    self.metrics.observe(
+                        api,
+                        time.perf_counter() - started,
+                        counter.bytes,
+                        result.get("returnCode", 0),
+                    )
+                    break
+                # ValueError covers bodies that are not JSON, e.g. a proxy error page
+                except (ClientError, ValueError, TimeoutError) as exc:  # noqa: UP041
+                    self.metrics.observe_failure(
+                        api,
+                        time.perf_counter() - started,
+                        isinstance(exc, TimeoutError),
+                    )
+                    if attempt + 1 >= attempts:
+                        if breaker is not None:
+                            breaker.record_failure()
+                        _LOGGER.error("Request api failed: %s", [method, url, pms, exc])
+                        return {}
+                    delay = self.retry_policy.delay(attempt)
+                    _LOGGER.debug(
+                        "Request %s %s failed (%s), retrying in %.2fs",
+                        method,
+                        api,
+                        exc,
+                        delay,
+                    )
+                    self.metrics.observe_retry(api)
+                    await asyncio.sleep(delay)
+        except BaseException:
+            # A probe ending any other way, e.g. cancelled, must not leave the
+            # breaker half-open, short-circuiting the api until restart
+            if breaker is not None and breaker.state == CircuitBreaker.HALF_OPEN:
+                breaker.record_failure()
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        _LOGGER.debug("API response %s %s: %s", method, api, result)
+        if last_good_key is not None and result.get("returnCode", 0) == 0:
+            self._last_good[last_good_key] = result
+            self._last_good.move_to_end(last_good_key)
+            while len(self._last_good) > LAST_GOOD_ENTRIES:
+                self._last_good.popitem(last=False)
+
+        # Handle token expiration (1002: Illegal token)
+        if result.get("returnCode") == 1002 and not retried:
+            if self.token and self.token != sent_token:
+                # Another request already renewed the token while this one was in flight
+                _LOGGER.debug("Replaying %s %s with renewed token", method, api)
+            else:
+                _LOGGER.info(
+                    "Token expired (1002), attempting re-login for %s", self.phone
+                )
+                if not await self.async_login():
+                    return result
+            return await self._request(api, pms, method, _retried=True, **kwargs)
+        return result
+
+    def _breaker(self, api, pms) -> CircuitBreaker:
+        """Return the circuit breaker of the api, per device for device calls."""
+        name = api
+        if device_id := (pms or {}).get("deviceId"):
+            # One offline device must not open the circuit of its siblings
+            name = f"{api}:{device_id}"
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = CircuitBreaker(name)
+        return breaker
+
+    def _build_request(self, method: str, pms: dict | None, token: str):
+        """Return the http method and aiohttp kwargs of a signed api call."""
+        pms = dict(pms) if pms else {}
         pms["noncestr"] = int(time.time() * 1000)
-        if self.token:
-            pms[CONF_TOKEN] = self.token
+        if token:
+            pms[CONF_TOKEN] = token
         pms["sign"] = self.params_sign(pms)
-        if method in ["GET"]:
+        kws = {"timeout": 60, "headers": {**self._headers, "token": token}}
+        if method == "GET":
             kws["params"] = pms
-        elif method in ["POST_GET"]:
+        elif method == "POST_GET":
             method = "POST"
             kws["params"] = pms
         else:
             kws["data"] = pms
-        try:
-            req = await self.http.request(method, url, **kws)
-            result = await req.json() or {}
-            _LOGGER.debug("API response %s %s: %s", method, api, result)
-            
-            # Handle token expiration (1002: Illegal token)
-            if result.get("returnCode") == 1002 and not kwargs.get("_retried"):
-                _LOGGER.info("Token expired (1002), attempting re-login for %s", self.phone)
-                if await self.async_login():
-                    kwargs["_retried"] = True
-                    return await self.request(api, pms, method, **kwargs)
-            
-            return result
-        except (ClientConnectorError, TimeoutError) as exc:  # noqa: UP041
-            _LOGGER.error("Request api failed: %s", [method, url, pms, exc])
-        return {}
-
-    async def async_login(self) -> bool:
+        return method, kws
+
+    async def async_login(self, save_auth: bool = True) -> bool:
+        """Login the account, sharing one login between concurrent callers.
+
+        With save_auth False the token is not persisted to the auth store.
+        """
+        if self._login_task is None or self._login_task.done():
+            self._login_task = asyncio.ensure_future(self._async_login(save_auth))
+        else:
+            _LOGGER.debug("Waiting for in-flight login of %s", self.phone)
+        return await asyncio.shield(self._login_task)
+
+    async def async_cancel_login(self) -> None:
+        """Cancel an in-flight login and wait for it to stop."""
+        task = self._login_task
+        if task is None or task.done():
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    async def _async_login(self, save_auth: bool = True) -> bool:
         """Login the account."""
         pms = {
             "platform": "ANDROID",
             "internationalCode": self._config.get(CONF_PHONE_IAC),
             "mobile": str(self.phone),
-            "password": self.password,
+            "password": await self.async_get_password(),
         }
         self._config.update(
             {
                 CONF_TOKEN: None,
             }
         )
-        rsp = await self.request("login/password", pms, "POST")
+        rsp = await self.request("login/password", pms, "POST", _retried=True)
         tok = rsp.get("data", {}).get("token")
         if not tok:
-            _LOGGER.error("Login %s failed: %s", self.phone, [rsp, pms])
+            _LOGGER.error("Login %s failed: %s", self.phone, rsp)
             return False
         self._config.update(
             {
                 CONF_TOKEN: tok,
             }
         )
-        await self.async_check_auth(True)
+        if save_auth:
+            await self.async_check_auth(True)
         return True
 
     async def async_check_auth(self, save=False) -> dict:
@@ -195,10 +433,6 @@ class Account:
                 return []
         api = "token/device/union/list/sorted"
         rsp = await self.request(api, {"type": "NONE"})
-        eno = rsp.get("returnCode", 0)
-        if eno == 1002:  # Illegal token
-            if await self.async_login():
-                rsp = await self.request(api, {"type": "NONE"})
         dls = rsp.get("data", {}).get(CONF_DEVICES) or []
         if not dls:
             _LOGGER.warning("Got devices for %s failed: %s", self.phone, rsp)
@@ -214,10 +448,6 @@ class Account:
         if timezone_id:
             params["timezoneId"] = timezone_id
         rsp = await self.request(api, params)
-        eno = rsp.get("returnCode", 0)
-        if eno == 1002:  # Illegal token
-            if await self.async_login():
-                rsp = await self.request(api, params)
         cats = rsp.get("data", {}).get("cats") or []
         if not cats:
             _LOGGER.warning("Got cats for %s failed: %s", self.phone, rsp)
@@ -243,21 +473,13 @@ class Account:
         if timezone_id:
             params["timezoneId"] = timezone_id
         rsp = await self.request(api, params)
-        eno = rsp.get("returnCode", 0)
-        if eno == 1002:  # Illegal token
-            if await self.async_login():
-                rsp = await self.request(api, params)
         return rsp.get("data") or {}
 
     @staticmethod
     def params_sign(pms: dict) -> str:
         """Sign the params."""
-        lst = list(pms.items())
-        lst.sort()
-        pms = [f"{k}={v}" for k, v in lst]
-        pms.append(f"key={SIGN_KEY}")
-        pms = "&".join(pms)
-        return hashlib.md5(pms.encode()).hexdigest().upper()
+        raw = "&".join([f"{k}={pms[k]}" for k in sorted(pms)]) + SIGN_SUFFIX
+        return hashlib.md5(raw.encode()).hexdigest().upper()
 
     @staticmethod
     def encrypt_password(pwd) -> str:
@@ -265,8 +487,5 @@ class Account:
         pwd = f"{pwd}"
         md5 = hashlib.md5(pwd.encode()).hexdigest().lower()
         sha = hashlib.sha1(md5.encode()).hexdigest().upper()
-        pub = serialization.load_der_public_key(
-            base64.b64decode(RSA_PUBLIC_KEY), default_backend()
-        )
         pad = padding.PKCS1v15()
-        return base64.b64encode(pub.encrypt(sha.encode(), pad)).decode()
+        return base64.b64encode(rsa_public_key().encrypt(sha.encode(), pad)).decode()
@@ -1,17 +1,40 @@
 """The component."""
 
 import asyncio
+from contextlib import ExitStack
+import time
 
 from homeassistant.const import CONF_DEVICES
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.json import json_dumps_sorted
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 from .account import Account
-from ..const import _LOGGER, CONF_DEVICE_IDS, DOMAIN, SUPPORTED_DOMAINS
+from .entity_demand import EntityDemand
+from .logs_scheduler import LogsScheduler
+from .poll_scheduler import TIER_FAST, TIER_NORMAL, PollScheduler
+from .snapshot import DeviceSnapshot
+from .weight_history import WeightHistory
+from ..const import (
+    _LOGGER,
+    CONF_CHANGE_DETECTION,
+    CONF_DEVICE_IDS,
+    CONF_MAX_DETAIL_STALENESS,
+    CONF_REFRESH_DEADLINE,
+    DEFAULT_MAX_DETAIL_STALENESS,
+    DEFAULT_REFRESH_DEADLINE,
+    DOMAIN,
+    SUPPORTED_DOMAINS,
+)
 from ..devices.registry import create_device
 from ..entities.registry import DOMAIN_ENTITY_CLASSES
 from ..models.additional_cfg import AdditionalDeviceConfig
 
+# Devices refreshed at once; the account's request limiter still caps HTTP calls
+REFRESH_WORKERS = 8
+
 
 class DevicesCoordinator(DataUpdateCoordinator):
     """Devices Coordinator for CatLink integration."""
@@ -32,15 +55,189 @@ class DevicesCoordinator(DataUpdateCoordinator):
         self.account = account
         self.config_entry_id = config_entry_id
         self._subs = {}
+        # Entity keys already created per (device id, domain)
+        self._created: dict[tuple[str, str], set[str]] = {}
         self._device_ids = device_ids
         self.additional_config = self.hass.data[DOMAIN]["config"].get(CONF_DEVICES, {})
         self.additional_config = [
             AdditionalDeviceConfig(**cfg) for cfg in self.additional_config
         ]
+        self._apply_refresh_options()
+        self.scheduler = PollScheduler(account.update_interval)
+        self.logs_scheduler = LogsScheduler(self.hass, f"{self.name}-logs")
+        self.demand = EntityDemand(self.hass)
+        self.weight_history = WeightHistory(self.hass, config_entry_id)
+        self.snapshot = DeviceSnapshot(self.hass, config_entry_id, self.entry_devices)
+        self._fingerprints: dict[str, str] = {}
+        self._detail_fetched_at: dict[str, float] = {}
+        # Device fetches that overran a refresh deadline and are still running
+        self._stragglers: dict[str, asyncio.Task] = {}
+        self.stage_timings: dict[str, float] = {}
+        # Unfiltered device list of the last refresh, for the options form
+        self.device_list: list[dict] = []
+
+    def _apply_refresh_options(self) -> None:
+        """Read the refresh options from the account config."""
+        account = self.account
+        self.change_detection = bool(account.get_config(CONF_CHANGE_DETECTION, False))
+        self.max_detail_staleness = account.get_config(
+            CONF_MAX_DETAIL_STALENESS, DEFAULT_MAX_DETAIL_STALENESS
+        )
+        self.refresh_deadline = account.get_config(
+            CONF_REFRESH_DEADLINE, DEFAULT_REFRESH_DEADLINE
+        )
+
+    def entry_devices(self) -> list:
+        """Return the devices, cats included, of this coordinator."""
+        return [
+            dvc
+            for dvc in self.hass.data[DOMAIN][CONF_DEVICES].values()
+            if dvc.coordinator is self
+        ]
+
+    def _additional_config(self, mac: str | None) -> AdditionalDeviceConfig | None:
+        """Return the YAML device config matching a mac."""
+        return next(
+            (cfg for cfg in self.additional_config if cfg.mac == mac),
+            None,
+        )
+
+    async def async_restore_snapshot(self) -> bool:
+        """Create devices from the last snapshot, returning whether any were restored."""
+        await self.weight_history.async_load()
+        devices = self.hass.data[DOMAIN][CONF_DEVICES]
+        restored = 0
+        for snap in await self.snapshot.async_load():
+            dat = snap["data"]
+            did = dat.get("id")
+            if not did or did in devices:
+                continue
+            if (
+                self._device_ids is not None
+                and dat.get("deviceType") != "CAT"
+                and did not in self._device_ids
+            ):
+                continue
+            dvc = create_device(dat, self, self._additional_config(dat.get("mac")))
+            dvc.restore(snap)
+            devices[did] = dvc
+            restored += 1
+        if not restored:
+            return False
+        _LOGGER.debug("Restored %s devices of %s from snapshot", restored, self.name)
+        self.data = devices
+        return True
 
     async def _async_update_data(self) -> dict:
-        """Update data via API."""
+        """Update data via API: list, fan out devices and cats, then publish."""
+        await self.weight_history.async_load()
+        now = time.monotonic()
+        started = time.perf_counter()
+        timings: dict[str, float] = {}
         dls = await self.account.get_devices()
+        if dls:
+            self.device_list = dls
+        timings["list"] = time.perf_counter() - started
+
+        # Entities of a device are notified once, when the cycle is published
+        with ExitStack() as batch:
+            devices, pending = self._ingest_devices(dls, now, batch)
+            _, cat_devices = await asyncio.gather(
+                self._timed(
+                    timings,
+                    "devices",
+                    self._async_refresh_devices(pending, now, started),
+                ),
+                self._timed(timings, "cats", self._async_refresh_cats(now, batch)),
+            )
+
+            publish_start = time.perf_counter()
+            for dvc in (*devices, *cat_devices):
+                for d in SUPPORTED_DOMAINS:
+                    await self.update_hass_entities(d, dvc)
+        timings["publish"] = time.perf_counter() - publish_start
+        timings["total"] = time.perf_counter() - started
+        self.stage_timings = timings
+        _LOGGER.debug(
+            "Refreshed %s: %s devices (%s fetched), %s cats in %s",
+            self.name,
+            len(devices),
+            len(pending),
+            len(cat_devices),
+            {k: round(v, 3) for k, v in timings.items()},
+        )
+        self.update_interval = self.scheduler.next_interval(now)
+        self.snapshot.async_schedule_save()
+        return self.hass.data[DOMAIN][CONF_DEVICES]
+
+    async def async_update_options(self, options: dict) -> None:
+        """Apply changed options and device selection without a reload."""
+        self.account.update_config(options)
+        self._apply_refresh_options()
+        self.scheduler.set_interval(self.account.update_interval, time.monotonic())
+        device_ids = options.get(CONF_DEVICE_IDS)
+        if device_ids is not None:
+            for dvc in self.entry_devices():
+                if dvc.type != "CAT" and dvc.id not in device_ids:
+                    self._remove_device(dvc)
+        self._device_ids = device_ids
+        # Fetches newly selected devices and re-arms the timer
+        await self.async_request_refresh()
+
+    @callback
+    def async_note_action(self, dvc) -> None:
+        """Poll a device on the fast tier right after a user action."""
+        now = time.monotonic()
+        self.scheduler.schedule(dvc.id, TIER_FAST, now)
+        interval = self.scheduler.next_interval(now)
+        if self.update_interval is None or interval < self.update_interval:
+            # Re-arm the timer, which still counts down the longer interval
+            self.update_interval = interval
+            self._schedule_refresh()
+
+    def _remove_device(self, dvc) -> None:
+        """Forget a device that is no longer selected, with its entities."""
+        _LOGGER.info("Device %s deselected, removing its entities", dvc.name)
+        self.hass.data[DOMAIN][CONF_DEVICES].pop(dvc.id, None)
+        self.logs_scheduler.async_unregister(dvc.id)
+        self.scheduler.forget(dvc.id)
+        self._fingerprints.pop(dvc.id, None)
+        self._detail_fetched_at.pop(dvc.id, None)
+        if task := self._stragglers.pop(dvc.id, None):
+            task.cancel()
+        for domain in SUPPORTED_DOMAINS:
+            self._created.pop((dvc.id, domain), None)
+        ent_reg = er.async_get(self.hass)
+        for key in [k for k in self._subs if k.endswith(f".{dvc.id}")]:
+            entity = self._subs.pop(key)
+            if entity.entity_id and ent_reg.async_get(entity.entity_id):
+                ent_reg.async_remove(entity.entity_id)
+            elif entity.hass is not None:
+                self.hass.async_create_task(entity.async_remove())
+        dev_reg = dr.async_get(self.hass)
+        device = dev_reg.async_get_device(
+            identifiers={(DOMAIN, f"{dvc.type}_{dvc.mac}")}
+        )
+        if device is not None:
+            dev_reg.async_update_device(
+                device.id, remove_config_entry_id=self.config_entry_id
+            )
+
+    @staticmethod
+    async def _timed(timings: dict[str, float], stage: str, coro):
+        """Await a stage and record how long it took."""
+        start = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            timings[stage] = time.perf_counter() - start
+
+    def _ingest_devices(
+        self, dls: list, now: float, batch: ExitStack
+    ) -> tuple[list, list]:
+        """Create or update devices from the list, returning them and those to fetch."""
+        devices = []
+        pending = []
         for dat in dls:
             did = dat.get("id")
             if not did:
@@ -52,20 +249,108 @@ class DevicesCoordinator(DataUpdateCoordinator):
                     did,
                 )
                 continue
-            additional_config = next(
-                (cfg for cfg in self.additional_config if cfg.mac == dat.get("mac")),
-                None,
-            )
+            additional_config = self._additional_config(dat.get("mac"))
             old = self.hass.data[DOMAIN][CONF_DEVICES].get(did)
             if old:
                 dvc = old
+                batch.enter_context(dvc.batch_updates())
                 dvc.update_data(dat)
             else:
                 dvc = create_device(dat, self, additional_config)
+                batch.enter_context(dvc.batch_updates())
                 self.hass.data[DOMAIN][CONF_DEVICES][did] = dvc
-            await dvc.async_init()
-            for d in SUPPORTED_DOMAINS:
-                await self.update_hass_entities(d, dvc)
+            devices.append(dvc)
+            if self._should_fetch_detail(dvc, dat, now):
+                pending.append(dvc)
+            else:
+                _LOGGER.debug("Device %s not due, detail skipped", did)
+        return devices, pending
+
+    async def _async_refresh_devices(
+        self, devices: list, now: float, started: float
+    ) -> None:
+        """Fetch detail, logs and extras of the devices with bounded concurrency.
+
+        Fetches still running when the refresh deadline passes are left to
+        finish in the background; their devices serve the last detail,
+        marked stale, until a fetch brings a new one.
+        """
+        sem = asyncio.Semaphore(REFRESH_WORKERS)
+
+        async def _refresh(dvc) -> bool:
+            """Fetch the device, returning whether a new detail was received."""
+            detail_at = dvc.detail_at
+            async with sem:
+                await dvc.async_init()
+            if dvc.detail_at == detail_at:
+                return False
+            # Only a new detail lets change detection skip the device later
+            self._detail_fetched_at[dvc.id] = now
+            return True
+
+        tasks = {
+            self.hass.async_create_background_task(
+                _refresh(dvc), f"{self.name}-refresh-{dvc.id}"
+            ): dvc
+            for dvc in devices
+            if dvc.id not in self._stragglers
+        }
+        if tasks:
+            timeout = max(
+                self.refresh_deadline - (time.perf_counter() - started), 0
+            )
+            _, running = await asyncio.wait(tasks, timeout=timeout)
+        else:
+            running = set()
+        for task, dvc in tasks.items():
+            if task in running:
+                _LOGGER.warning(
+                    "Refresh of device %s overran the %ss deadline, "
+                    "serving its last detail until it completes",
+                    dvc.id,
+                    self.refresh_deadline,
+                )
+                self._stragglers[dvc.id] = task
+                dvc.set_stale(True)
+                task.add_done_callback(
+                    lambda t, dvc=dvc: self._straggler_done(dvc, t)
+                )
+                continue
+            if task.cancelled():
+                continue
+            if exc := task.exception():
+                _LOGGER.error("Refresh of device %s failed: %s", dvc.id, exc)
+            elif task.result():
+                dvc.set_stale(False)
+        # Re-plan every fetched device, including those fetched early because
+        # their list entry changed, so a device that starts running goes fast
+        for dvc in tasks.values():
+            self.scheduler.schedule(dvc.id, self.scheduler.tier(dvc), now)
+
+    @callback
+    def _straggler_done(self, dvc, task: asyncio.Task) -> None:
+        """Clear the stale mark of a device once its overrunning fetch succeeds."""
+        if self._stragglers.get(dvc.id) is task:
+            del self._stragglers[dvc.id]
+        if task.cancelled():
+            return
+        if exc := task.exception():
+            _LOGGER.error("Refresh of device %s failed: %s", dvc.id, exc)
+        elif task.result():
+            dvc.set_stale(False)
+
+    @callback
+    def async_cancel_stragglers(self) -> None:
+        """Cancel device fetches still running past a refresh deadline."""
+        for task in self._stragglers.values():
+            task.cancel()
+        self._stragglers.clear()
+
+    async def _async_refresh_cats(self, now: float, batch: ExitStack) -> list:
+        """Fetch cats and their daily summaries, returning the cat devices."""
+        if not self.scheduler.due("cats", now):
+            return []
+        self.scheduler.schedule("cats", TIER_NORMAL, now)
         cats = await self.account.get_cats(self.hass.config.time_zone)
         if cats:
             timezone_id = self.hass.config.time_zone
@@ -88,6 +373,7 @@ class DevicesCoordinator(DataUpdateCoordinator):
             for cat, summary in zip(cats, summaries, strict=False)
             if cat.get("id")
         }
+        cat_devices = []
         for cat in cats:
             pet_id = cat.get("id")
             if not pet_id:
@@ -104,35 +390,55 @@ class DevicesCoordinator(DataUpdateCoordinator):
             old = self.hass.data[DOMAIN][CONF_DEVICES].get(did)
             if old:
                 dvc = old
+                batch.enter_context(dvc.batch_updates())
                 dvc.update_data(cat_data)
             else:
                 dvc = create_device(cat_data, self, None)
+                batch.enter_context(dvc.batch_updates())
                 self.hass.data[DOMAIN][CONF_DEVICES][did] = dvc
             await dvc.async_init()
-            for d in SUPPORTED_DOMAINS:
-                await self.update_hass_entities(d, dvc)
-        return self.hass.data[DOMAIN][CONF_DEVICES]
+            cat_devices.append(dvc)
+        return cat_devices
+
+    def _should_fetch_detail(self, dvc, dat: dict, now: float) -> bool:
+        """Return whether the device detail needs fetching this cycle."""
+        fingerprint = json_dumps_sorted(dat)
+        changed = self._fingerprints.get(dvc.id) != fingerprint
+        self._fingerprints[dvc.id] = fingerprint
+        if changed:
+            return True
+        if not self.scheduler.due(dvc.id, now):
+            return False
+        if not self.change_detection or not dvc.idle:
+            return True
+        fetched_at = self._detail_fetched_at.get(dvc.id)
+        return fetched_at is None or now - fetched_at >= self.max_detail_staleness
 
     async def update_hass_entities(self, domain, dvc) -> None:
         """Update Home Assistant entities."""
         hdk = f"hass_{domain}"
         add_entities = self.hass.data[DOMAIN].get("add_entities", {})
         add = add_entities.get(self.config_entry_id, {}).get(domain)
-        if not add or not hasattr(dvc, hdk):
+        if not add:
+            return
+        keys = dvc.entity_keys(domain)
+        created = self._created.setdefault((dvc.id, domain), set())
+        if not keys or created.issuperset(keys):
             return
         added_entity_ids: list[str] = []
         entity_cls = DOMAIN_ENTITY_CLASSES.get(domain)
-        for k, cfg in getattr(dvc, hdk).items():
+        descriptors = getattr(dvc, hdk)
+        for k in keys:
+            if k in created:
+                continue
+            created.add(k)
             key = f"{domain}.{k}.{dvc.id}"
-            new = None
-            if key in self._subs:
-                pass
-            elif entity_cls is not None:
-                new = entity_cls(k, dvc, cfg)
-            if new:
-                self._subs[key] = new
-                add([new])
-                added_entity_ids.append(new.entity_id)
+            if key in self._subs or entity_cls is None:
+                continue
+            new = entity_cls(k, dvc, descriptors[k])
+            self._subs[key] = new
+            add([new])
+            added_entity_ids.append(new.entity_id)
         if added_entity_ids:
             _LOGGER.info(
                 "Device %s entities: %s",
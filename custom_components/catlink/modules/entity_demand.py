@@ -0,0 +1,95 @@
+"""Demand for device endpoints from enabled CatLink entities."""
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from ..const import DOMAIN, SUPPORTED_DOMAINS
+
+if TYPE_CHECKING:
+    from ..devices.base import Device
+
+# Pseudo endpoint of the device logs, whatever API a device fetches them from
+LOGS = "logs"
+
+
+class EntityDemand:
+    """Tell which device endpoints feed at least one enabled entity.
+
+    Devices map entity keys to the endpoints they read (ENTITY_ENDPOINTS).
+    An endpoint whose consumers are all disabled in the entity registry, or
+    not registered yet and disabled by default, is not in demand; endpoints
+    no entity claims always are. The answer is cached per device until the
+    registry changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the demand tracker."""
+        self.hass = hass
+        # Endpoints not in demand per device id
+        self._idle: dict[str, frozenset[str]] = {}
+
+    @callback
+    def async_setup(self) -> CALLBACK_TYPE:
+        """Follow entity registry changes, returning the unsubscribe callback."""
+        return self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_registry_updated,
+            event_filter=self._registry_event_filter,
+        )
+
+    @staticmethod
+    @callback
+    def _registry_event_filter(event_data: er.EventEntityRegistryUpdatedData) -> bool:
+        """Return whether a registry change may change the demand."""
+        return (
+            event_data["action"] != "update" or "disabled_by" in event_data["changes"]
+        )
+
+    @callback
+    def _async_registry_updated(
+        self, _event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Recompute the demand of every device on next use."""
+        self._idle.clear()
+
+    def wants(self, dvc: "Device", endpoint: str) -> bool:
+        """Return whether the endpoint feeds an enabled entity of the device."""
+        idle = self._idle.get(dvc.id)
+        if idle is None:
+            idle = self._idle[dvc.id] = self._idle_endpoints(dvc)
+        return endpoint not in idle
+
+    def _idle_endpoints(self, dvc: "Device") -> frozenset[str]:
+        """Return the endpoints of the device whose entities are all disabled."""
+        ent_reg = er.async_get(self.hass)
+        enabled: dict[str, bool] = {}
+        for domain in SUPPORTED_DOMAINS:
+            keys = [k for k in dvc.entity_keys(domain) if k in dvc.ENTITY_ENDPOINTS]
+            if not keys:
+                continue
+            descriptors = getattr(dvc, f"hass_{domain}")
+            for key in keys:
+                default = descriptors[key].get("enabled_default", True)
+                on = self._entity_enabled(ent_reg, domain, dvc, key, default)
+                for endpoint in dvc.ENTITY_ENDPOINTS[key]:
+                    enabled[endpoint] = enabled.get(endpoint, False) or on
+        return frozenset(endpoint for endpoint, on in enabled.items() if not on)
+
+    @staticmethod
+    def _entity_enabled(
+        ent_reg: er.EntityRegistry,
+        domain: str,
+        dvc: "Device",
+        key: str,
+        default: bool,
+    ) -> bool:
+        """Return whether an entity is enabled, or will be once registered."""
+        # Same unique id as CatlinkEntity
+        unique_id = f"{dvc.type}_{dvc.mac}-{key}"
+        entity_id = ent_reg.async_get_entity_id(domain, DOMAIN, unique_id)
+        if entity_id is None:
+            return default
+        entry = ent_reg.async_get(entity_id)
+        return entry is None or not entry.disabled
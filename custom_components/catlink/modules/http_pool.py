@@ -0,0 +1,116 @@
+"""Shared HTTP sessions for the CatLink API."""
+
+import asyncio
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util import ssl as ssl_util
+
+from ..const import _LOGGER, DOMAIN
+from .metrics import byte_count_trace_config
+
+DATA_HTTP_POOL = f"{DOMAIN}_http_pool"
+
+# Connector tuning for a handful of accounts talking to one API host
+POOL_LIMIT = 32
+POOL_LIMIT_PER_HOST = 16
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 75
+WARM_UP_TIMEOUT = ClientTimeout(total=10)
+
+
+@singleton(DATA_HTTP_POOL)
+@callback
+def async_get_http_pool(hass: HomeAssistant) -> "HttpPool":
+    """Return the HTTP pool shared by all CatLink accounts."""
+    pool = HttpPool(hass)
+
+    async def _async_close(event: Event) -> None:
+        await pool.async_close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return pool
+
+
+def _pool_key(api_base: str) -> str:
+    """Return the pool key of an API base."""
+    return api_base.rstrip("/")
+
+
+class HttpPool:
+    """One tuned aiohttp session per API base, shared by accounts on it."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the pool."""
+        self.hass = hass
+        self._sessions: dict[str, ClientSession] = {}
+        self._refs: dict[str, int] = {}
+        self._warmed: set[str] = set()
+
+    def _create_session(self) -> ClientSession:
+        """Create a session with its own keep-alive connector."""
+        connector = TCPConnector(
+            limit=POOL_LIMIT,
+            limit_per_host=POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ssl=ssl_util.client_context(
+                ssl_util.SSLCipherList.PYTHON_DEFAULT, ssl_util.SSL_ALPN_HTTP11
+            ),
+        )
+        return ClientSession(
+            connector=connector, trace_configs=[byte_count_trace_config()]
+        )
+
+    @callback
+    def async_acquire(self, api_base: str) -> ClientSession:
+        """Return the session of an API base, adding a reference to it."""
+        key = _pool_key(api_base)
+        session = self._sessions.get(key)
+        if session is None or session.closed:
+            session = self._sessions[key] = self._create_session()
+            self._warmed.discard(key)
+        self._refs[key] = self._refs.get(key, 0) + 1
+        return session
+
+    @callback
+    def async_release(self, api_base: str) -> None:
+        """Drop a reference to a session, closing it when unused."""
+        key = _pool_key(api_base)
+        refs = self._refs.get(key, 0) - 1
+        if refs > 0:
+            self._refs[key] = refs
+            return
+        self._refs.pop(key, None)
+        self._warmed.discard(key)
+        if session := self._sessions.pop(key, None):
+            self.hass.async_create_background_task(
+                session.close(), f"{DOMAIN}_close_session"
+            )
+
+    async def async_warm_up(self, api_base: str) -> None:
+        """Open a connection to the API base so the TLS handshake is done early."""
+        key = _pool_key(api_base)
+        session = self._sessions.get(key)
+        if session is None or key in self._warmed:
+            return
+        self._warmed.add(key)
+        try:
+            async with session.head(f"{key}/", timeout=WARM_UP_TIMEOUT) as rsp:
+                _LOGGER.debug("Warmed up connection to %s: %s", key, rsp.status)
+        except (ClientError, asyncio.TimeoutError) as exc:  # noqa: UP041
+            self._warmed.discard(key)
+            _LOGGER.debug("Warm-up of %s failed: %s", key, exc)
+
+    async def async_close(self) -> None:
+        """Close every session."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        self._refs.clear()
+        self._warmed.clear()
+        for session in sessions:
+            await session.close()
+
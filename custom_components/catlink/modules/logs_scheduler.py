@@ -0,0 +1,83 @@
+"""Shared log polling for CatLink devices."""
+
+import asyncio
+import datetime
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from ..const import _LOGGER
+
+if TYPE_CHECKING:
+    from ..devices.mixins.logs import LogsMixin
+
+LOGS_UPDATE_INTERVAL = datetime.timedelta(minutes=1)
+
+
+class LogsScheduler:
+    """Fetch the logs of every registered device of one account on one timer."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        update_interval: datetime.timedelta = LOGS_UPDATE_INTERVAL,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.name = name
+        self.update_interval = update_interval
+        self._devices: dict[str, LogsMixin] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self._running = False
+
+    @property
+    def device_ids(self) -> list[str]:
+        """Return the ids of the registered devices."""
+        return list(self._devices)
+
+    @callback
+    def async_register(self, dvc: "LogsMixin") -> bool:
+        """Register a device, returning True if it was not registered yet."""
+        if self._devices.get(dvc.id) is dvc:
+            return False
+        self._devices[dvc.id] = dvc
+        if self._unsub is None:
+            self._unsub = async_track_time_interval(
+                self.hass,
+                self._async_refresh,
+                self.update_interval,
+                name=self.name,
+                cancel_on_shutdown=True,
+            )
+        return True
+
+    @callback
+    def async_unregister(self, device_id: str) -> None:
+        """Stop fetching the logs of a device."""
+        self._devices.pop(device_id, None)
+
+    async def _async_refresh(self, _now: datetime.datetime | None = None) -> None:
+        """Fetch the logs of all registered devices."""
+        if self._running or not self._devices:
+            return
+        self._running = True
+        try:
+            devices = [dvc for dvc in self._devices.values() if dvc.logs_wanted]
+            results = await asyncio.gather(
+                *(dvc.update_logs() for dvc in devices), return_exceptions=True
+            )
+        finally:
+            self._running = False
+        for dvc, result in zip(devices, results, strict=True):
+            if isinstance(result, Exception):
+                _LOGGER.error("Update logs for %s failed: %s", dvc.name, result)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the timer and forget all devices."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._devices.clear()
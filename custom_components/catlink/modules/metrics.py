@@ -0,0 +1,206 @@
+"""Request metrics for the CatLink API."""
+
+from bisect import bisect_left
+from collections import Counter
+from types import SimpleNamespace
+
+from aiohttp import ClientSession, TraceConfig, TraceResponseChunkReceivedParams
+
+# Upper bounds of the latency buckets, in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+RETURN_CODE_TOKEN_EXPIRED = 1002
+
+
+class ByteCounter:
+    """Count the response bytes of one request, fed by the session trace."""
+
+    __slots__ = ("bytes",)
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self.bytes = 0
+
+
+async def _on_response_chunk(
+    session: ClientSession,
+    trace_config_ctx: SimpleNamespace,
+    params: TraceResponseChunkReceivedParams,
+) -> None:
+    """Add a received chunk to the request's byte counter."""
+    counter = trace_config_ctx.trace_request_ctx
+    if isinstance(counter, ByteCounter):
+        counter.bytes += len(params.chunk)
+
+
+def byte_count_trace_config() -> TraceConfig:
+    """Return a trace config counting response bytes into ByteCounter contexts."""
+    trace_config = TraceConfig()
+    trace_config.on_response_chunk_received.append(_on_response_chunk)
+    return trace_config
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Return seconds as rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram."""
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Initialize an empty histogram."""
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one latency."""
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the observations of another histogram with the same buckets."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> float | None:
+        """Return the q-th percentile, interpolated within its bucket."""
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for idx, count in enumerate(self.counts):
+            if not count or seen + count < rank:
+                seen += count
+                continue
+            lower = self.bounds[idx - 1] if idx else 0.0
+            upper = self.bounds[idx] if idx < len(self.bounds) else self.max
+            value = lower + (upper - lower) * (rank - seen) / count
+            return min(value, self.max)
+        return self.max
+
+    def as_dict(self) -> dict:
+        """Return a summary in milliseconds."""
+        summary = {
+            "count": self.count,
+            "avg_ms": _ms(self.total / self.count) if self.count else None,
+            "max_ms": _ms(self.max),
+        }
+        for q in (50, 95, 99):
+            summary[f"p{q}_ms"] = _ms(self.percentile(q))
+        return summary
+
+
+class EndpointMetrics:
+    """Counters of one API endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.requests = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.retries = 0
+        self.short_circuits = 0
+        self.bytes = 0
+        self.return_codes: Counter[int] = Counter()
+        self.latency = LatencyHistogram()
+
+    @property
+    def errors(self) -> int:
+        """Return failed calls plus responses with a non-zero returnCode."""
+        return self.failures + sum(
+            n for code, n in self.return_codes.items() if code != 0
+        )
+
+    def as_dict(self) -> dict:
+        """Return the counters."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "short_circuits": self.short_circuits,
+            "bytes": self.bytes,
+            "return_codes": {str(k): v for k, v in sorted(self.return_codes.items())},
+            "latency": self.latency.as_dict(),
+        }
+
+
+class RequestMetrics:
+    """Per-endpoint request metrics of an account."""
+
+    def __init__(self) -> None:
+        """Initialize without endpoints."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def endpoint(self, api: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint, creating them."""
+        metrics = self.endpoints.get(api)
+        if metrics is None:
+            metrics = self.endpoints[api] = EndpointMetrics()
+        return metrics
+
+    def observe(self, api: str, seconds: float, nbytes: int, return_code) -> None:
+        """Record a call that got a response."""
+        metrics = self.endpoint(api)
+        metrics.requests += 1
+        metrics.bytes += nbytes
+        metrics.latency.observe(seconds)
+        try:
+            metrics.return_codes[int(return_code or 0)] += 1
+        except (TypeError, ValueError):
+            metrics.return_codes[-1] += 1
+
+    def observe_failure(self, api: str, seconds: float, timeout: bool) -> None:
+        """Record a call that failed before a response arrived."""
+        metrics = self.endpoint(api)
+        metrics.requests += 1
+        metrics.failures += 1
+        metrics.timeouts += int(timeout)
+        metrics.latency.observe(seconds)
+
+    def observe_retry(self, api: str) -> None:
+        """Record a retry of a failed call."""
+        self.endpoint(api).retries += 1
+
+    def observe_short_circuit(self, api: str) -> None:
+        """Record a call skipped by an open circuit."""
+        self.endpoint(api).short_circuits += 1
+
+    def totals(self) -> dict:
+        """Return the counters summed over all endpoints."""
+        latency = LatencyHistogram()
+        totals = Counter()
+        for metrics in self.endpoints.values():
+            latency.merge(metrics.latency)
+            totals["requests"] += metrics.requests
+            totals["errors"] += metrics.errors
+            totals["timeouts"] += metrics.timeouts
+            totals["retries"] += metrics.retries
+            totals["bytes"] += metrics.bytes
+            totals["token_expired"] += metrics.return_codes[RETURN_CODE_TOKEN_EXPIRED]
+        return {
+            "requests": totals["requests"],
+            "errors": totals["errors"],
+            "timeouts": totals["timeouts"],
+            "retries": totals["retries"],
+            "bytes": totals["bytes"],
+            "token_expired": totals["token_expired"],
+            "latency": latency.as_dict(),
+        }
+
+    def as_dict(self) -> dict:
+        """Return the totals and per-endpoint counters."""
+        return {
+            "totals": self.totals(),
+            "endpoints": {
+                api: metrics.as_dict() for api, metrics in sorted(self.endpoints.items())
+            },
+        }
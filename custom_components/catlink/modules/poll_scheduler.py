@@ -0,0 +1,74 @@
+"""Per-device poll scheduling for CatLink."""
+
+from datetime import timedelta
+
+FAST_POLL_INTERVAL = timedelta(seconds=15)
+MIN_SLOW_POLL_INTERVAL = timedelta(minutes=5)
+# How long a device stays on the fast tier after a user action
+ACTION_FAST_WINDOW = 120
+# Timers fire a little early or late; treat anything this close as due.
+DUE_SLACK = 1.0
+
+TIER_FAST = "fast"
+TIER_NORMAL = "normal"
+TIER_SLOW = "slow"
+
+
+class PollScheduler:
+    """Pick each device's next poll time from its state."""
+
+    def __init__(self, normal_interval: timedelta) -> None:
+        """Initialize the scheduler around the configured update interval."""
+        self.intervals: dict[str, timedelta] = self._intervals(normal_interval)
+        self._next_due: dict[str, float] = {}
+        self.tiers: dict[str, str] = {}
+
+    @staticmethod
+    def _intervals(normal_interval: timedelta) -> dict[str, timedelta]:
+        """Return the tier intervals around an update interval."""
+        return {
+            TIER_FAST: min(FAST_POLL_INTERVAL, normal_interval),
+            TIER_NORMAL: normal_interval,
+            TIER_SLOW: max(normal_interval * 5, MIN_SLOW_POLL_INTERVAL),
+        }
+
+    def set_interval(self, normal_interval: timedelta, now: float) -> None:
+        """Change the update interval, pulling in polls now scheduled too late."""
+        self.intervals = self._intervals(normal_interval)
+        for key, next_due in self._next_due.items():
+            tier = self.tiers.get(key, TIER_NORMAL)
+            latest = now + self.intervals[tier].total_seconds()
+            self._next_due[key] = min(next_due, latest)
+
+    @staticmethod
+    def tier(dvc) -> str:
+        """Return the polling tier of a device."""
+        if dvc.running or dvc.acted_within(ACTION_FAST_WINDOW):
+            return TIER_FAST
+        if dvc.offline or dvc.in_quiet_hours:
+            return TIER_SLOW
+        return TIER_NORMAL
+
+    def due(self, key: str, now: float) -> bool:
+        """Return whether the key should be polled now."""
+        next_due = self._next_due.get(key)
+        return next_due is None or now + DUE_SLACK >= next_due
+
+    def schedule(self, key: str, tier: str, now: float) -> None:
+        """Schedule the next poll of the key on the given tier."""
+        self.tiers[key] = tier
+        self._next_due[key] = now + self.intervals[tier].total_seconds()
+
+    def forget(self, key: str) -> None:
+        """Stop scheduling a key."""
+        self._next_due.pop(key, None)
+        self.tiers.pop(key, None)
+
+    def next_interval(self, now: float) -> timedelta:
+        """Return the delay until the earliest due key, within the tier bounds."""
+        fast = self.intervals[TIER_FAST]
+        normal = self.intervals[TIER_NORMAL]
+        if not self._next_due:
+            return normal
+        delay = timedelta(seconds=max(min(self._next_due.values()) - now, 0))
+        return min(max(delay, fast), normal)
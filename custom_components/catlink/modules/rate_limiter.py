@@ -0,0 +1,93 @@
+"""Request limiter for the CatLink API."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import time
+from urllib.parse import urlsplit
+
+from ..const import _LOGGER
+
+# Queue waits longer than this are logged so stalls are visible without metrics.
+SLOW_QUEUE_WAIT = 1.0
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` acquisitions per second on average."""
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """Initialize the bucket, full."""
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class RequestLimiter:
+    """Cap in-flight requests and request rate per API host."""
+
+    def __init__(self, max_concurrent: int, rate: float) -> None:
+        """Initialize the limiter."""
+        self._hosts: dict[str, tuple[asyncio.Semaphore, TokenBucket]] = {}
+        self.configure(max_concurrent, rate)
+        self.stats: dict[str, float] = {
+            "requests": 0,
+            "queued": 0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+        }
+
+    def configure(self, max_concurrent: int, rate: float) -> None:
+        """Set the limits, applied to requests queued from now on."""
+        self.max_concurrent = max(int(max_concurrent), 1)
+        self.rate = float(rate)
+        # Requests holding a slot release it to the limits they took it from
+        self._hosts.clear()
+
+    def _host(self, url: str) -> tuple[asyncio.Semaphore, TokenBucket]:
+        """Return the semaphore and bucket of the host serving the url."""
+        host = urlsplit(url).netloc
+        limits = self._hosts.get(host)
+        if limits is None:
+            limits = (asyncio.Semaphore(self.max_concurrent), TokenBucket(self.rate))
+            self._hosts[host] = limits
+        return limits
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[float]:
+        """Hold a request slot for the url, yielding the time spent queued."""
+        sem, bucket = self._host(url)
+        start = time.monotonic()
+        async with sem:
+            await bucket.acquire()
+            wait = time.monotonic() - start
+            self._record_wait(url, wait)
+            yield wait
+
+    def _record_wait(self, url: str, wait: float) -> None:
+        """Record the queue wait of one request."""
+        self.stats["requests"] += 1
+        if wait <= 0.001:
+            return
+        self.stats["queued"] += 1
+        self.stats["wait_total"] += wait
+        self.stats["wait_max"] = max(self.stats["wait_max"], wait)
+        if wait >= SLOW_QUEUE_WAIT:
+            _LOGGER.debug("Request %s waited %.2fs in the request queue", url, wait)
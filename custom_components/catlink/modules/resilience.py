@@ -0,0 +1,72 @@
+"""Retry and circuit breaker policies for the CatLink API."""
+
+import random
+import time
+
+from ..const import _LOGGER
+
+
+class RetryPolicy:
+    """Capped exponential backoff with full jitter."""
+
+    def __init__(
+        self, attempts: int = 3, base_delay: float = 0.5, max_delay: float = 10.0
+    ) -> None:
+        """Initialize the policy."""
+        self.attempts = max(int(attempts), 1)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        """Return the sleep before retrying after the given zero-based attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class CircuitBreaker:
+    """Circuit breaker guarding a single API endpoint."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, reset_timeout: float = 60.0
+    ) -> None:
+        """Initialize the breaker, closed."""
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Return whether a call may go out now."""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and (
+            time.monotonic() - self.opened_at >= self.reset_timeout
+        ):
+            # Let exactly one probe through; others keep short-circuiting.
+            self.state = self.HALF_OPEN
+            _LOGGER.debug("Circuit for %s half-open, probing", self.name)
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self.state != self.CLOSED:
+            _LOGGER.info("Circuit for %s closed", self.name)
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                _LOGGER.warning(
+                    "Circuit for %s opened after %s failures", self.name, self.failures
+                )
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
@@ -0,0 +1,50 @@
+"""Response cache for the CatLink API."""
+
+from collections import OrderedDict
+import time
+
+
+class ResponseCache:
+    """TTL cache of API responses with least-recently-used eviction."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """Initialize the cache."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+        self.stats: dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    def get(self, key: tuple) -> dict | None:
+        """Return a fresh cached response, or None."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[1]
+
+    def set(self, key: tuple, value: dict, ttl: float) -> None:
+        """Cache a response for ttl seconds."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def invalidate(self, api: str, params: tuple | None = None) -> None:
+        """Drop the cached responses of an api, or of one api and params."""
+        if params is not None:
+            self._entries.pop((api, params), None)
+            return
+        for key in [key for key in self._entries if key[0] == api]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
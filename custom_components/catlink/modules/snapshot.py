@@ -0,0 +1,62 @@
+"""Persistent device snapshot for CatLink config entries."""
+
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from ..const import DOMAIN
+
+if TYPE_CHECKING:
+    from ..devices.base import Device
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+
+class DeviceSnapshot:
+    """Persist the last known devices of a config entry across restarts.
+
+    The snapshot holds each device's list entry, detail and logs, so that
+    entities can be created at startup before the cloud has answered.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        devices: Callable[[], Iterable["Device"]],
+    ) -> None:
+        """Initialize the snapshot."""
+        self._store: Store[dict] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.snapshot.{entry_id}"
+        )
+        self._devices = devices
+
+    async def async_load(self) -> list[dict]:
+        """Return the stored device snapshots."""
+        data = await self._store.async_load()
+        if not isinstance(data, dict) or not isinstance(data.get("devices"), list):
+            return []
+        return [
+            snap
+            for snap in data["devices"]
+            if isinstance(snap, dict) and isinstance(snap.get("data"), dict)
+        ]
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the devices after a short delay, batching refresh cycles."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Save the devices now."""
+        data = self._data_to_save()
+        if data["devices"]:
+            await self._store.async_save(data)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        """Return the data to store."""
+        return {"devices": [dvc.as_snapshot() for dvc in self._devices()]}
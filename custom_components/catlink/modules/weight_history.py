@@ -0,0 +1,168 @@
+"""Litter weight history for CatLink litter devices."""
+
+from array import array
+from collections.abc import Iterable, Iterator
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from ..const import DOMAIN
+
+# Samples older than this no longer count towards occupancy
+WEIGHT_WINDOW = 24 * 3600
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+
+class WeightSeries:
+    """Fixed-size ring buffer of timestamped litter weight samples.
+
+    Occupancy is tracked incrementally: the ring counts how many neighbouring
+    sample pairs rise, so adding or evicting a sample is O(1).
+    """
+
+    def __init__(self, capacity: int = 24, window: float = WEIGHT_WINDOW) -> None:
+        """Initialize an empty series."""
+        self.capacity = max(int(capacity), 1)
+        self.window = window
+        self._times = array("d", bytes(8 * self.capacity))
+        self._values = array("d", bytes(8 * self.capacity))
+        self._start = 0
+        self._size = 0
+        self._rises = 0
+        self.delta: float | None = None
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return self._size
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over the weights, oldest first."""
+        for i in range(self._size):
+            yield self._values[(self._start + i) % self.capacity]
+
+    def __getitem__(self, index: int) -> float:
+        """Return a weight by position, oldest first."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("weight series index out of range")
+        return self._values[(self._start + index) % self.capacity]
+
+    @property
+    def occupied(self) -> bool:
+        """Return True if the weight rose between any two samples in the window."""
+        # Rises before a polling gap must not outlive the window
+        self.prune(time.time())
+        return self._rises > 0
+
+    @property
+    def last(self) -> float | None:
+        """Return the newest weight."""
+        return self[-1] if self._size else None
+
+    def append(self, value: float, ts: float | None = None) -> None:
+        """Add a sample, evicting expired and overflowing ones."""
+        ts = time.time() if ts is None else ts
+        self.prune(ts)
+        if self._size == self.capacity:
+            self._pop_oldest()
+        last = self.last
+        self.delta = None if last is None else value - last
+        if last is not None and value > last:
+            self._rises += 1
+        end = (self._start + self._size) % self.capacity
+        self._times[end] = ts
+        self._values[end] = value
+        self._size += 1
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Add several samples taken now."""
+        now = time.time()
+        for value in values:
+            self.append(value, now)
+
+    def clear(self) -> None:
+        """Drop every sample."""
+        self._start = 0
+        self._size = 0
+        self._rises = 0
+        self.delta = None
+
+    def prune(self, now: float) -> None:
+        """Drop samples older than the window."""
+        while self._size and now - self._times[self._start] > self.window:
+            self._pop_oldest()
+
+    def _pop_oldest(self) -> None:
+        """Drop the oldest sample and the rise it may start."""
+        if self._size >= 2 and self[1] > self[0]:
+            self._rises -= 1
+        self._start = (self._start + 1) % self.capacity
+        self._size -= 1
+
+    def as_list(self) -> list[list[float]]:
+        """Return the samples as [timestamp, weight] pairs, oldest first."""
+        return [
+            [self._times[(self._start + i) % self.capacity], self[i]]
+            for i in range(self._size)
+        ]
+
+    def restore(self, samples: Iterable) -> None:
+        """Replace the samples with stored [timestamp, weight] pairs."""
+        self.clear()
+        for sample in samples:
+            try:
+                ts, value = float(sample[0]), float(sample[1])
+            except (TypeError, ValueError, IndexError):
+                continue
+            self.append(value, ts)
+        self.delta = None
+        self.prune(time.time())
+
+
+class WeightHistory:
+    """Persist the weight series of a config entry's devices across restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the history."""
+        self._store: Store[dict] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.weight_history.{entry_id}"
+        )
+        self._series: dict[str, WeightSeries] = {}
+        self._restored: dict[str, list] = {}
+        self.loaded = False
+
+    async def async_load(self) -> None:
+        """Load stored samples once; devices pick them up when attached."""
+        if self.loaded:
+            return
+        self.loaded = True
+        data = await self._store.async_load()
+        if isinstance(data, dict) and isinstance(data.get("devices"), dict):
+            self._restored = data["devices"]
+
+    @callback
+    def attach(self, device_id: str, series: WeightSeries) -> None:
+        """Track a device series, restoring stored samples into it."""
+        if samples := self._restored.pop(device_id, None):
+            series.restore(samples)
+        self._series[device_id] = series
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the series after a short delay, batching bursts of samples."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Save the series now."""
+        if self._series:
+            await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict:
+        """Return the data to store."""
+        return {
+            "devices": {did: s.as_list() for did, s in self._series.items()}
+        }
@@ -3,17 +3,39 @@
 import voluptuous as vol
 
 from homeassistant.components.sensor import DOMAIN as ENTITY_DOMAIN
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv, entity_platform
 
 from .const import DOMAIN
 from .entities import CatlinkSensorEntity
+from .entities.metrics import (
+    METRICS_SENSORS,
+    CatlinkMetricsSensorEntity,
+    account_label,
+)
 from .helpers import Helper, async_setup_domain_platform
 
-async_setup_entry = Helper.async_setup_entry_for(ENTITY_DOMAIN)
+_async_setup_device_entities = Helper.async_setup_entry_for(ENTITY_DOMAIN)
 async_setup_accounts = Helper.async_setup_accounts
 
 
+async def async_setup_entry(
+    hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities
+) -> None:
+    """Set up device sensors and the API metrics sensors of the account."""
+    await _async_setup_device_entities(hass, config_entry, async_add_entities)
+    coordinator = hass.data[DOMAIN]["entry_coordinators"].get(config_entry.entry_id)
+    if coordinator is not None:
+        label = account_label(config_entry)
+        async_add_entities(
+            [
+                CatlinkMetricsSensorEntity(name, coordinator, option, label)
+                for name, option in METRICS_SENSORS.items()
+            ]
+        )
+
+
 async def _register_sensor_services() -> None:
     """Register sensor-specific entity services."""
     platform = entity_platform.async_get_current_platform()
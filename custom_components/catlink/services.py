@@ -0,0 +1,58 @@
+"""Services of the CatLink integration."""
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID, CONF_DEVICES
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .const import DOMAIN
+
+SERVICE_GET_LOGS = "get_logs"
+ATTR_LIMIT = "limit"
+
+GET_LOGS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_LIMIT): cv.positive_int,
+    }
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the CatLink services."""
+
+    async def _async_get_logs(call: ServiceCall) -> ServiceResponse:
+        """Return the known log entries of a device, newest first."""
+        dvc = _device_for(hass, call.data[ATTR_DEVICE_ID])
+        logs = list(dvc.logs)
+        if limit := call.data.get(ATTR_LIMIT):
+            logs = logs[:limit]
+        return {"logs": logs}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_LOGS,
+        _async_get_logs,
+        schema=GET_LOGS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _device_for(hass: HomeAssistant, device_id: str):
+    """Return the CatLink device of a device registry id."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
+        raise ServiceValidationError(f"Unknown CatLink device: {device_id}")
+    identifiers = {ident for domain, ident in device.identifiers if domain == DOMAIN}
+    for dvc in hass.data[DOMAIN][CONF_DEVICES].values():
+        # Same identifier as the entities' device info
+        if f"{dvc.type}_{dvc.mac}" in identifiers:
+            return dvc
+    raise ServiceValidationError(f"Unknown CatLink device: {device_id}")
@@ -1,5 +1,6 @@
 """Tests for CatLink Account module."""
 
+import asyncio
 from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -34,11 +35,13 @@ def account_config():
 
 @pytest.fixture
 def mock_http_session():
-    """Mock aiohttp client session."""
+    """Mock the pooled aiohttp client session."""
     with patch(
-        "custom_components.catlink.modules.account.aiohttp_client.async_create_clientsession"
+        "custom_components.catlink.modules.http_pool.HttpPool._create_session"
     ) as mock_create:
         session = MagicMock()
+        session.closed = False
+        session.close = AsyncMock()
         mock_create.return_value = session
         yield session
 
@@ -165,6 +168,16 @@ class TestAccountParamsSign:
         sig2 = Account.params_sign({"a": "2"})
         assert sig1 != sig2
 
+    def test_params_sign_known_value(self) -> None:
+        """Test params_sign matches the sorted key=value&key=SIGN_KEY digest."""
+        import hashlib
+
+        from custom_components.catlink.const import SIGN_KEY
+
+        raw = f"a=1&b=2&key={SIGN_KEY}"
+        expected = hashlib.md5(raw.encode()).hexdigest().upper()
+        assert Account.params_sign({"b": 2, "a": "1"}) == expected
+
 
 class TestAccountEncryptPassword:
     """Tests for Account.encrypt_password static method."""
@@ -214,6 +227,39 @@ class TestAccountPassword:
         acc = Account(hass, config)
         assert acc.password == "a" * 20
 
+    def test_encrypted_password_is_cached(self, hass, mock_http_session) -> None:
+        """Test the short password is encrypted once per account."""
+        config = {
+            CONF_PHONE_IAC: "86",
+            CONF_PHONE: "13812345678",
+            CONF_PASSWORD: "short",
+        }
+        acc = Account(hass, config)
+        with patch.object(
+            Account, "encrypt_password", return_value="x" * 172
+        ) as mock_encrypt:
+            assert acc.password == acc.password
+            config[CONF_PASSWORD] = "changed"
+            acc.password
+        assert mock_encrypt.call_count == 2
+
+    async def test_async_get_password_uses_executor(
+        self, hass, mock_http_session
+    ) -> None:
+        """Test async_get_password encrypts off the event loop and caches."""
+        config = {
+            CONF_PHONE_IAC: "86",
+            CONF_PHONE: "13812345678",
+            CONF_PASSWORD: "short",
+        }
+        acc = Account(hass, config)
+        with patch.object(
+            hass, "async_add_executor_job", AsyncMock(return_value="enc")
+        ) as mock_job:
+            assert await acc.async_get_password() == "enc"
+            assert await acc.async_get_password() == "enc"
+        mock_job.assert_called_once_with(Account.encrypt_password, "short")
+
 
 class TestAccountRequest:
     """Tests for Account request method."""
@@ -257,6 +303,81 @@ class TestAccountRequest:
         assert params[CONF_TOKEN] == "existing-token"
 
 
+class TestAccountRequestCoalescing:
+    """Tests for single-flight coalescing of identical in-flight GETs."""
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_identical_gets_share_one_call(self, account) -> None:
+        """Test concurrent identical GETs issue a single HTTP request."""
+        release = asyncio.Event()
+        calls = []
+
+        async def mock_request(method, url, **kwargs):
+            calls.append(kwargs.get("params"))
+            await release.wait()
+            resp = MagicMock()
+            resp.json = AsyncMock(return_value={"returnCode": 0, "data": {"a": 1}})
+            return resp
+
+        account.http.request = mock_request
+
+        tasks = [
+            asyncio.ensure_future(
+                account.request("token/device/info", {"deviceId": "dev1"})
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert len(calls) == 1
+        assert all(r == {"returnCode": 0, "data": {"a": 1}} for r in results)
+        assert account.coalesce_stats == {"hits": 2, "misses": 1}
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_different_params_are_not_coalesced(self, account) -> None:
+        """Test GETs for different devices are issued separately."""
+        calls = []
+
+        async def mock_request(method, url, **kwargs):
+            calls.append(kwargs.get("params"))
+            resp = MagicMock()
+            resp.json = AsyncMock(return_value={"returnCode": 0})
+            return resp
+
+        account.http.request = mock_request
+
+        await asyncio.gather(
+            account.request("token/device/info", {"deviceId": "dev1"}),
+            account.request("token/device/info", {"deviceId": "dev2"}),
+        )
+
+        assert len(calls) == 2
+        assert account.coalesce_stats == {"hits": 0, "misses": 2}
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_posts_are_never_coalesced(self, account) -> None:
+        """Test identical POSTs each reach the API."""
+        calls = []
+
+        async def mock_request(method, url, **kwargs):
+            calls.append(method)
+            resp = MagicMock()
+            resp.json = AsyncMock(return_value={"returnCode": 0})
+            return resp
+
+        account.http.request = mock_request
+
+        await asyncio.gather(
+            account.request("token/device/feeder/foodOut", {"deviceId": "f1"}, "POST"),
+            account.request("token/device/feeder/foodOut", {"deviceId": "f1"}, "POST"),
+        )
+
+        assert calls == ["POST", "POST"]
+        assert account.coalesce_stats == {"hits": 0, "misses": 0}
+
+
 class TestAccountAsyncLogin:
     """Tests for Account async_login."""
 
@@ -277,6 +398,22 @@ class TestAccountAsyncLogin:
                 assert account.token == "new-token"
                 mock_check.assert_called_once_with(True)
 
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_login_without_saving_auth(self, account) -> None:
+        """Test async_login can leave the auth store untouched."""
+        with patch.object(account, "request", new_callable=AsyncMock) as mock_request:
+            with patch.object(
+                account, "async_check_auth", new_callable=AsyncMock
+            ) as mock_check:
+                mock_request.return_value = {
+                    "data": {"token": "new-token"},
+                    "returnCode": 0,
+                }
+                assert await account.async_login(save_auth=False) is True
+
+                assert account.token == "new-token"
+                mock_check.assert_not_called()
+
     @pytest.mark.usefixtures("enable_custom_integrations")
     async def test_login_fails_no_token(self, account) -> None:
         """Test async_login returns False when no token in response."""
@@ -492,3 +629,343 @@ class TestAccountRequestErrors:
         result = await account.request("token/device/list")
 
         assert result == {}
+
+
+class TestAccountRequestLimiter:
+    """Tests for Account request limiting."""
+
+    def test_limiter_uses_defaults(self, hass, account_config, mock_http_session) -> None:
+        """Test the limiter falls back to default limits."""
+        account = Account(hass, account_config)
+        assert account.limiter.max_concurrent == 4
+        assert account.limiter.rate == 5.0
+
+    def test_limiter_uses_config(self, hass, account_config, mock_http_session) -> None:
+        """Test the limiter honours configured limits."""
+        account_config["max_concurrent_requests"] = 2
+        account_config["requests_per_second"] = 1.5
+        account = Account(hass, account_config)
+        assert account.limiter.max_concurrent == 2
+        assert account.limiter.rate == 1.5
+
+    def test_limiter_follows_updated_options(
+        self, hass, account_config, mock_http_session
+    ) -> None:
+        """Test changed options reconfigure the limiter of a running account."""
+        account = Account(hass, account_config)
+        account.update_config(
+            {"max_concurrent_requests": 8.0, "requests_per_second": 2.5}
+        )
+        assert account.limiter.max_concurrent == 8
+        assert account.limiter.rate == 2.5
+
+    async def test_request_goes_through_limiter(
+        self, hass, account_config, mock_http_session
+    ) -> None:
+        """Test API calls are counted by the limiter."""
+        account = Account(hass, account_config)
+        mock_resp = MagicMock()
+        mock_resp.json = AsyncMock(return_value={"returnCode": 0})
+        account.http.request = AsyncMock(return_value=mock_resp)
+
+        await account.request("token/device/list")
+
+        assert account.limiter.stats["requests"] == 1
+
+
+class TestAccountSingleFlightLogin:
+    """Tests for single-flight re-login on token expiry."""
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_concurrent_logins_share_one_call(self, account) -> None:
+        """Test concurrent async_login calls perform a single login."""
+        gate = asyncio.Event()
+        calls = 0
+
+        async def login(_save_auth=True):
+            nonlocal calls
+            calls += 1
+            await gate.wait()
+            account._config[CONF_TOKEN] = "new-token"
+            return True
+
+        with patch.object(account, "_async_login", side_effect=login):
+            waiters = [asyncio.ensure_future(account.async_login()) for _ in range(5)]
+            await asyncio.sleep(0)
+            gate.set()
+            results = await asyncio.gather(*waiters)
+
+        assert results == [True] * 5
+        assert calls == 1
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_concurrent_1002_replays_after_one_login(self, account) -> None:
+        """Test requests rejected with 1002 wait on one login and then replay."""
+        account._config[CONF_TOKEN] = "old-token"
+        sent = []
+
+        async def http_request(method, url, **kws):
+            token = kws["params"].get(CONF_TOKEN)
+            sent.append((kws["params"].get("deviceId"), token))
+            await asyncio.sleep(0)
+            resp = MagicMock()
+            code = 0 if token == "new-token" else 1002
+            resp.json = AsyncMock(return_value={"returnCode": code})
+            return resp
+
+        logins = 0
+
+        async def login(_save_auth=True):
+            nonlocal logins
+            logins += 1
+            await asyncio.sleep(0.01)
+            account._config[CONF_TOKEN] = "new-token"
+            return True
+
+        account.http.request = http_request
+        with patch.object(account, "_async_login", side_effect=login):
+            results = await asyncio.gather(
+                *(
+                    account.request("token/device/info", {"deviceId": f"d{i}"})
+                    for i in range(4)
+                )
+            )
+
+        assert logins == 1
+        assert all(rsp["returnCode"] == 0 for rsp in results)
+        replayed = sorted(dev for dev, tok in sent if tok == "new-token")
+        assert replayed == ["d0", "d1", "d2", "d3"]
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_1002_not_retried_twice(self, account) -> None:
+        """Test a request is replayed at most once after re-login."""
+        account._config[CONF_TOKEN] = "old-token"
+        resp = MagicMock()
+        resp.json = AsyncMock(return_value={"returnCode": 1002})
+        account.http.request = AsyncMock(return_value=resp)
+
+        with patch.object(
+            account, "_async_login", new_callable=AsyncMock, return_value=True
+        ) as mock_login:
+            rsp = await account.request("token/device/info", {"deviceId": "d1"})
+
+        assert rsp["returnCode"] == 1002
+        assert mock_login.call_count == 1
+        assert account.http.request.call_count == 2
+        assert "_retried" not in account.http.request.call_args.kwargs
+
+
+class TestAccountRequestResilience:
+    """Tests for Account retries and circuit breakers."""
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_get_retried_after_transient_error(self, account) -> None:
+        """Test a GET succeeds after a transient connection failure."""
+        mock_resp = MagicMock()
+        mock_resp.json = AsyncMock(return_value={"returnCode": 0, "data": {}})
+        account.http.request = AsyncMock(side_effect=[TimeoutError(), mock_resp])
+
+        with patch(
+            "custom_components.catlink.modules.account.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            result = await account.request("token/device/list")
+
+        assert result["returnCode"] == 0
+        assert account.http.request.call_count == 2
+        mock_sleep.assert_called_once()
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_post_not_retried(self, account) -> None:
+        """Test a failing POST is attempted only once."""
+        account.http.request = AsyncMock(side_effect=TimeoutError())
+
+        result = await account.request("token/device/action", {"a": 1}, "POST")
+
+        assert result == {}
+        assert account.http.request.call_count == 1
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_open_circuit_serves_last_good(self, account) -> None:
+        """Test an open circuit short-circuits to the last good payload."""
+        good = {"returnCode": 0, "data": {"deviceInfo": {"id": "1"}}}
+        mock_resp = MagicMock()
+        mock_resp.json = AsyncMock(return_value=good)
+        account.http.request = AsyncMock(return_value=mock_resp)
+        account.retry_policy.attempts = 1
+        api = "token/device/info"
+
+        assert await account.request(api, {"deviceId": "1"}) == good
+
+        account.http.request = AsyncMock(side_effect=TimeoutError())
+        breaker = account._breakers[f"{api}:1"]
+        for _ in range(breaker.failure_threshold):
+            assert await account.request(api, {"deviceId": "1"}) == {}
+        calls = account.http.request.call_count
+
+        assert await account.request(api, {"deviceId": "1"}) == good
+        assert account.http.request.call_count == calls
+
+        # Other devices of the api keep their own, closed circuit
+        assert await account.request(api, {"deviceId": "2"}) == {}
+        assert account.http.request.call_count == calls + 1
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_writes_bypass_open_circuit(self, account) -> None:
+        """Test a write is sent, not short-circuited, while the circuit is open."""
+        account.http.request = AsyncMock(side_effect=TimeoutError())
+        account.retry_policy.attempts = 1
+        api = "token/device/action"
+        for _ in range(5):
+            await account.request(api, {"deviceId": "1"})
+        assert not account._breakers[f"{api}:1"].allow()
+
+        ok = MagicMock()
+        ok.json = AsyncMock(return_value={"returnCode": 0})
+        account.http.request = AsyncMock(return_value=ok)
+        assert await account.request(api, {"deviceId": "1"}, "POST") == {
+            "returnCode": 0
+        }
+        account.http.request.assert_called_once()
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    @pytest.mark.parametrize(
+        "probe_error",
+        [
+            "content_type",
+            "cancelled",
+        ],
+    )
+    async def test_failed_probe_reopens_circuit(self, account, probe_error) -> None:
+        """Test a probe failing with any exception does not stay half-open."""
+        from aiohttp import ClientConnectorError, ContentTypeError
+
+        from custom_components.catlink.modules.resilience import CircuitBreaker
+
+        api = "token/device/info"
+        account.retry_policy.attempts = 1
+        account.http.request = AsyncMock(
+            side_effect=ClientConnectorError(MagicMock(), OSError("refused"))
+        )
+        for _ in range(5):
+            await account.request(api, {"deviceId": "1"})
+        breaker = account._breakers[f"{api}:1"]
+        assert breaker.state == CircuitBreaker.OPEN
+
+        breaker.reset_timeout = 0
+        if probe_error == "content_type":
+            account.http.request = AsyncMock(
+                side_effect=ContentTypeError(MagicMock(), ())
+            )
+            assert await account.request(api, {"deviceId": "1"}) == {}
+        else:
+            account.http.request = AsyncMock(side_effect=asyncio.CancelledError())
+            with pytest.raises(asyncio.CancelledError):
+                await account.request(api, {"deviceId": "1"})
+        assert breaker.state == CircuitBreaker.OPEN
+
+        good = MagicMock()
+        good.json = AsyncMock(return_value={"returnCode": 0})
+        account.http.request = AsyncMock(return_value=good)
+        assert await account.request(api, {"deviceId": "1"}) == {"returnCode": 0}
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_non_json_body_is_a_failure(self, account) -> None:
+        """Test a body that is not JSON is handled like a failed request."""
+        resp = MagicMock()
+        resp.json = AsyncMock(side_effect=ValueError("not json"))
+        account.http.request = AsyncMock(return_value=resp)
+        account.retry_policy.attempts = 1
+
+        assert await account.request("token/device/info", {"deviceId": "1"}) == {}
+        assert account._breakers["token/device/info:1"].failures == 1
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_last_good_is_bounded(self, account) -> None:
+        """Test last good responses of ever-changing params are evicted."""
+        resp = MagicMock()
+        resp.json = AsyncMock(return_value={"returnCode": 0})
+        account.http.request = AsyncMock(return_value=resp)
+
+        with patch("custom_components.catlink.modules.account.LAST_GOOD_ENTRIES", 3):
+            for day in range(5):
+                await account.request("token/pet/summary", {"date": f"d{day}"})
+
+        assert len(account._last_good) == 3
+        assert ("token/pet/summary", (("date", "d0"),)) not in account._last_good
+
+
+class TestAccountCachedRequest:
+    """Tests for Account cached_request."""
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_cached_request_reuses_response(self, account) -> None:
+        """Test a successful response is served from cache within its TTL."""
+        mock_resp = MagicMock()
+        mock_resp.json = AsyncMock(return_value={"returnCode": 0, "data": {}})
+        account.http.request = AsyncMock(return_value=mock_resp)
+
+        first = await account.cached_request("token/api", {"deviceId": "1"}, 60)
+        second = await account.cached_request("token/api", {"deviceId": "1"}, 60)
+
+        assert first == second
+        assert account.http.request.call_count == 1
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_cached_request_skips_errors(self, account) -> None:
+        """Test error responses are not cached."""
+        mock_resp = MagicMock()
+        mock_resp.json = AsyncMock(return_value={"returnCode": 500})
+        account.http.request = AsyncMock(return_value=mock_resp)
+
+        await account.cached_request("token/api", {"deviceId": "1"}, 60)
+        await account.cached_request("token/api", {"deviceId": "1"}, 60)
+
+        assert account.http.request.call_count == 2
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_invalidate_forces_refetch(self, account) -> None:
+        """Test invalidate drops the cached response of the api and params."""
+        mock_resp = MagicMock()
+        mock_resp.json = AsyncMock(return_value={"returnCode": 0})
+        account.http.request = AsyncMock(return_value=mock_resp)
+
+        await account.cached_request("token/api", {"deviceId": "1"}, 60)
+        account.invalidate("token/api", {"deviceId": "1"})
+        await account.cached_request("token/api", {"deviceId": "1"}, 60)
+
+        assert account.http.request.call_count == 2
+
+
+class TestAccountRequestMetrics:
+    """Tests for per-endpoint request metrics."""
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_request_records_metrics(self, account) -> None:
+        """Test responses, bytes, return codes and retries are recorded."""
+        calls = 0
+
+        async def mock_request(method, url, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise TimeoutError
+            kwargs["trace_request_ctx"].bytes += 42
+            resp = MagicMock()
+            resp.json = AsyncMock(return_value={"returnCode": 1})
+            return resp
+
+        account.http.request = mock_request
+        with patch(
+            "custom_components.catlink.modules.account.asyncio.sleep", AsyncMock()
+        ):
+            await account.request("token/device/list")
+
+        endpoint = account.metrics.endpoints["token/device/list"]
+        assert endpoint.requests == 2
+        assert endpoint.timeouts == 1
+        assert endpoint.retries == 1
+        assert endpoint.bytes == 42
+        assert endpoint.return_codes == {1: 1}
+        assert endpoint.errors == 2
@@ -1,6 +1,6 @@
 """Tests for CatLink config flow."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from custom_components.catlink.config_flow import _device_label
 from custom_components.catlink.const import (
@@ -334,9 +334,48 @@ async def test_options_flow(
 
     result = await hass.config_entries.options.async_configure(
         result["flow_id"],
-        {CONF_DEVICE_IDS: ["dev1", "dev2"], CONF_UPDATE_INTERVAL: 300},
+        {
+            CONF_DEVICE_IDS: ["dev1", "dev2"],
+            CONF_UPDATE_INTERVAL: 300,
+            "max_concurrent_requests": 2,
+            "requests_per_second": 1.5,
+            "refresh_deadline": 30,
+            "change_detection": True,
+            "max_detail_staleness": 300,
+        },
     )
 
     assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
     assert result["data"][CONF_DEVICE_IDS] == ["dev1", "dev2"]
     assert result["data"][CONF_UPDATE_INTERVAL] == 300
+    assert result["data"]["max_concurrent_requests"] == 2
+    assert result["data"]["requests_per_second"] == 1.5
+    assert result["data"]["refresh_deadline"] == 30
+    assert result["data"]["change_detection"] is True
+    assert result["data"]["max_detail_staleness"] == 300
+
+
+async def test_options_flow_uses_coordinator_devices(
+    hass: HomeAssistant, enable_custom_integrations, mock_account
+) -> None:
+    """Test the options form is served from the running coordinator's list."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_PHONE_IAC: "86", CONF_PHONE: "13812345678", "password": "x"},
+        options={CONF_DEVICE_IDS: ["dev1"], CONF_UPDATE_INTERVAL: 60},
+        unique_id="86-13812345678",
+    )
+    entry.add_to_hass(hass)
+    coordinator = MagicMock()
+    coordinator.device_list = [
+        {"id": "dev1", "deviceName": "Box", "model": "C08", "deviceType": "C08"},
+    ]
+    hass.data[DOMAIN] = {"entry_coordinators": {entry.entry_id: coordinator}}
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    mock_account.assert_not_called()
+    schema = result["data_schema"].schema
+    device_ids = next(k for k in schema if k == CONF_DEVICE_IDS)
+    assert list(schema[device_ids].options) == ["dev1"]
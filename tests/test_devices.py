@@ -1,6 +1,6 @@
 """Tests for CatLink device classes."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from custom_components.catlink.devices.base import Device
 from custom_components.catlink.devices.cat import CatDevice
@@ -156,6 +156,123 @@ class TestDevice:
         assert device.data == new_data
         assert device.name == "Updated Name"
 
+    def test_device_idle(self, mock_coordinator, sample_device_data) -> None:
+        """Test idle requires detail, no work in progress and no action error."""
+        device = Device(sample_device_data, mock_coordinator)
+        assert device.idle is False
+        device.detail = {"workStatus": "00"}
+        assert device.idle is True
+        device.detail = {"workStatus": "01"}
+        assert device.idle is False
+        device.detail = {"workStatus": "00"}
+        device._set_action_error("failed")  # noqa: SLF001
+        assert device.idle is False
+
+    def test_staleness_while_stale(
+        self, mock_coordinator, sample_device_data
+    ) -> None:
+        """Test staleness is the detail age, reported only while stale."""
+        device = Device(sample_device_data, mock_coordinator)
+        listener = MagicMock()
+        device.listeners["sensor.x"] = listener
+        clock = "custom_components.catlink.devices.base.time"
+        with patch(clock, time=MagicMock(return_value=100)):
+            device.detail = {"workStatus": "00"}
+        with patch(clock, time=MagicMock(return_value=130)):
+            assert device.staleness is None
+            device.set_stale(True)
+            assert device.staleness == 30
+            device.set_stale(True)
+            listener.assert_called_once()
+            device.set_stale(False)
+            assert device.staleness is None
+        assert device.as_snapshot()["detail_at"] == 100
+
+    def test_note_action_polls_fast(
+        self, mock_coordinator, sample_device_data
+    ) -> None:
+        """Test an action is remembered and handed to the coordinator."""
+        device = Device(sample_device_data, mock_coordinator)
+        assert not device.acted_within(60)
+        device.note_action()
+        assert device.acted_within(60)
+        mock_coordinator.async_note_action.assert_called_once_with(device)
+
+    def test_stale_device_keeps_last_good_detail(
+        self, mock_coordinator, sample_device_data
+    ) -> None:
+        """Test an empty detail does not replace the last one while stale."""
+        device = Device(sample_device_data, mock_coordinator)
+        device.detail = {"workStatus": "00"}
+        detail_at = device.detail_at
+        device.set_stale(True)
+        device.detail = {}
+        assert device.detail == {"workStatus": "00"}
+        assert device.detail_at == detail_at
+        device.set_stale(False)
+        device.detail = {}
+        assert device.detail == {}
+
+    def test_batch_updates_notifies_listeners_once(
+        self, mock_coordinator, sample_device_data
+    ) -> None:
+        """Test listener calls inside nested batches collapse into one."""
+        device = Device(sample_device_data, mock_coordinator)
+        listener = MagicMock()
+        device.listeners["sensor.x"] = listener
+        with device.batch_updates():
+            device.update_data(sample_device_data)
+            with device.batch_updates():
+                device._set_action_error("failed")  # noqa: SLF001
+            listener.assert_not_called()
+        listener.assert_called_once()
+
+        with device.batch_updates():
+            pass
+        listener.assert_called_once()
+
+    def test_memoized_until_version_changes(
+        self, mock_coordinator, sample_device_data
+    ) -> None:
+        """Test derived values are shared until data, detail or logs change."""
+        device = LitterBox(sample_device_data, mock_coordinator)
+        device.detail = {"workStatus": "00", "inductionTimes": 2, "manualTimes": 1}
+        attrs = device.state_attrs()
+        assert device.state_attrs() is attrs
+        assert device.total_clean_time == 3
+
+        version = device.version
+        device.detail = {"workStatus": "01", "inductionTimes": 5, "manualTimes": 1}
+        assert device.version > version
+        assert device.state_attrs() is not attrs
+        assert device.state_attrs()["work_status"] == "01"
+        assert device.total_clean_time == 6
+
+        log_attrs = device.last_log_attrs()
+        device.logs = [{"time": "10:00", "event": "Clean"}]
+        assert device.last_log_attrs() is not log_attrs
+        assert device.last_log_attrs()["event"] == "Clean"
+
+    def test_entity_keys_computed_once_per_class(
+        self, mock_coordinator, sample_c08_data
+    ) -> None:
+        """Test entity keys come from the first device of a class only."""
+        first = C08Device(sample_c08_data, mock_coordinator)
+        second = C08Device({**sample_c08_data, "id": "c08-2"}, mock_coordinator)
+        keys = first.entity_keys("switch")
+        assert keys == tuple(first.hass_switch)
+        assert "notice_cat_came" in keys
+        assert second.entity_keys("switch") is keys
+        assert first.entity_keys("number") == ()
+
+    def test_option_code(self, mock_coordinator, sample_c08_data) -> None:
+        """Test option labels map back to their API codes."""
+        device = C08Device(sample_c08_data, mock_coordinator)
+        assert device._option_code("modes", "manual") == "01"  # noqa: SLF001
+        assert device._option_code("litter_types", "Mixed") == "02"  # noqa: SLF001
+        assert device._option_code("safe_time_options", "15 min") == "15"  # noqa: SLF001
+        assert device._option_code("modes", "unknown") is None  # noqa: SLF001
+
 
 class TestDeviceRegistry:
     """Tests for device registry create_device."""
@@ -580,6 +697,26 @@ class TestC08Device:
         assert device.notice_cat_came is True
         assert device.notice_box_full is False
 
+    def test_state_attrs_show_extras_in_demand(
+        self, mock_coordinator, sample_c08_data
+    ) -> None:
+        """Test extras payloads are only attributes while their endpoint is fetched."""
+        from custom_components.catlink.devices.c08 import API_LITTERBOX_C08_WIFI_INFO
+
+        device = C08Device(sample_c08_data, mock_coordinator)
+        device._wifi_info = {"rssi": "-40"}
+        mock_coordinator.demand.wants.side_effect = (
+            lambda _dvc, api: api == API_LITTERBOX_C08_WIFI_INFO
+        )
+
+        attrs = device.state_attrs()
+
+        assert attrs["wifi_info"] == {"rssi": "-40"}
+        assert "device_stats" not in attrs
+        assert "notice_configs" not in attrs
+        assert "pet_stats" not in attrs
+        assert "about_device" in attrs
+
     def test_hass_switch_contains_notice(self, mock_coordinator, sample_c08_data) -> None:
         """Test C08Device hass_switch includes notice entries."""
         device = C08Device(sample_c08_data, mock_coordinator)
@@ -587,6 +724,22 @@ class TestC08Device:
         assert "notice_cat_came" in switches
         assert switches["notice_cat_came"]["name"] == "Notice: Cat came"
 
+    def test_in_quiet_hours(self, mock_coordinator, sample_c08_data) -> None:
+        """Test quiet hours handle periods that wrap past midnight."""
+        from datetime import datetime
+        from unittest.mock import patch
+
+        device = C08Device(sample_c08_data, mock_coordinator)
+        device.detail = {"quietEnable": True, "quietTimes": "22:00-07:00"}
+        now = "custom_components.catlink.devices.c08.dt_util.now"
+        with patch(now, return_value=datetime(2026, 1, 1, 23, 30)):
+            assert device.in_quiet_hours is True
+        with patch(now, return_value=datetime(2026, 1, 1, 12, 0)):
+            assert device.in_quiet_hours is False
+        device.detail = {"quietEnable": False, "quietTimes": "22:00-07:00"}
+        with patch(now, return_value=datetime(2026, 1, 1, 23, 30)):
+            assert device.in_quiet_hours is False
+
     def test_hass_select_structure(self, mock_coordinator, sample_c08_data) -> None:
         """Test C08Device hass_select contains expected keys."""
         device = C08Device(sample_c08_data, mock_coordinator)
@@ -652,6 +805,75 @@ class TestC08DeviceAsyncMethods:
         assert call_args[0][0] == "token/litterbox/catLitterSetting"
         assert call_args[0][1]["litterType"] == "00"
 
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_refresh_extras_uses_cache_ttls(
+        self, mock_coordinator, sample_c08_data
+    ) -> None:
+        """Test supplemental endpoints are fetched through the response cache."""
+        from custom_components.catlink.devices.c08 import C08_EXTRAS_TTL
+
+        device = C08Device(sample_c08_data, mock_coordinator)
+        mock_coordinator.account.cached_request = AsyncMock(
+            return_value={"data": {"wifiInfo": {"rssi": "-40"}}}
+        )
+
+        await device.async_refresh_c08_extras()
+
+        calls = mock_coordinator.account.cached_request.call_args_list
+        assert [(c[0][0], c[0][2]) for c in calls] == list(C08_EXTRAS_TTL.items())
+        assert device.wifi_rssi == "-40"
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_refresh_extras_skips_endpoints_out_of_demand(
+        self, mock_coordinator, sample_c08_data
+    ) -> None:
+        """Test endpoints with no enabled entity are not fetched."""
+        from custom_components.catlink.devices.c08 import API_LITTERBOX_C08_WIFI_INFO
+
+        device = C08Device(sample_c08_data, mock_coordinator)
+        mock_coordinator.demand.wants = (
+            lambda dvc, api: api != API_LITTERBOX_C08_WIFI_INFO
+        )
+        mock_coordinator.account.cached_request = AsyncMock(
+            return_value={"data": {"wifiInfo": {"rssi": "-40"}, "cats": [{}]}}
+        )
+
+        await device.async_refresh_c08_extras()
+
+        apis = [c[0][0] for c in mock_coordinator.account.cached_request.call_args_list]
+        assert API_LITTERBOX_C08_WIFI_INFO not in apis
+        assert len(apis) == 6
+        assert device.wifi_rssi is None
+        assert device.pet_stats_count == 1
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_set_notice_invalidates_notice_list(
+        self, mock_coordinator, sample_c08_data
+    ) -> None:
+        """Test a notice change drops the cached notice config list."""
+        device = C08Device(sample_c08_data, mock_coordinator)
+        mock_coordinator.account.request = AsyncMock(return_value={"returnCode": 0})
+        device.update_device_detail = AsyncMock(return_value={})
+
+        assert await device.async_set_notice("WASH_SCOOPER", True)
+
+        mock_coordinator.account.invalidate.assert_called_once_with(
+            "token/litterbox/noticeConfig/list/c08", {"deviceId": "c08-1"}
+        )
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_failed_action_keeps_cache(
+        self, mock_coordinator, sample_c08_data
+    ) -> None:
+        """Test a rejected action does not invalidate cached extras."""
+        device = C08Device(sample_c08_data, mock_coordinator)
+        mock_coordinator.account.request = AsyncMock(
+            return_value={"returnCode": 1, "msg": "busy"}
+        )
+
+        assert not await device.select_action("Clean: start")
+        mock_coordinator.account.invalidate.assert_not_called()
+
 
 class TestFeederDevice:
     """Tests for FeederDevice."""
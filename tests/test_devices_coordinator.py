@@ -1,14 +1,32 @@
 """Tests for CatLink DevicesCoordinator module."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from datetime import timedelta
+import time
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
 
-from custom_components.catlink.const import DOMAIN
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.catlink.const import (
+    CONF_DEVICE_IDS,
+    CONF_UPDATE_INTERVAL,
+    DOMAIN,
+)
 from custom_components.catlink.modules.devices_coordinator import DevicesCoordinator
 from custom_components.catlink.modules.account import Account
 
 
+def patch_clock(*times: float):
+    """Patch the coordinator's monotonic clock to return the given times."""
+    return patch(
+        "custom_components.catlink.modules.devices_coordinator.time",
+        monotonic=MagicMock(side_effect=list(times)),
+        perf_counter=time.perf_counter,
+    )
+
+
 @pytest.fixture
 def coordinator_hass_data(hass):
     """Set up hass.data structure required by DevicesCoordinator."""
@@ -26,6 +44,7 @@ def mock_account(hass, coordinator_hass_data):
     account.hass = hass
     account.uid = "86-13812345678"
     account.update_interval = __import__("datetime").timedelta(minutes=1)
+    account.get_config = MagicMock(side_effect=lambda key, default=None: default)
     return account
 
 
@@ -243,6 +262,9 @@ class TestDevicesCoordinatorUpdateHassEntities:
             "state": {"icon": "mdi:info", "state_attrs": lambda: {}},
             "error": {"icon": "mdi:alert", "state_attrs": lambda: {}},
         }
+        mock_device.entity_keys = lambda domain: tuple(
+            getattr(mock_device, f"hass_{domain}")
+        )
 
         await coordinator.update_hass_entities("sensor", mock_device)
 
@@ -250,6 +272,30 @@ class TestDevicesCoordinatorUpdateHassEntities:
         added = add_sensor.call_args[0][0]
         assert len(added) >= 1
 
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_update_hass_entities_skips_descriptors_once_created(
+        self, coordinator, coordinator_hass_data
+    ) -> None:
+        """Test descriptors are only built while entities are missing."""
+        add_sensor = MagicMock()
+        coordinator_hass_data["add_entities"]["test-entry-123"] = {
+            "sensor": add_sensor,
+        }
+        mock_device = MagicMock()
+        mock_device.id = "dev1"
+        mock_device.mac = "AA:BB:CC:DD:EE:FF"
+        mock_device.type = "LITTER_BOX_599"
+        mock_device.detail = {}
+        descriptors = PropertyMock(return_value={"state": {"icon": "mdi:info"}})
+        type(mock_device).hass_sensor = descriptors
+        mock_device.entity_keys = MagicMock(return_value=("state",))
+
+        await coordinator.update_hass_entities("sensor", mock_device)
+        await coordinator.update_hass_entities("sensor", mock_device)
+
+        add_sensor.assert_called_once()
+        descriptors.assert_called_once()
+
     @pytest.mark.usefixtures("enable_custom_integrations")
     async def test_update_hass_entities_skips_when_no_add(
         self, coordinator, coordinator_hass_data
@@ -282,3 +328,416 @@ class TestDevicesCoordinatorUpdateHassEntities:
         await coordinator.update_hass_entities("sensor", mock_device)
 
         add_sensor.assert_not_called()
+
+
+class TestDevicesCoordinatorChangeDetection:
+    """Tests for skipping detail fetches of unchanged idle devices."""
+
+    @pytest.fixture
+    def change_coordinator(self, mock_account, coordinator_hass_data):
+        """Create a coordinator with change detection enabled."""
+        mock_account.get_config = MagicMock(
+            side_effect=lambda key, default=None: {
+                "change_detection": True,
+                "max_detail_staleness": 600,
+            }.get(key, default)
+        )
+        mock_account.get_devices = AsyncMock(
+            return_value=[{"id": "dev1", "deviceType": "SCOOPER", "online": True}]
+        )
+        mock_account.get_cats = AsyncMock(return_value=[])
+        return DevicesCoordinator(mock_account, "entry-1")
+
+    @pytest.fixture
+    def idle_device(self, coordinator_hass_data):
+        """Register an idle existing device."""
+        device = MagicMock()
+        device.id = "dev1"
+        device.idle = True
+        device.running = False
+        device.offline = False
+        device.in_quiet_hours = False
+        device.acted_within = MagicMock(return_value=False)
+        device.detail_at = 0
+
+        async def fetched():
+            device.detail_at += 1
+
+        device.async_init = AsyncMock(side_effect=fetched)
+        coordinator_hass_data["devices"]["dev1"] = device
+        return device
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_unchanged_idle_device_skipped(
+        self, change_coordinator, idle_device
+    ) -> None:
+        """Test detail is fetched once while the list entry stays the same."""
+        await change_coordinator._async_update_data()
+        await change_coordinator._async_update_data()
+        assert idle_device.async_init.call_count == 1
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_changed_entry_fetches_detail(
+        self, change_coordinator, mock_account, idle_device
+    ) -> None:
+        """Test a changed list entry triggers a detail fetch."""
+        await change_coordinator._async_update_data()
+        mock_account.get_devices.return_value = [
+            {"id": "dev1", "deviceType": "SCOOPER", "online": False}
+        ]
+        await change_coordinator._async_update_data()
+        assert idle_device.async_init.call_count == 2
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_busy_device_always_fetches(
+        self, change_coordinator, idle_device
+    ) -> None:
+        """Test a working device is fetched every time it is due."""
+        idle_device.idle = False
+        idle_device.running = True
+        with patch_clock(1000.0, 1015.0):
+            await change_coordinator._async_update_data()
+            await change_coordinator._async_update_data()
+        assert idle_device.async_init.call_count == 2
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_stale_detail_refetched(
+        self, change_coordinator, idle_device
+    ) -> None:
+        """Test detail older than max staleness is fetched again."""
+        with patch_clock(1000.0, 1500.0, 1600.0):
+            await change_coordinator._async_update_data()
+            await change_coordinator._async_update_data()
+            await change_coordinator._async_update_data()
+        assert idle_device.async_init.call_count == 2
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_failed_fetch_not_skipped(
+        self, change_coordinator, idle_device
+    ) -> None:
+        """Test a device without a fresh detail is fetched again when due."""
+        idle_device.async_init.side_effect = None
+        with patch_clock(1000.0, 1060.0):
+            await change_coordinator._async_update_data()
+            await change_coordinator._async_update_data()
+        assert idle_device.async_init.call_count == 2
+        assert "dev1" not in change_coordinator._detail_fetched_at
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_disabled_by_default(self, coordinator, mock_account) -> None:
+        """Test change detection is opt-in."""
+        mock_account.get_config = MagicMock(return_value=False)
+        assert DevicesCoordinator(mock_account, "entry-2").change_detection is False
+
+
+class TestDevicesCoordinatorPollScheduling:
+    """Tests for per-device adaptive polling in the coordinator."""
+
+    @pytest.fixture
+    def device(self, coordinator_hass_data):
+        """Register an existing idle device."""
+        device = MagicMock()
+        device.id = "dev1"
+        device.idle = True
+        device.running = False
+        device.offline = False
+        device.in_quiet_hours = False
+        device.acted_within = MagicMock(return_value=False)
+        device.async_init = AsyncMock()
+        coordinator_hass_data["devices"]["dev1"] = device
+        return device
+
+    async def _run(self, coordinator, *times: float) -> None:
+        with patch_clock(*times):
+            for _ in times:
+                await coordinator._async_update_data()
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_idle_device_polled_on_normal_interval(
+        self, coordinator, mock_account, device
+    ) -> None:
+        """Test an idle device is not refetched before the normal interval."""
+        mock_account.get_devices = AsyncMock(return_value=[{"id": "dev1"}])
+        mock_account.get_cats = AsyncMock(return_value=[])
+        await self._run(coordinator, 1000.0, 1030.0, 1060.0)
+        assert device.async_init.call_count == 2
+        assert mock_account.get_cats.call_count == 2
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_running_device_shortens_interval(
+        self, coordinator, mock_account, device
+    ) -> None:
+        """Test a running device switches the coordinator to the fast interval."""
+        from datetime import timedelta
+
+        device.running = True
+        mock_account.get_devices = AsyncMock(return_value=[{"id": "dev1"}])
+        mock_account.get_cats = AsyncMock(return_value=[])
+        await self._run(coordinator, 1000.0, 1015.0)
+        assert device.async_init.call_count == 2
+        assert coordinator.update_interval == timedelta(seconds=15)
+        assert mock_account.get_cats.call_count == 1
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_offline_device_polled_slowly(
+        self, coordinator, mock_account, device
+    ) -> None:
+        """Test an offline device waits for the slow interval."""
+        device.offline = True
+        mock_account.get_devices = AsyncMock(return_value=[{"id": "dev1"}])
+        mock_account.get_cats = AsyncMock(return_value=[])
+        await self._run(coordinator, 1000.0, 1060.0, 1300.0)
+        assert device.async_init.call_count == 2
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_early_fetch_replans_device(
+        self, coordinator, mock_account, device
+    ) -> None:
+        """Test a device fetched early on a list change moves to its new tier."""
+        mock_account.get_devices = AsyncMock(return_value=[{"id": "dev1"}])
+        mock_account.get_cats = AsyncMock(return_value=[])
+        await self._run(coordinator, 1000.0)
+
+        device.running = True
+        mock_account.get_devices.return_value = [{"id": "dev1", "status": "01"}]
+        await self._run(coordinator, 1030.0, 1045.0)
+
+        assert device.async_init.call_count == 3
+        assert coordinator.scheduler.tiers["dev1"] == "fast"
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_action_polls_device_fast(self, coordinator, device) -> None:
+        """Test a user action moves the device to the fast tier at once."""
+        from datetime import timedelta
+
+        with (
+            patch_clock(1000.0),
+            patch.object(coordinator, "_schedule_refresh") as rearm,
+        ):
+            coordinator.async_note_action(device)
+
+        assert coordinator.scheduler.tiers["dev1"] == "fast"
+        assert not coordinator.scheduler.due("dev1", 1010.0)
+        assert coordinator.scheduler.due("dev1", 1015.0)
+        assert coordinator.update_interval == timedelta(seconds=15)
+        rearm.assert_called_once()
+
+
+class TestDevicesCoordinatorStagedRefresh:
+    """Tests for the staged, concurrent refresh pipeline."""
+
+    def _devices(self, coordinator_hass_data, count: int, init) -> list:
+        devices = []
+        for i in range(count):
+            device = MagicMock()
+            device.id = f"dev{i}"
+            device.async_init = AsyncMock(side_effect=init)
+            coordinator_hass_data["devices"][device.id] = device
+            devices.append(device)
+        return devices
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_devices_refreshed_concurrently_with_bound(
+        self, coordinator, mock_account, coordinator_hass_data
+    ) -> None:
+        """Test device detail fetches overlap but never exceed the worker bound."""
+        from custom_components.catlink.modules.devices_coordinator import (
+            REFRESH_WORKERS,
+        )
+
+        active = 0
+        peak = 0
+
+        async def init():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        count = REFRESH_WORKERS + 4
+        self._devices(coordinator_hass_data, count, init)
+        mock_account.get_devices = AsyncMock(
+            return_value=[{"id": f"dev{i}"} for i in range(count)]
+        )
+        mock_account.get_cats = AsyncMock(return_value=[])
+
+        await coordinator._async_update_data()
+
+        assert peak == REFRESH_WORKERS
+        assert set(coordinator.stage_timings) == {
+            "list",
+            "devices",
+            "cats",
+            "publish",
+            "total",
+        }
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_cats_fetched_while_devices_refresh(
+        self, coordinator, mock_account, coordinator_hass_data
+    ) -> None:
+        """Test cats do not wait for slow devices."""
+        gate = asyncio.Event()
+        cats_started = asyncio.Event()
+
+        async def init():
+            await gate.wait()
+
+        async def get_cats(_tz):
+            cats_started.set()
+            gate.set()
+            return []
+
+        self._devices(coordinator_hass_data, 1, init)
+        mock_account.get_devices = AsyncMock(return_value=[{"id": "dev0"}])
+        mock_account.get_cats = AsyncMock(side_effect=get_cats)
+
+        await asyncio.wait_for(coordinator._async_update_data(), 1)
+
+        assert cats_started.is_set()
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_failing_device_does_not_fail_refresh(
+        self, coordinator, mock_account, coordinator_hass_data
+    ) -> None:
+        """Test one device error is logged and the others still refresh."""
+        bad, good = self._devices(coordinator_hass_data, 2, None)
+        bad.async_init.side_effect = ValueError("boom")
+        mock_account.get_devices = AsyncMock(
+            return_value=[{"id": "dev0"}, {"id": "dev1"}]
+        )
+        mock_account.get_cats = AsyncMock(return_value=[])
+
+        result = await coordinator._async_update_data()
+
+        assert set(result) == {"dev0", "dev1"}
+        good.async_init.assert_called_once()
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_slow_device_served_stale_past_deadline(
+        self, coordinator, mock_account, coordinator_hass_data
+    ) -> None:
+        """Test a hung device does not hold the refresh past its deadline."""
+        gate = asyncio.Event()
+
+        slow, fast = self._devices(coordinator_hass_data, 2, None)
+
+        async def hang():
+            await gate.wait()
+            slow.detail_at = 2
+
+        async def fetched():
+            fast.detail_at = 2
+
+        slow.async_init.side_effect = hang
+        fast.async_init.side_effect = fetched
+        mock_account.get_devices = AsyncMock(
+            return_value=[{"id": "dev0"}, {"id": "dev1"}]
+        )
+        mock_account.get_cats = AsyncMock(return_value=[])
+        coordinator.refresh_deadline = 0.05
+
+        result = await asyncio.wait_for(coordinator._async_update_data(), 1)
+
+        assert set(result) == {"dev0", "dev1"}
+        slow.set_stale.assert_called_once_with(True)
+        fast.set_stale.assert_called_once_with(False)
+        assert "dev0" not in coordinator._detail_fetched_at
+
+        # A straggler is not fetched again while it runs
+        await coordinator._async_update_data()
+        slow.async_init.assert_called_once()
+
+        gate.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        slow.set_stale.assert_called_with(False)
+        assert "dev0" in coordinator._detail_fetched_at
+        assert coordinator._stragglers == {}
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_failed_straggler_stays_stale(
+        self, coordinator, mock_account, coordinator_hass_data
+    ) -> None:
+        """Test a late fetch without a new detail keeps the device stale."""
+        gate = asyncio.Event()
+
+        async def hang():
+            await gate.wait()
+            raise RuntimeError("boom")
+
+        (slow,) = self._devices(coordinator_hass_data, 1, hang)
+        mock_account.get_devices = AsyncMock(return_value=[{"id": "dev0"}])
+        mock_account.get_cats = AsyncMock(return_value=[])
+        coordinator.refresh_deadline = 0.05
+
+        await asyncio.wait_for(coordinator._async_update_data(), 1)
+        gate.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        slow.set_stale.assert_called_once_with(True)
+        assert coordinator._stragglers == {}
+
+
+class TestDevicesCoordinatorOptions:
+    """Tests for applying options to a running DevicesCoordinator."""
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_update_options_removes_deselected_devices(
+        self, hass, coordinator, mock_account, coordinator_hass_data
+    ) -> None:
+        """Test deselected devices are dropped with their entities and logs."""
+        keep = MagicMock(id="dev1", type="C08", mac="m1", coordinator=coordinator)
+        drop = MagicMock(id="dev2", type="SCOOPER", mac="m2", coordinator=coordinator)
+        cat = MagicMock(id="cat-1", type="CAT", mac="cat-1", coordinator=coordinator)
+        coordinator_hass_data["devices"].update(
+            {"dev1": keep, "dev2": drop, "cat-1": cat}
+        )
+        ent_reg = er.async_get(hass)
+        reg_entry = ent_reg.async_get_or_create("sensor", DOMAIN, "SCOOPER_m2-state")
+        coordinator._subs["sensor.state.dev2"] = MagicMock(entity_id=reg_entry.entity_id)
+        coordinator._subs["sensor.state.dev1"] = MagicMock(entity_id="sensor.keep")
+        coordinator._created[("dev2", "sensor")] = {"state"}
+        coordinator.logs_scheduler.async_register(drop)
+        mock_account.update_interval = timedelta(seconds=30)
+        coordinator.async_request_refresh = AsyncMock()
+
+        await coordinator.async_update_options(
+            {CONF_DEVICE_IDS: ["dev1", "dev3"], CONF_UPDATE_INTERVAL: 30}
+        )
+        coordinator.logs_scheduler.async_stop()
+
+        mock_account.update_config.assert_called_once()
+        assert set(coordinator_hass_data["devices"]) == {"dev1", "cat-1"}
+        assert list(coordinator._subs) == ["sensor.state.dev1"]
+        assert ("dev2", "sensor") not in coordinator._created
+        assert ent_reg.async_get(reg_entry.entity_id) is None
+        assert coordinator.logs_scheduler.device_ids == []
+        assert coordinator._device_ids == ["dev1", "dev3"]
+        assert coordinator.scheduler.intervals["normal"] == timedelta(seconds=30)
+        coordinator.async_request_refresh.assert_called_once()
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_update_options_applies_refresh_options(
+        self, coordinator, mock_account
+    ) -> None:
+        """Test refresh options take effect on the running coordinator."""
+        options = {
+            "change_detection": True,
+            "max_detail_staleness": 120,
+            "refresh_deadline": 45,
+        }
+        mock_account.get_config = MagicMock(
+            side_effect=lambda key, default=None: options.get(key, default)
+        )
+        coordinator.async_request_refresh = AsyncMock()
+        assert coordinator.change_detection is False
+
+        await coordinator.async_update_options(options)
+        coordinator.logs_scheduler.async_stop()
+
+        assert coordinator.change_detection is True
+        assert coordinator.max_detail_staleness == 120
+        assert coordinator.refresh_deadline == 45
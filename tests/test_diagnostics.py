@@ -0,0 +1,55 @@
+"""Tests for CatLink diagnostics."""
+
+from unittest.mock import MagicMock
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import CONF_PASSWORD, CONF_TOKEN
+from homeassistant.core import HomeAssistant
+
+from custom_components.catlink.const import CONF_PHONE, CONF_PHONE_IAC, DOMAIN
+from custom_components.catlink.diagnostics import async_get_config_entry_diagnostics
+from custom_components.catlink.modules.metrics import RequestMetrics
+
+
+async def test_diagnostics_redacts_credentials(hass: HomeAssistant) -> None:
+    """Test diagnostics include metrics and hide credentials."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="+8613812345678",
+        data={
+            CONF_PHONE_IAC: "86",
+            CONF_PHONE: "13812345678",
+            CONF_PASSWORD: "secret",
+            CONF_TOKEN: "tok",
+        },
+    )
+    entry.add_to_hass(hass)
+    metrics = RequestMetrics()
+    metrics.observe("token/device/list", 0.2, 10, 0)
+    coordinator = MagicMock()
+    coordinator.account.metrics = metrics
+    coordinator.account.coalesce_stats = {"hits": 1, "misses": 2}
+    coordinator.account.limiter.stats = {"requests": 1}
+    coordinator.account.response_cache.stats = {"hits": 0}
+    coordinator.account.circuit_states = {"token/device/list": "closed"}
+    coordinator.stage_timings = {"total": 0.5}
+    coordinator.scheduler.tiers = {}
+    device = MagicMock(id="dev1", type="C08", model="C08", mac="AA:BB", state="idle")
+    # Devices of other entries share coordinator.data and must not show up
+    other = MagicMock(id="dev2", type="C08", model="C08", mac="CC:DD", state="idle")
+    coordinator.data = {"dev1": device, "dev2": other}
+    coordinator.entry_devices.return_value = [device]
+    hass.data[DOMAIN] = {"entry_coordinators": {entry.entry_id: coordinator}}
+
+    data = await async_get_config_entry_diagnostics(hass, entry)
+
+    entry_data = data["entry"]["data"]
+    assert entry_data[CONF_PASSWORD] == "**REDACTED**"
+    assert entry_data[CONF_TOKEN] == "**REDACTED**"
+    assert entry_data[CONF_PHONE] == "**REDACTED**"
+    assert data["entry"]["title"] == "**REDACTED**"
+    assert data["metrics"]["totals"]["requests"] == 1
+    assert data["circuits"] == {"token/device/list": "closed"}
+    assert [d["id"] for d in data["devices"]] == ["dev1"]
+    assert data["devices"][0]["mac"] == "**REDACTED**"
@@ -25,6 +25,7 @@ def mock_device():
     device.name = "Test Litter Box"
     device.model = "LB599"
     device.detail = {"firmwareVersion": "1.0.0"}
+    device.staleness = None
     device.listeners = {}
     return device
 
@@ -73,6 +74,53 @@ class TestCatlinkEntity:
         assert entity._attr_device_id == "LITTER_BOX_599_AABBCCDDEEFF"
         assert entity._attr_unique_id == "LITTER_BOX_599_AABBCCDDEEFF-error"
 
+    def test_entity_writes_state_only_on_change(
+        self, hass, real_device, mock_coordinator
+    ) -> None:
+        """Test repeated updates with the same state do not rewrite it."""
+        entity = CatlinkSensorEntity("error", real_device, {"icon": "mdi:alert"})
+        entity.hass = hass
+        entity.async_write_ha_state = MagicMock()
+
+        entity._handle_coordinator_update()
+        entity._handle_coordinator_update()
+        assert entity.async_write_ha_state.call_count == 1
+
+        real_device.detail = {**real_device.detail, "currentError": "Jammed"}
+        entity._handle_coordinator_update()
+        assert entity.async_write_ha_state.call_count == 2
+
+    def test_entity_category_and_enabled_default(
+        self, hass, mock_device, mock_coordinator
+    ) -> None:
+        """Test descriptors set the entity category and enabled default."""
+        from homeassistant.const import EntityCategory
+
+        mock_device.coordinator = mock_coordinator
+        plain = CatlinkEntity("state", mock_device, {})
+        tiered = CatlinkEntity(
+            "wifi_rssi",
+            mock_device,
+            {"category": EntityCategory.DIAGNOSTIC, "enabled_default": False},
+        )
+
+        assert plain.entity_category is None
+        assert plain.entity_registry_enabled_default is True
+        assert tiered.entity_category is EntityCategory.DIAGNOSTIC
+        assert tiered.entity_registry_enabled_default is False
+
+    async def test_entity_stops_listening_when_removed(
+        self, hass, mock_device, mock_coordinator
+    ) -> None:
+        """Test a removed (e.g. disabled) entity no longer follows the device."""
+        mock_device.coordinator = mock_coordinator
+        entity = CatlinkEntity("state", mock_device, {})
+        mock_device.listeners[entity.entity_id] = entity._handle_coordinator_update
+
+        await entity.async_will_remove_from_hass()
+
+        assert mock_device.listeners == {}
+
     def test_entity_device_info(
         self, hass, mock_device, mock_coordinator
     ) -> None:
@@ -327,6 +375,28 @@ class TestCatlinkSensorEntity:
         assert entity._attr_extra_state_attributes == {"days_left": 5}
         assert entity._attr_native_unit_of_measurement == "days"
 
+    def test_sensor_update_adds_staleness(
+        self, hass, mock_device, mock_coordinator
+    ) -> None:
+        """Test a device serving stale detail reports its age as an attribute."""
+        mock_device.coordinator = mock_coordinator
+        mock_device.litter_weight = 2.5
+        mock_device.staleness = 41.6
+        entity = CatlinkSensorEntity(
+            "litter_weight",
+            mock_device,
+            {"unit": "kg", "state_attrs": lambda: {"key": "val"}},
+        )
+        entity.coordinator = mock_coordinator
+        entity.hass = hass
+
+        entity.update()
+        assert entity._attr_extra_state_attributes == {"key": "val", "staleness": 42}
+
+        mock_device.staleness = None
+        entity.update()
+        assert entity._attr_extra_state_attributes == {"key": "val"}
+
     def test_sensor_update_without_state_attrs(
         self, hass, mock_device, mock_coordinator
     ) -> None:
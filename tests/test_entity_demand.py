@@ -0,0 +1,90 @@
+"""Tests for CatLink entity demand module."""
+
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.catlink.const import DOMAIN
+from custom_components.catlink.devices.c08 import (
+    API_LITTERBOX_ABOUT_DEVICE,
+    API_LITTERBOX_C08_WIFI_INFO,
+    API_LITTERBOX_STATS_DATA_COMPARE_V2,
+    C08Device,
+)
+from custom_components.catlink.devices.scooper import ScooperDevice
+from custom_components.catlink.modules.entity_demand import LOGS, EntityDemand
+
+C08 = {
+    "id": "c08-1",
+    "mac": "01:23:45:67:89:AB",
+    "model": "Open-X",
+    "deviceName": "Bedroom C08",
+    "deviceType": "C08",
+}
+
+
+def _disable(ent_reg: er.EntityRegistry, dvc, domain: str, key: str) -> str:
+    """Register an entity of the device disabled by the user."""
+    return ent_reg.async_get_or_create(
+        domain,
+        DOMAIN,
+        f"{dvc.type}_{dvc.mac}-{key}",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    ).entity_id
+
+
+class TestEntityDemand:
+    """Tests for EntityDemand."""
+
+    async def test_unregistered_entities_follow_their_default(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test endpoints of entities not registered yet follow enabled_default."""
+        demand = EntityDemand(hass)
+        dvc = C08Device(C08, MagicMock())
+
+        assert demand.wants(dvc, LOGS)
+        assert demand.wants(dvc, API_LITTERBOX_ABOUT_DEVICE)
+        assert not demand.wants(dvc, API_LITTERBOX_C08_WIFI_INFO)
+        assert not demand.wants(dvc, API_LITTERBOX_STATS_DATA_COMPARE_V2)
+        assert demand.wants(dvc, "token/unclaimed")
+
+    async def test_endpoint_idle_once_all_consumers_disabled(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test an endpoint is skipped only when all its entities are disabled."""
+        demand = EntityDemand(hass)
+        unsub = demand.async_setup()
+        ent_reg = er.async_get(hass)
+        dvc = C08Device(C08, MagicMock())
+
+        rssi = ent_reg.async_get_or_create(
+            "sensor", DOMAIN, f"{dvc.type}_{dvc.mac}-wifi_rssi"
+        ).entity_id
+        _disable(ent_reg, dvc, "sensor", "wifi_ssid")
+        await hass.async_block_till_done()
+        assert demand.wants(dvc, API_LITTERBOX_C08_WIFI_INFO)
+
+        ent_reg.async_update_entity(
+            rssi, disabled_by=er.RegistryEntryDisabler.USER
+        )
+        _disable(ent_reg, dvc, "sensor", "last_log")
+        await hass.async_block_till_done()
+        assert not demand.wants(dvc, API_LITTERBOX_C08_WIFI_INFO)
+        assert not demand.wants(dvc, LOGS)
+        assert demand.wants(dvc, API_LITTERBOX_ABOUT_DEVICE)
+
+        ent_reg.async_update_entity(rssi, disabled_by=None)
+        await hass.async_block_till_done()
+        assert demand.wants(dvc, API_LITTERBOX_C08_WIFI_INFO)
+        unsub()
+
+    async def test_logs_demand_of_other_devices(self, hass: HomeAssistant) -> None:
+        """Test the logs of any device follow its last log sensor."""
+        demand = EntityDemand(hass)
+        dvc = ScooperDevice({**C08, "deviceType": "SCOOPER"}, MagicMock())
+
+        _disable(er.async_get(hass), dvc, "sensor", "last_log")
+
+        assert not demand.wants(dvc, LOGS)
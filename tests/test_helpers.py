@@ -1,11 +1,12 @@
 """Tests for CatLink helper functions."""
 
+import asyncio
 from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from custom_components.catlink.const import DOMAIN
+from custom_components.catlink.const import API_SERVERS, DOMAIN
 from custom_components.catlink.helpers import (
     Helper,
     async_setup_domain_platform,
@@ -121,12 +122,15 @@ class TestDiscoverRegion:
         ) as mock_account_cls:
             mock_account = MagicMock()
             mock_account.async_login = AsyncMock(return_value=True)
+            mock_account.async_check_auth = AsyncMock()
+            mock_account.async_cancel_login = AsyncMock()
             mock_account_cls.return_value = mock_account
 
             result = await discover_region(hass, "86", "13812345678", "testpass")
 
             assert result == "global"
-            mock_account.async_login.assert_called_once()
+            mock_account.async_login.assert_called_once_with(save_auth=False)
+            mock_account.async_check_auth.assert_called_once_with(True)
 
     @pytest.mark.usefixtures("enable_custom_integrations")
     async def test_discover_region_returns_none_when_all_fail(self, hass) -> None:
@@ -136,11 +140,120 @@ class TestDiscoverRegion:
         ) as mock_account_cls:
             mock_account = MagicMock()
             mock_account.async_login = AsyncMock(return_value=False)
+            mock_account.async_check_auth = AsyncMock()
+            mock_account.async_cancel_login = AsyncMock()
             mock_account_cls.return_value = mock_account
 
             result = await discover_region(hass, "86", "13812345678", "wrongpass")
 
             assert result is None
+            mock_account.async_check_auth.assert_not_called()
+
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_discover_region_starts_others_when_leader_fails(
+        self, hass, hass_storage
+    ) -> None:
+        """Test a failed first region lets the others race without waiting."""
+        bases = {}
+        accounts = {}
+
+        def make_account(_hass, config):
+            account = MagicMock()
+            region = next(r for r, b in API_SERVERS.items() if b == config["api_base"])
+            bases[region] = config
+            account.async_login = AsyncMock(return_value=region == "usa")
+            account.async_check_auth = AsyncMock()
+            account.async_cancel_login = AsyncMock()
+            accounts[region] = account
+            return account
+
+        with (
+            patch(
+                "custom_components.catlink.modules.account.Account",
+                side_effect=make_account,
+            ),
+            patch("custom_components.catlink.helpers.REGION_HEAD_START", 60),
+        ):
+            result = await asyncio.wait_for(
+                discover_region(hass, "1", "5551234567", "testpass"), 1
+            )
+
+        assert result == "usa"
+        assert bases["usa"]["password"] != "testpass"
+        # Only the winner persists its auth
+        for region, account in accounts.items():
+            assert account.async_check_auth.called == (region == "usa")
+        assert hass_storage["catlink.regions"]["data"] == {"1": "usa"}
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_discover_region_stops_losing_logins_before_release(
+        self, hass
+    ) -> None:
+        """Test a losing login is cancelled before its session is released."""
+        from custom_components.catlink.modules.account import Account
+
+        hung = asyncio.Event()
+        calls = []
+
+        async def request(self, api, pms=None, method="GET", **kwargs):
+            if self.get_config("api_base") == API_SERVERS["global"]:
+                hung.set()
+                try:
+                    await asyncio.Event().wait()
+                finally:
+                    calls.append(("cancelled", self.get_config("api_base")))
+            await hung.wait()
+            return {"data": {"token": "tok"}}
+
+        def release(self):
+            calls.append(("released", self.get_config("api_base")))
+
+        with (
+            patch.object(Account, "request", request),
+            patch.object(Account, "async_release", release),
+            patch.object(Account, "async_check_auth", AsyncMock()),
+            patch("custom_components.catlink.helpers.REGION_HEAD_START", 0),
+        ):
+            result = await asyncio.wait_for(
+                discover_region(hass, "86", "13812345678", "testpass"), 1
+            )
+
+        assert result != "global"
+        loser = [c for c in calls if c[1] == API_SERVERS["global"]]
+        assert loser == [
+            ("cancelled", API_SERVERS["global"]),
+            ("released", API_SERVERS["global"]),
+        ]
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_discover_region_tries_cached_region_first(
+        self, hass, hass_storage
+    ) -> None:
+        """Test the region cached for the prefix is tried alone first."""
+        hass_storage["catlink.regions"] = {
+            "version": 1,
+            "key": "catlink.regions",
+            "data": {"65": "singapore"},
+        }
+        tried = []
+
+        def make_account(_hass, config):
+            account = MagicMock()
+            tried.append(config["api_base"])
+            account.async_login = AsyncMock(return_value=True)
+            account.async_check_auth = AsyncMock()
+            account.async_cancel_login = AsyncMock()
+            return account
+
+        with patch(
+            "custom_components.catlink.modules.account.Account",
+            side_effect=make_account,
+        ):
+            result = await discover_region(hass, "65", "91234567", "testpass")
+
+        assert result == "singapore"
+        assert tried == [API_SERVERS["singapore"]]
 
 
 class TestAsyncSetupDomainPlatform:
@@ -0,0 +1,100 @@
+"""Tests for CatLink shared HTTP pool module."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.catlink.const import API_SERVERS
+from custom_components.catlink.modules.account import Account
+from custom_components.catlink.modules.http_pool import HttpPool, async_get_http_pool
+
+
+def _session() -> MagicMock:
+    """Return a mock aiohttp session."""
+    session = MagicMock()
+    session.closed = False
+    session.close = AsyncMock()
+    rsp = MagicMock(status=200)
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=rsp)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    session.head = MagicMock(return_value=ctx)
+    return session
+
+
+@pytest.fixture
+def mock_create_session():
+    """Patch session creation to return fresh mock sessions."""
+    with patch.object(
+        HttpPool, "_create_session", side_effect=lambda: _session()
+    ) as mock_create:
+        yield mock_create
+
+
+@pytest.mark.usefixtures("mock_create_session")
+class TestHttpPool:
+    """Tests for HttpPool."""
+
+    async def test_singleton_per_hass(self, hass) -> None:
+        """Test one pool is shared per Home Assistant instance."""
+        assert async_get_http_pool(hass) is async_get_http_pool(hass)
+
+    async def test_same_base_shares_session(self, hass) -> None:
+        """Test accounts on one API base share a session."""
+        pool = HttpPool(hass)
+        first = pool.async_acquire(API_SERVERS["global"])
+        second = pool.async_acquire(API_SERVERS["global"].rstrip("/"))
+        other = pool.async_acquire(API_SERVERS["china"])
+        assert first is second
+        assert first is not other
+
+    async def test_release_closes_unused_session(self, hass) -> None:
+        """Test the session closes when its last reference is released."""
+        pool = HttpPool(hass)
+        session = pool.async_acquire(API_SERVERS["usa"])
+        pool.async_acquire(API_SERVERS["usa"])
+
+        pool.async_release(API_SERVERS["usa"])
+        await hass.async_block_till_done()
+        session.close.assert_not_called()
+
+        pool.async_release(API_SERVERS["usa"])
+        await hass.async_block_till_done()
+        session.close.assert_called_once()
+        assert pool.async_acquire(API_SERVERS["usa"]) is not session
+
+    async def test_warm_up_once(self, hass) -> None:
+        """Test warm-up opens one connection per session."""
+        pool = HttpPool(hass)
+        session = pool.async_acquire(API_SERVERS["global"])
+        await pool.async_warm_up(API_SERVERS["global"])
+        await pool.async_warm_up(API_SERVERS["global"])
+        session.head.assert_called_once()
+
+    async def test_warm_up_without_session_is_noop(self, hass) -> None:
+        """Test warm-up does nothing for an API base nobody uses."""
+        await HttpPool(hass).async_warm_up(API_SERVERS["singapore"])
+
+    async def test_close_closes_all(self, hass) -> None:
+        """Test closing the pool closes every session."""
+        pool = HttpPool(hass)
+        sessions = [pool.async_acquire(base) for base in API_SERVERS.values()]
+        await pool.async_close()
+        for session in sessions:
+            session.close.assert_called_once()
+
+    async def test_account_release_is_idempotent(self, hass) -> None:
+        """Test releasing an account twice drops a single reference."""
+        config = {"api_base": API_SERVERS["global"], "phone": "1", "phone_iac": "86"}
+        keep = Account(hass, dict(config))
+        done = Account(hass, dict(config))
+        assert keep.http is done.http
+
+        done.async_release()
+        done.async_release()
+        await hass.async_block_till_done()
+        keep.http.close.assert_not_called()
+
+        keep.async_release()
+        await hass.async_block_till_done()
+        keep.http.close.assert_called_once()
@@ -51,6 +51,9 @@ def mock_coordinator():
         instance = mock.return_value
         instance.name = f"{DOMAIN}-86-13812345678-devices"
         instance.async_refresh = AsyncMock()
+        instance.async_restore_snapshot = AsyncMock(return_value=False)
+        instance.snapshot.async_save = AsyncMock()
+        instance.entry_devices.return_value = []
         instance.data = {}
         yield mock
 
@@ -156,3 +159,53 @@ async def test_async_setup_entry_forwards_all_platforms(
         mock_forward.assert_called_once()
         call_args = mock_forward.call_args
         assert call_args[0][1] == SUPPORTED_DOMAINS
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_async_setup_entry_refreshes_in_background_after_restore(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_account,
+    mock_coordinator,
+) -> None:
+    """Test a restored snapshot lets setup finish before the first refresh."""
+    await async_setup(hass, {})
+    mock_coordinator.return_value.async_restore_snapshot.return_value = True
+    mock_config_entry.add_to_hass(hass)
+
+    with patch.object(
+        hass.config_entries, "async_forward_entry_setups", new_callable=AsyncMock
+    ) as mock_forward:
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        mock_forward.assert_called_once()
+        await hass.async_block_till_done()
+
+    mock_account.return_value.async_check_auth.assert_called_once()
+    mock_coordinator.return_value.async_refresh.assert_called_once()
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_options_update_applies_without_reload(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_account,
+    mock_coordinator,
+) -> None:
+    """Test changed options reach the running coordinator."""
+    await async_setup(hass, {})
+    mock_coordinator.return_value.async_update_options = AsyncMock()
+    mock_config_entry.add_to_hass(hass)
+    with patch.object(
+        hass.config_entries, "async_forward_entry_setups", new_callable=AsyncMock
+    ):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={"device_ids": ["dev1"], "update_interval": 120}
+    )
+    await hass.async_block_till_done()
+
+    mock_coordinator.return_value.async_update_options.assert_called_once_with(
+        {"device_ids": ["dev1"], "update_interval": 120}
+    )
+    assert mock_account.call_count == 1
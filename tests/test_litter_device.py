@@ -68,6 +68,18 @@ class TestLitterDeviceLitterWeight:
         device.detail = {"catLitterWeight": 3.5}
         assert device.litter_weight == 2.5
 
+    def test_litter_weight_read_adds_no_samples(
+        self, mock_coordinator, sample_device_data
+    ) -> None:
+        """Test reading litter_weight does not record a sample; detail does."""
+        device = LitterBox(sample_device_data, mock_coordinator)
+        device.detail = {"catLitterWeight": 3.5}
+        assert len(device._litter_weight_during_day) == 1
+        for _ in range(3):
+            assert device.litter_weight == 3.5
+        assert len(device._litter_weight_during_day) == 1
+        mock_coordinator.weight_history.async_schedule_save.assert_called_once()
+
     def test_litter_weight_default_empty(
         self, mock_coordinator, sample_device_data
     ) -> None:
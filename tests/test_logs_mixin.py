@@ -71,17 +71,17 @@ class TestLogsMixinLastLog:
 class TestLogsMixinLastLogAttrs:
     """Tests for LogsMixin last_log_attrs."""
 
-    def test_last_log_attrs_includes_logs(
+    def test_last_log_attrs_excludes_history(
         self, mock_coordinator, sample_device_data
     ) -> None:
-        """Test last_log_attrs includes log data and full logs list."""
+        """Test last_log_attrs holds the last entry only, not the logs list."""
         device = LitterBox(sample_device_data, mock_coordinator)
-        device.logs = [{"time": "10:00", "event": "Clean", "extra": "val"}]
+        device.logs = [
+            {"time": "10:00", "event": "Clean", "extra": "val"},
+            {"time": "09:00", "event": "Clean"},
+        ]
         attrs = device.last_log_attrs()
-        assert attrs["time"] == "10:00"
-        assert attrs["event"] == "Clean"
-        assert attrs["extra"] == "val"
-        assert attrs["logs"] == device.logs
+        assert attrs == {"time": "10:00", "event": "Clean", "extra": "val"}
 
 
 class TestLogsMixinFetchLogs:
@@ -146,3 +146,158 @@ class TestLogsMixinFetchLogs:
 
         assert result == []
         assert device.logs == []
+
+
+class TestLogsMixinMerge:
+    """Tests for incremental log merging."""
+
+    def test_merge_logs_dedupes_and_orders(self) -> None:
+        """Test new entries go first and repeats are dropped."""
+        from custom_components.catlink.devices.mixins.logs import merge_logs
+
+        current = [
+            {"time": "09:00", "event": "Clean"},
+            {"time": "08:00", "event": "Clean"},
+        ]
+        fetched = [
+            {"time": "10:00", "event": "Clean"},
+            {"time": "09:00", "event": "Clean"},
+        ]
+        assert merge_logs(current, fetched) == [
+            {"time": "10:00", "event": "Clean"},
+            {"time": "09:00", "event": "Clean"},
+            {"time": "08:00", "event": "Clean"},
+        ]
+
+    def test_merge_logs_bounded(self) -> None:
+        """Test the merged list is capped."""
+        from custom_components.catlink.devices.mixins.logs import merge_logs
+
+        fetched = [{"time": f"{i}", "event": "e"} for i in range(10)]
+        assert len(merge_logs([], fetched, limit=3)) == 3
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_fetch_logs_keeps_history_on_failure(
+        self, mock_coordinator, sample_device_data
+    ) -> None:
+        """Test a failed fetch keeps previously known entries."""
+        device = LitterBox(sample_device_data, mock_coordinator)
+        device.logs = [{"time": "09:00", "event": "Clean"}]
+        mock_coordinator.account.request = AsyncMock(return_value={"data": {}})
+
+        result = await device._fetch_logs("token/litterbox/log", "scooperLogTop5")
+
+        assert result == [{"time": "09:00", "event": "Clean"}]
+
+    @pytest.mark.usefixtures("enable_custom_integrations")
+    async def test_init_logs_registers_and_fetches_once(
+        self, mock_coordinator, sample_device_data
+    ) -> None:
+        """Test the first registration fetches logs and later ones do not."""
+        device = LitterBox(sample_device_data, mock_coordinator)
+        device.update_logs = AsyncMock(return_value=[])
+        register = mock_coordinator.logs_scheduler.async_register
+        register.side_effect = [True, False]
+
+        await device._async_init_logs()
+        await device._async_init_logs()
+
+        assert register.call_count == 2
+        device.update_logs.assert_called_once()
+
+
+class TestLogsMixinEvents:
+    """Tests for LogsMixin log events."""
+
+    def _fired(self, mock_coordinator) -> list[tuple[str, str]]:
+        return [
+            (c.args[1]["time"], c.args[1]["event"])
+            for c in mock_coordinator.hass.bus.async_fire.call_args_list
+        ]
+
+    def test_first_fetch_seeds_silently(
+        self, mock_coordinator, sample_device_data
+    ) -> None:
+        """Test the history of the first fetch is not announced."""
+        device = LitterBox(sample_device_data, mock_coordinator)
+        device._merge_logs([{"time": "10:00", "event": "Clean"}])
+
+        mock_coordinator.hass.bus.async_fire.assert_not_called()
+
+    def test_new_entries_fired_once_oldest_first(
+        self, mock_coordinator, sample_device_data
+    ) -> None:
+        """Test each new entry is fired once, in the order it happened."""
+        from custom_components.catlink.const import EVENT_LOG
+
+        device = LitterBox(sample_device_data, mock_coordinator)
+        device._merge_logs([{"time": "10:00", "event": "Clean"}])
+        fetched = [
+            {"time": "10:20", "event": "Pave"},
+            {"time": "10:10", "event": "Cat came", "type": 1},
+            {"time": "10:00", "event": "Clean"},
+        ]
+        device._merge_logs(fetched)
+        device._merge_logs(fetched)
+
+        assert self._fired(mock_coordinator) == [
+            ("10:10", "Cat came"),
+            ("10:20", "Pave"),
+        ]
+        event_type, data = mock_coordinator.hass.bus.async_fire.call_args_list[0].args
+        assert event_type == EVENT_LOG
+        assert data["type"] == 1
+        assert data["device_id"] == "dev123"
+        assert data["device_type"] == "LITTER_BOX_599"
+
+    def test_failed_first_fetch_does_not_replay(
+        self, mock_coordinator, sample_device_data
+    ) -> None:
+        """Test the history is not announced after an empty first fetch."""
+        device = LitterBox(sample_device_data, mock_coordinator)
+        device._merge_logs([])
+        device._merge_logs(
+            [{"time": "10:10", "event": "Pave"}, {"time": "10:00", "event": "Clean"}]
+        )
+        mock_coordinator.hass.bus.async_fire.assert_not_called()
+
+        device._merge_logs([{"time": "10:20", "event": "Clean"}])
+        assert self._fired(mock_coordinator) == [("10:20", "Clean")]
+
+    def test_logs_wanted_by_event_listeners(
+        self, mock_coordinator, sample_device_data
+    ) -> None:
+        """Test logs are polled for event listeners without the sensor."""
+        from custom_components.catlink.const import EVENT_LOG
+
+        device = LitterBox(sample_device_data, mock_coordinator)
+        mock_coordinator.demand.wants.return_value = False
+        mock_coordinator.hass.bus.async_listeners.return_value = {}
+        assert not device.logs_wanted
+
+        mock_coordinator.hass.bus.async_listeners.return_value = {EVENT_LOG: 1}
+        assert device.logs_wanted
+
+    def test_restored_logs_seed_index(
+        self, mock_coordinator, sample_device_data
+    ) -> None:
+        """Test entries newer than restored logs are announced after a restart."""
+        device = LitterBox(sample_device_data, mock_coordinator)
+        device.logs = [{"time": "10:00", "event": "Clean"}]
+        device._merge_logs(
+            [{"time": "10:30", "event": "Clean"}, {"time": "10:00", "event": "Clean"}]
+        )
+
+        assert self._fired(mock_coordinator) == [("10:30", "Clean")]
+
+    def test_index_is_bounded(self, mock_coordinator, sample_device_data) -> None:
+        """Test the dedupe index forgets the oldest keys."""
+        from custom_components.catlink.devices.mixins.logs import LOG_INDEX_SIZE
+
+        device = LitterBox(sample_device_data, mock_coordinator)
+        device._merge_logs([{"time": "00:00", "event": "seed"}])
+        for i in range(LOG_INDEX_SIZE + 10):
+            device._merge_logs([{"time": f"{i}", "event": "Clean"}])
+
+        assert len(device._log_index) == LOG_INDEX_SIZE
+        assert ("00:00", "seed") not in device._log_index
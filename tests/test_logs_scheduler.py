@@ -0,0 +1,90 @@
+"""Tests for CatLink shared logs scheduler module."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.catlink.modules.logs_scheduler import LogsScheduler
+
+
+def _device(did: str) -> MagicMock:
+    """Return a mock device with logs."""
+    dvc = MagicMock()
+    dvc.id = did
+    dvc.name = did
+    dvc.update_logs = AsyncMock(return_value=[])
+    return dvc
+
+
+class TestLogsScheduler:
+    """Tests for LogsScheduler."""
+
+    async def test_register_once(self, hass: HomeAssistant) -> None:
+        """Test a device is registered only once."""
+        scheduler = LogsScheduler(hass, "test-logs")
+        dvc = _device("d1")
+        assert scheduler.async_register(dvc) is True
+        assert scheduler.async_register(dvc) is False
+        assert scheduler.device_ids == ["d1"]
+        scheduler.async_stop()
+
+    async def test_fetches_all_devices_on_interval(self, hass: HomeAssistant) -> None:
+        """Test one timer fetches the logs of every registered device."""
+        scheduler = LogsScheduler(hass, "test-logs", timedelta(minutes=1))
+        devices = [_device("d1"), _device("d2")]
+        for dvc in devices:
+            scheduler.async_register(dvc)
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=1))
+        await hass.async_block_till_done()
+
+        for dvc in devices:
+            dvc.update_logs.assert_called_once()
+        scheduler.async_stop()
+
+    async def test_failure_does_not_block_others(self, hass: HomeAssistant) -> None:
+        """Test one failing device does not stop the others."""
+        scheduler = LogsScheduler(hass, "test-logs")
+        bad, good = _device("bad"), _device("good")
+        bad.update_logs.side_effect = ValueError("boom")
+        scheduler.async_register(bad)
+        scheduler.async_register(good)
+
+        await scheduler._async_refresh()
+
+        good.update_logs.assert_called_once()
+        scheduler.async_stop()
+
+    async def test_skips_devices_without_logs_demand(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test logs nobody shows are not fetched."""
+        scheduler = LogsScheduler(hass, "test-logs", timedelta(minutes=1))
+        shown, hidden = _device("d1"), _device("d2")
+        hidden.logs_wanted = False
+        scheduler.async_register(shown)
+        scheduler.async_register(hidden)
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=2))
+        await hass.async_block_till_done()
+
+        shown.update_logs.assert_called_once()
+        hidden.update_logs.assert_not_called()
+        scheduler.async_stop()
+
+    async def test_stop_cancels_timer(self, hass: HomeAssistant) -> None:
+        """Test no fetch happens after stop."""
+        scheduler = LogsScheduler(hass, "test-logs", timedelta(minutes=1))
+        dvc = _device("d1")
+        scheduler.async_register(dvc)
+        scheduler.async_stop()
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=2))
+        await hass.async_block_till_done()
+
+        dvc.update_logs.assert_not_called()
+        assert scheduler.device_ids == []
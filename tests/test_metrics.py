@@ -0,0 +1,124 @@
+"""Tests for CatLink request metrics module."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.catlink.entities.metrics import (
+    METRICS_SENSORS,
+    CatlinkMetricsSensorEntity,
+    account_label,
+)
+from custom_components.catlink.modules.metrics import (
+    ByteCounter,
+    LatencyHistogram,
+    RequestMetrics,
+    byte_count_trace_config,
+)
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_empty_percentile(self) -> None:
+        """Test an empty histogram has no percentiles."""
+        assert LatencyHistogram().percentile(50) is None
+
+    def test_percentiles_interpolate_within_buckets(self) -> None:
+        """Test percentiles land in the bucket holding the rank."""
+        histogram = LatencyHistogram((0.1, 1.0))
+        for _ in range(90):
+            histogram.observe(0.05)
+        for _ in range(10):
+            histogram.observe(0.5)
+        assert 0 < histogram.percentile(50) <= 0.1
+        assert 0.1 < histogram.percentile(95) <= 0.5
+        assert histogram.percentile(100) == 0.5
+
+    def test_overflow_bucket_capped_by_max(self) -> None:
+        """Test latencies beyond the last bound report the observed max."""
+        histogram = LatencyHistogram((0.1,))
+        histogram.observe(3.0)
+        assert 0.1 < histogram.percentile(99) <= 3.0
+        assert histogram.percentile(100) == 3.0
+        assert histogram.as_dict()["max_ms"] == 3000.0
+
+
+class TestRequestMetrics:
+    """Tests for RequestMetrics."""
+
+    def test_totals_across_endpoints(self) -> None:
+        """Test counters are kept per endpoint and summed in totals."""
+        metrics = RequestMetrics()
+        metrics.observe("a", 0.2, 100, 0)
+        metrics.observe("a", 0.3, 50, 1002)
+        metrics.observe_failure("b", 60.0, timeout=True)
+        metrics.observe_retry("b")
+        metrics.observe("b", 0.1, 10, "bad")
+
+        endpoint = metrics.endpoints["a"]
+        assert endpoint.requests == 2
+        assert endpoint.errors == 1
+        totals = metrics.totals()
+        assert totals["requests"] == 4
+        assert totals["errors"] == 3
+        assert totals["timeouts"] == 1
+        assert totals["retries"] == 1
+        assert totals["bytes"] == 160
+        assert totals["token_expired"] == 1
+        assert totals["latency"]["count"] == 4
+        assert metrics.as_dict()["endpoints"]["a"]["return_codes"] == {
+            "0": 1,
+            "1002": 1,
+        }
+
+    async def test_trace_config_counts_chunks(self) -> None:
+        """Test response chunks are added to the request's byte counter."""
+        trace_config = byte_count_trace_config()
+        callback = trace_config.on_response_chunk_received[0]
+        counter = ByteCounter()
+        ctx = SimpleNamespace(trace_request_ctx=counter)
+        await callback(None, ctx, SimpleNamespace(chunk=b"12345"))
+        await callback(None, ctx, SimpleNamespace(chunk=b"678"))
+        await callback(
+            None, SimpleNamespace(trace_request_ctx=None), SimpleNamespace(chunk=b"x")
+        )
+        assert counter.bytes == 8
+
+
+class TestMetricsSensors:
+    """Tests for the API metrics sensors."""
+
+    def test_sensor_values(self) -> None:
+        """Test each sensor reads its value from the account totals."""
+        coordinator = MagicMock()
+        coordinator.config_entry_id = "entry-1"
+        coordinator.account.uid = "86-13812345678"
+        metrics = RequestMetrics()
+        metrics.observe("a", 0.2, 100, 0)
+        metrics.observe_failure("a", 10.0, timeout=True)
+        coordinator.account.metrics = metrics
+
+        sensors = {
+            name: CatlinkMetricsSensorEntity(name, coordinator, option, "…5678")
+            for name, option in METRICS_SENSORS.items()
+        }
+
+        assert sensors["api_requests"].native_value == 2
+        assert sensors["api_errors"].native_value == 1
+        assert sensors["api_errors"].extra_state_attributes["timeouts"] == 1
+        assert sensors["api_response_bytes"].native_value == 100
+        assert sensors["api_latency"].native_value is not None
+        assert "p99_ms" in sensors["api_latency"].extra_state_attributes
+        assert sensors["api_requests"].unique_id == "catlink-entry-1-api_requests"
+        assert sensors["api_requests"].name == "CatLink …5678 API requests"
+        assert sensors["api_requests"].device_info["identifiers"] == {
+            ("catlink", "account_entry-1")
+        }
+        assert sensors["api_requests"].device_info["name"] == "CatLink …5678"
+
+    def test_account_label_hides_phone(self) -> None:
+        """Test the label keeps only the last digits of a phone title."""
+        entry = MagicMock(title="+8613812345678", entry_id="0123456789abcdef")
+        assert account_label(entry) == "+…5678"
+        entry.title = ""
+        assert account_label(entry) == "01234567"
@@ -4,10 +4,13 @@ import pytest
 
 from custom_components.catlink.models.additional_cfg import AdditionalDeviceConfig
 from custom_components.catlink.models.api.device import (
+    C08DeviceInfo,
     DeviceInfoBase,
+    FeederDeviceInfo,
     LitterDeviceInfo,
 )
-from custom_components.catlink.models.api.parse import parse_response
+from custom_components.catlink.models.api.logs import LogEntry
+from custom_components.catlink.models.api.parse import parse_payload, parse_response
 
 
 class TestAdditionalDeviceConfig:
@@ -84,3 +87,66 @@ class TestParseResponse:
         data = {"deviceInfo": "not a dict"}
         result = parse_response(data, "deviceInfo", LitterDeviceInfo, default={})
         assert result == {}
+
+
+class TestParsePayload:
+    """Tests for parse_payload utility."""
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            {"workStatus": "00", "catLitterWeight": 3, "online": True, "extra": [1]},
+            {"litterType": "sand", "autoBurial": None, "deviceErrorList": [{}]},
+            {"litterType": 2, "weight": "4.1"},
+            {"catLitterWeight": "3.5", "online": 1},
+            {},
+        ],
+    )
+    @pytest.mark.parametrize(
+        "model", [DeviceInfoBase, LitterDeviceInfo, C08DeviceInfo, FeederDeviceInfo]
+    )
+    def test_matches_model_dump(self, raw: dict, model) -> None:
+        """Test the result equals the validate + model_dump round trip."""
+        expected = model.model_validate(dict(raw)).model_dump(by_alias=True)
+        result = parse_payload({"deviceInfo": dict(raw)}, "deviceInfo", model)
+        assert result == expected
+        assert {k: type(v) for k, v in result.items()} == {
+            k: type(v) for k, v in expected.items()
+        }
+
+    def test_completes_payload_in_place(self) -> None:
+        """Test a well-typed payload is completed without copying."""
+        raw = {"workStatus": "00", "catLitterWeight": 3}
+        result = parse_payload({"deviceInfo": raw}, "deviceInfo", LitterDeviceInfo)
+        assert result is raw
+        assert raw["catLitterWeight"] == 3.0
+        assert raw["currentError"] == ""
+        assert raw["deviceErrorList"] == []
+        assert raw["deviceErrorList"] is not LitterDeviceInfo.model_fields[
+            "deviceErrorList"
+        ].default
+
+    def test_invalid_payload_returns_raw_untouched(self) -> None:
+        """Test a payload pydantic rejects is returned as received."""
+        raw = {"deviceErrorList": [1]}
+        result = parse_payload({"deviceInfo": raw}, "deviceInfo", LitterDeviceInfo)
+        assert result == {"deviceErrorList": [1]}
+        assert parse_payload(
+            {"deviceInfo": "not a dict"}, "deviceInfo", LitterDeviceInfo, default={}
+        ) == {}
+
+    def test_parse_list_of_logs(self) -> None:
+        """Test log lists become dicts with every declared field."""
+        data = {"records": [{"time": "08:00", "event": "Clean", "weight": 4.2}]}
+        result = parse_payload(data, "records", LogEntry, [])
+        assert result == [
+            {
+                "time": "08:00",
+                "event": "Clean",
+                "weight": 4.2,
+                "firstSection": "",
+                "secondSection": "",
+                "errkey": "",
+            }
+        ]
+        assert parse_payload({}, "records", LogEntry, []) == []
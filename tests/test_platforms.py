@@ -41,6 +41,9 @@ def mock_coordinator():
         instance = mock.return_value
         instance.name = f"{DOMAIN}-86-13812345678-devices"
         instance.async_refresh = AsyncMock()
+        instance.async_restore_snapshot = AsyncMock(return_value=False)
+        instance.snapshot.async_save = AsyncMock()
+        instance.entry_devices.return_value = []
         instance.data = {}
         yield mock
 
@@ -0,0 +1,72 @@
+"""Tests for CatLink poll scheduler module."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from custom_components.catlink.modules.poll_scheduler import (
+    TIER_FAST,
+    TIER_NORMAL,
+    TIER_SLOW,
+    PollScheduler,
+)
+
+
+def _device(running=False, acted=False, offline=False, quiet=False) -> MagicMock:
+    """Return a mock device in the given state."""
+    dvc = MagicMock()
+    dvc.running = running
+    dvc.acted_within = MagicMock(return_value=acted)
+    dvc.offline = offline
+    dvc.in_quiet_hours = quiet
+    return dvc
+
+
+class TestPollScheduler:
+    """Tests for PollScheduler."""
+
+    def test_intervals_follow_configured_interval(self) -> None:
+        """Test tier intervals derive from the configured interval."""
+        scheduler = PollScheduler(timedelta(minutes=2))
+        assert scheduler.intervals[TIER_FAST] == timedelta(seconds=15)
+        assert scheduler.intervals[TIER_NORMAL] == timedelta(minutes=2)
+        assert scheduler.intervals[TIER_SLOW] == timedelta(minutes=10)
+
+    def test_tiers(self) -> None:
+        """Test the tier picked for each device state."""
+        tier = PollScheduler.tier
+        assert tier(_device()) == TIER_NORMAL
+        assert tier(_device(running=True)) == TIER_FAST
+        assert tier(_device(acted=True)) == TIER_FAST
+        assert tier(_device(offline=True)) == TIER_SLOW
+        assert tier(_device(quiet=True)) == TIER_SLOW
+        assert tier(_device(running=True, quiet=True)) == TIER_FAST
+
+    def test_due_and_schedule(self) -> None:
+        """Test a key is due again once its tier interval has passed."""
+        scheduler = PollScheduler(timedelta(minutes=1))
+        assert scheduler.due("dev", 100.0)
+        scheduler.schedule("dev", TIER_NORMAL, 100.0)
+        assert not scheduler.due("dev", 130.0)
+        assert scheduler.due("dev", 159.5)
+
+    def test_next_interval_is_clamped(self) -> None:
+        """Test the coordinator interval stays between fast and normal."""
+        scheduler = PollScheduler(timedelta(minutes=1))
+        assert scheduler.next_interval(0.0) == timedelta(minutes=1)
+        scheduler.schedule("fast", TIER_FAST, 0.0)
+        scheduler.schedule("slow", TIER_SLOW, 0.0)
+        assert scheduler.next_interval(0.0) == timedelta(seconds=15)
+        scheduler.forget("fast")
+        assert scheduler.next_interval(0.0) == timedelta(minutes=1)
+        assert scheduler.next_interval(1000.0) == timedelta(seconds=15)
+
+    def test_set_interval_pulls_in_late_polls(self) -> None:
+        """Test a shorter interval applies to polls already scheduled."""
+        scheduler = PollScheduler(timedelta(hours=1))
+        scheduler.schedule("dev1", TIER_NORMAL, 0)
+        scheduler.schedule("dev2", TIER_FAST, 0)
+        scheduler.set_interval(timedelta(seconds=30), 10)
+        assert scheduler.intervals[TIER_NORMAL] == timedelta(seconds=30)
+        assert scheduler.due("dev1", 40)
+        assert not scheduler.due("dev2", 10)
+        assert scheduler.due("dev2", 15)
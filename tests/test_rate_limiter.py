@@ -0,0 +1,86 @@
+"""Tests for CatLink request rate limiter module."""
+
+import asyncio
+import time
+
+from custom_components.catlink.modules.rate_limiter import RequestLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    async def test_burst_within_capacity_does_not_wait(self) -> None:
+        """Test acquisitions within capacity return immediately."""
+        bucket = TokenBucket(rate=5, capacity=3)
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        assert time.monotonic() - start < 0.05
+
+    async def test_acquire_waits_for_refill(self) -> None:
+        """Test acquisitions beyond capacity are paced by the rate."""
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        assert time.monotonic() - start >= 0.035
+
+    async def test_zero_rate_is_unlimited(self) -> None:
+        """Test a non-positive rate disables pacing."""
+        bucket = TokenBucket(rate=0)
+        for _ in range(100):
+            await bucket.acquire()
+
+
+class TestRequestLimiter:
+    """Tests for RequestLimiter."""
+
+    async def test_caps_concurrency_per_host(self) -> None:
+        """Test no more than max_concurrent slots are held at once."""
+        limiter = RequestLimiter(max_concurrent=2, rate=0)
+        active = 0
+        peak = 0
+
+        async def call():
+            nonlocal active, peak
+            async with limiter.slot("https://api.example.com/a"):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+        assert limiter.stats["requests"] == 6
+        assert limiter.stats["queued"] > 0
+        assert limiter.stats["wait_max"] > 0
+
+    async def test_hosts_are_limited_independently(self) -> None:
+        """Test each API host gets its own slots."""
+        limiter = RequestLimiter(max_concurrent=1, rate=0)
+        async with limiter.slot("https://a.example.com/x"):
+            async with asyncio.timeout(0.5):
+                async with limiter.slot("https://b.example.com/x") as wait:
+                    assert wait < 0.05
+
+    async def test_slot_released_on_error(self) -> None:
+        """Test a failing request frees its slot."""
+        limiter = RequestLimiter(max_concurrent=1, rate=0)
+        try:
+            async with limiter.slot("https://api.example.com/a"):
+                raise ValueError
+        except ValueError:
+            pass
+        async with asyncio.timeout(0.5):
+            async with limiter.slot("https://api.example.com/a"):
+                pass
+
+    async def test_configure_applies_to_new_requests(self) -> None:
+        """Test new limits take effect without waiting for held slots."""
+        limiter = RequestLimiter(max_concurrent=1, rate=0)
+        async with limiter.slot("https://api.example.com/a"):
+            limiter.configure(2, 0)
+            async with asyncio.timeout(0.5):
+                async with limiter.slot("https://api.example.com/a"):
+                    pass
+        assert limiter.max_concurrent == 2
@@ -0,0 +1,75 @@
+"""Tests for CatLink retry and circuit breaker module."""
+
+from unittest.mock import patch
+
+from custom_components.catlink.modules.resilience import CircuitBreaker, RetryPolicy
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+
+    def test_delay_is_capped_and_jittered(self) -> None:
+        """Test delays stay within the exponential envelope and the cap."""
+        policy = RetryPolicy(attempts=5, base_delay=1.0, max_delay=4.0)
+        for attempt, ceiling in enumerate([1.0, 2.0, 4.0, 4.0, 4.0]):
+            for _ in range(50):
+                assert 0 <= policy.delay(attempt) <= ceiling
+
+    def test_attempts_at_least_one(self) -> None:
+        """Test a policy always makes at least one attempt."""
+        assert RetryPolicy(attempts=0).attempts == 1
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold(self) -> None:
+        """Test the breaker opens after consecutive failures."""
+        breaker = CircuitBreaker("api", failure_threshold=3)
+        for _ in range(2):
+            breaker.record_failure()
+            assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+    def test_success_resets_failures(self) -> None:
+        """Test a success clears the failure count."""
+        breaker = CircuitBreaker("api", failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_single_probe(self) -> None:
+        """Test one probe goes out after the reset timeout."""
+        breaker = CircuitBreaker("api", failure_threshold=1, reset_timeout=30)
+        with patch(
+            "custom_components.catlink.modules.resilience.time.monotonic",
+            return_value=100.0,
+        ):
+            breaker.record_failure()
+        with patch(
+            "custom_components.catlink.modules.resilience.time.monotonic",
+            return_value=131.0,
+        ):
+            assert breaker.allow()
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert not breaker.allow()
+
+    def test_failed_probe_reopens(self) -> None:
+        """Test a failed half-open probe opens the breaker again."""
+        breaker = CircuitBreaker("api", failure_threshold=5, reset_timeout=0)
+        breaker.state = CircuitBreaker.OPEN
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_successful_probe_closes(self) -> None:
+        """Test a successful half-open probe closes the breaker."""
+        breaker = CircuitBreaker("api", failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow()
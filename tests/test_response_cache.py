@@ -0,0 +1,58 @@
+"""Tests for CatLink response cache module."""
+
+from unittest.mock import patch
+
+from custom_components.catlink.modules.response_cache import ResponseCache
+
+MONOTONIC = "custom_components.catlink.modules.response_cache.time.monotonic"
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_get_returns_fresh_entry(self) -> None:
+        """Test a cached response is returned before it expires."""
+        cache = ResponseCache()
+        with patch(MONOTONIC, return_value=100.0):
+            cache.set(("api", ()), {"returnCode": 0}, ttl=60)
+        with patch(MONOTONIC, return_value=159.0):
+            assert cache.get(("api", ())) == {"returnCode": 0}
+        assert cache.stats["hits"] == 1
+
+    def test_get_drops_expired_entry(self) -> None:
+        """Test an expired response is a miss and is removed."""
+        cache = ResponseCache()
+        with patch(MONOTONIC, return_value=100.0):
+            cache.set(("api", ()), {"returnCode": 0}, ttl=60)
+        with patch(MONOTONIC, return_value=160.0):
+            assert cache.get(("api", ())) is None
+        assert len(cache) == 0
+        assert cache.stats["misses"] == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the least recently used entry is evicted when full."""
+        cache = ResponseCache(max_entries=2)
+        cache.set(("a", ()), {"a": 1}, ttl=60)
+        cache.set(("b", ()), {"b": 1}, ttl=60)
+        cache.get(("a", ()))
+        cache.set(("c", ()), {"c": 1}, ttl=60)
+        assert cache.get(("b", ())) is None
+        assert cache.get(("a", ())) == {"a": 1}
+        assert cache.stats["evictions"] == 1
+
+    def test_invalidate_by_api_and_params(self) -> None:
+        """Test invalidation of one api and params or the whole api."""
+        cache = ResponseCache()
+        one = (("deviceId", "1"),)
+        two = (("deviceId", "2"),)
+        cache.set(("api", one), {}, ttl=60)
+        cache.set(("api", two), {}, ttl=60)
+        cache.set(("other", one), {}, ttl=60)
+
+        cache.invalidate("api", one)
+        assert cache.get(("api", one)) is None
+        assert cache.get(("api", two)) == {}
+
+        cache.invalidate("api")
+        assert cache.get(("api", two)) is None
+        assert cache.get(("other", one)) == {}
@@ -0,0 +1,74 @@
+"""Tests for CatLink services."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.catlink import async_setup
+from custom_components.catlink.const import DOMAIN
+from custom_components.catlink.services import SERVICE_GET_LOGS
+
+LOGS = [
+    {"time": "10:20", "event": "Pave"},
+    {"time": "10:10", "event": "Cat came"},
+    {"time": "10:00", "event": "Clean"},
+]
+
+
+@pytest.fixture
+async def device_id(hass: HomeAssistant) -> str:
+    """Set up the services and a device with logs, returning its registry id."""
+    await async_setup(hass, {})
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    dvc = MagicMock(type="SCOOPER", mac="AA:BB", logs=LOGS)
+    hass.data[DOMAIN]["devices"]["dev1"] = dvc
+    return (
+        dr.async_get(hass)
+        .async_get_or_create(
+            config_entry_id=entry.entry_id, identifiers={(DOMAIN, "SCOOPER_AA:BB")}
+        )
+        .id
+    )
+
+
+class TestGetLogsService:
+    """Tests for the get_logs service."""
+
+    async def test_get_logs(self, hass: HomeAssistant, device_id: str) -> None:
+        """Test the logs of a device are returned, optionally limited."""
+        result = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_LOGS,
+            {"device_id": device_id},
+            blocking=True,
+            return_response=True,
+        )
+        assert result == {"logs": LOGS}
+
+        result = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_LOGS,
+            {"device_id": device_id, "limit": 1},
+            blocking=True,
+            return_response=True,
+        )
+        assert result == {"logs": LOGS[:1]}
+
+    async def test_get_logs_unknown_device(
+        self, hass: HomeAssistant, device_id: str
+    ) -> None:
+        """Test an unknown device is rejected."""
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_GET_LOGS,
+                {"device_id": "missing"},
+                blocking=True,
+                return_response=True,
+            )
@@ -0,0 +1,109 @@
+"""Tests for CatLink device snapshot module."""
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.catlink.const import DOMAIN
+from custom_components.catlink.devices.registry import create_device
+from custom_components.catlink.modules.account import Account
+from custom_components.catlink.modules.devices_coordinator import DevicesCoordinator
+
+SCOOPER = {
+    "id": "dev1",
+    "mac": "AA:BB:CC:DD:EE:FF",
+    "model": "T-02",
+    "deviceName": "Scooper",
+    "deviceType": "SCOOPER",
+}
+CAT = {
+    "id": "cat-1",
+    "pet_id": "1",
+    "mac": "cat-1",
+    "model": "Cat",
+    "deviceName": "Tom",
+    "deviceType": "CAT",
+    "summary_simple": {"weight": 4.2},
+}
+
+
+@pytest.fixture
+def domain_data(hass: HomeAssistant) -> dict:
+    """Set up hass.data structure required by DevicesCoordinator."""
+    hass.data[DOMAIN] = {"config": {"devices": []}, "devices": {}, "add_entities": {}}
+    return hass.data[DOMAIN]
+
+
+def make_coordinator(hass: HomeAssistant, device_ids=None) -> DevicesCoordinator:
+    """Return a coordinator of a mocked account."""
+    account = MagicMock(spec=Account)
+    account.hass = hass
+    account.uid = "86-13812345678"
+    account.update_interval = __import__("datetime").timedelta(minutes=1)
+    account.get_config = MagicMock(side_effect=lambda key, default=None: default)
+    return DevicesCoordinator(account, "entry-1", device_ids=device_ids)
+
+
+class TestDeviceSnapshot:
+    """Tests for DeviceSnapshot and coordinator restore."""
+
+    async def test_save_and_restore(
+        self, hass: HomeAssistant, hass_storage: dict[str, Any], domain_data: dict
+    ) -> None:
+        """Test devices saved by one coordinator are restored by the next."""
+        coordinator = make_coordinator(hass)
+        for dat in (SCOOPER, CAT):
+            dvc = create_device(dat, coordinator)
+            domain_data["devices"][dvc.id] = dvc
+        domain_data["devices"]["dev1"].detail = {"workStatus": "00", "online": True}
+        domain_data["devices"]["dev1"].logs = [{"time": "08:00", "event": "Clean"}]
+        domain_data["devices"]["other"] = MagicMock(id="other")
+
+        await coordinator.snapshot.async_save()
+        stored = hass_storage["catlink.snapshot.entry-1"]["data"]["devices"]
+        assert [snap["data"]["id"] for snap in stored] == ["dev1", "cat-1"]
+
+        domain_data["devices"].clear()
+        reloaded = make_coordinator(hass)
+        assert await reloaded.async_restore_snapshot() is True
+
+        restored = domain_data["devices"]["dev1"]
+        assert restored.coordinator is reloaded
+        assert restored.detail == {"workStatus": "00", "online": True}
+        assert restored.logs == [{"time": "08:00", "event": "Clean"}]
+        assert len(restored._litter_weight_during_day) == 0
+        assert domain_data["devices"]["cat-1"].data["summary_simple"] == {"weight": 4.2}
+        assert reloaded.data is domain_data["devices"]
+
+    async def test_restore_respects_device_selection(
+        self, hass: HomeAssistant, hass_storage: dict[str, Any], domain_data: dict
+    ) -> None:
+        """Test deselected devices are not restored, cats always are."""
+        hass_storage["catlink.snapshot.entry-1"] = {
+            "version": 1,
+            "key": "catlink.snapshot.entry-1",
+            "data": {
+                "devices": [
+                    {"data": SCOOPER, "detail": {}, "logs": []},
+                    {"data": CAT},
+                    {"data": "garbage"},
+                ]
+            },
+        }
+        coordinator = make_coordinator(hass, device_ids=["dev2"])
+
+        assert await coordinator.async_restore_snapshot() is True
+        assert set(domain_data["devices"]) == {"cat-1"}
+
+    async def test_restore_without_snapshot(
+        self, hass: HomeAssistant, domain_data: dict
+    ) -> None:
+        """Test nothing is restored on first start."""
+        coordinator = make_coordinator(hass)
+
+        assert await coordinator.async_restore_snapshot() is False
+        assert coordinator.data is None
+        assert domain_data["devices"] == {}
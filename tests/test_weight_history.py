@@ -0,0 +1,101 @@
+"""Tests for CatLink litter weight history module."""
+
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.catlink.modules.weight_history import (
+    WeightHistory,
+    WeightSeries,
+)
+
+
+class TestWeightSeries:
+    """Tests for WeightSeries."""
+
+    def test_occupied_tracks_rises(self) -> None:
+        """Test occupancy follows rises between neighbouring samples."""
+        series = WeightSeries(capacity=3, window=float("inf"))
+        series.append(2.0, 0)
+        series.append(1.5, 1)
+        assert series.occupied is False
+        series.append(1.8, 2)
+        assert series.occupied is True
+        assert series.delta == 1.8 - 1.5
+
+    def test_evicting_oldest_drops_its_rise(self) -> None:
+        """Test a rise leaves the window with its older sample."""
+        series = WeightSeries(capacity=3, window=float("inf"))
+        for ts, value in enumerate([1.0, 2.0, 1.5, 1.0]):
+            series.append(value, ts)
+        assert list(series) == [2.0, 1.5, 1.0]
+        assert series.occupied is False
+
+    def test_expired_samples_are_pruned(self) -> None:
+        """Test samples older than the window are dropped."""
+        series = WeightSeries(capacity=10, window=60)
+        series.append(1.0, 0)
+        series.append(2.0, 10)
+        with patch(
+            "custom_components.catlink.modules.weight_history.time.time",
+            return_value=10,
+        ):
+            assert series.occupied is True
+        series.append(1.5, 100)
+        assert list(series) == [1.5]
+        assert series.occupied is False
+
+    def test_expired_rise_pruned_on_read(self) -> None:
+        """Test a rise older than the window is dropped without a new sample."""
+        series = WeightSeries(capacity=10, window=60)
+        series.append(1.0, 1000)
+        series.append(2.0, 1010)
+        with patch(
+            "custom_components.catlink.modules.weight_history.time.time",
+            return_value=1030,
+        ):
+            assert series.occupied is True
+        with patch(
+            "custom_components.catlink.modules.weight_history.time.time",
+            return_value=1065,
+        ):
+            assert series.occupied is False
+            assert list(series) == [2.0]
+
+    def test_restore_round_trip(self) -> None:
+        """Test stored samples restore into an equivalent series."""
+        series = WeightSeries(capacity=4, window=float("inf"))
+        for ts, value in enumerate([1.0, 1.2, 1.1]):
+            series.append(value, ts)
+        restored = WeightSeries(capacity=4, window=float("inf"))
+        restored.restore([*series.as_list(), ["bad"]])
+        assert list(restored) == list(series)
+        assert restored.occupied is True
+        assert restored[-1] == 1.1
+
+
+class TestWeightHistory:
+    """Tests for WeightHistory."""
+
+    async def test_save_and_restore(
+        self, hass: HomeAssistant, hass_storage: dict[str, Any]
+    ) -> None:
+        """Test series saved by one history are restored by the next."""
+        history = WeightHistory(hass, "entry-1")
+        await history.async_load()
+        series = WeightSeries(window=float("inf"))
+        history.attach("dev1", series)
+        series.append(1.0, 1)
+        series.append(1.4, 2)
+        await history.async_save()
+        assert hass_storage["catlink.weight_history.entry-1"]["data"] == {
+            "devices": {"dev1": [[1.0, 1.0], [2.0, 1.4]]}
+        }
+
+        reloaded = WeightHistory(hass, "entry-1")
+        await reloaded.async_load()
+        restored = WeightSeries(window=float("inf"))
+        reloaded.attach("dev1", restored)
+        assert list(restored) == [1.0, 1.4]
+        assert restored.occupied is True